@@ -0,0 +1,123 @@
+import asyncio
+import math
+from collections import Counter
+from typing import Dict, Optional
+from app.admission.database import DatabaseRateLimitBackend
+from app.admission.interface import RateLimitBackend, TokenBucket
+from app.admission.memory import InMemoryRateLimitBackend
+from app.core.config import settings
+from app.core.metrics import ADMISSION_IN_FLIGHT, ADMISSION_REJECTIONS
+
+CHUNK_UPLOADS = "chunk_uploads"
+FINISH = "finish"
+EXPORT = "export"
+MAX_RETRY_AFTER_SECONDS = 3600.0
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, route: str, reason: str, retry_after: float):
+        super().__init__(f"{route} rejected by {reason}, retry after {retry_after:.3f}s")
+        self.route = route
+        self.reason = reason
+        self.retry_after = min(retry_after, MAX_RETRY_AFTER_SECONDS)
+
+
+def default_buckets() -> Dict[str, TokenBucket]:
+    return {
+        CHUNK_UPLOADS: TokenBucket(settings.RATE_LIMIT_CHUNK_UPLOADS_BURST, settings.RATE_LIMIT_CHUNK_UPLOADS_PER_SECOND),
+        FINISH: TokenBucket(settings.RATE_LIMIT_FINISH_BURST, settings.RATE_LIMIT_FINISH_PER_MINUTE / 60),
+        EXPORT: TokenBucket(settings.RATE_LIMIT_EXPORT_BURST, settings.RATE_LIMIT_EXPORT_PER_MINUTE / 60),
+    }
+
+
+def default_concurrency() -> Dict[str, int]:
+    return {
+        CHUNK_UPLOADS: settings.MAX_CONCURRENT_CHUNK_UPLOADS,
+        FINISH: settings.MAX_CONCURRENT_FINISHES,
+    }
+
+
+def create_rate_limit_backend(backend: Optional[str] = None) -> RateLimitBackend:
+    backend = backend or settings.RATE_LIMIT_BACKEND
+    if backend == "memory":
+        return InMemoryRateLimitBackend()
+    if backend == "database":
+        return DatabaseRateLimitBackend()
+    raise ValueError(f"Unknown rate limit backend: {backend}")
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        backend: Optional[RateLimitBackend] = None,
+        buckets: Optional[Dict[str, TokenBucket]] = None,
+        concurrency: Optional[Dict[str, int]] = None,
+        retry_after: Optional[float] = None,
+        enabled: Optional[bool] = None
+    ):
+        self.backend = backend or create_rate_limit_backend()
+        self.buckets = buckets if buckets is not None else default_buckets()
+        self.concurrency = concurrency if concurrency is not None else default_concurrency()
+        self.retry_after = retry_after if retry_after is not None else settings.ADMISSION_RETRY_AFTER_SECONDS
+        self.enabled = enabled if enabled is not None else settings.ADMISSION_ENABLED
+        self.in_flight = Counter()
+    
+    async def rate_wait(self, route: str, user_id: str, cost: float = 1.0) -> float:
+        bucket = self.buckets.get(route)
+        if not self.enabled or bucket is None or cost <= 0:
+            return 0.0
+        return await self.backend.acquire(f"{route}:{user_id}", bucket, cost)
+    
+    def max_cost(self, route: str) -> float:
+        bucket = self.buckets.get(route)
+        return bucket.capacity if self.enabled and bucket is not None else math.inf
+    
+    async def charge(self, route: str, user_id: str, cost: float = 1.0, total: Optional[float] = None):
+        if (total if total is not None else cost) > self.max_cost(route):
+            self._reject(route, "too_large", 0.0)
+        wait = await self.rate_wait(route, user_id, cost)
+        if wait:
+            self._reject(route, "rate_limit", wait)
+    
+    def has_capacity(self, route: str) -> bool:
+        limit = self.concurrency.get(route, 0)
+        return not self.enabled or limit <= 0 or self.in_flight[route] < limit
+    
+    async def enter(self, route: str, user_id: str, cost: float = 1.0):
+        if not self.has_capacity(route):
+            self._reject(route, "concurrency", self.retry_after)
+        self._occupy(route)
+        try:
+            await self.charge(route, user_id, cost)
+        except BaseException:
+            self.release(route)
+            raise
+    
+    async def wait_to_enter(self, route: str, user_id: str):
+        while (wait := await self.rate_wait(route, user_id)):
+            await asyncio.sleep(min(wait, MAX_RETRY_AFTER_SECONDS))
+        while not self.has_capacity(route):
+            await asyncio.sleep(self.retry_after)
+        self._occupy(route)
+    
+    def release(self, route: str):
+        self.in_flight[route] -= 1
+        ADMISSION_IN_FLIGHT.labels(route).dec()
+    
+    def _occupy(self, route: str):
+        self.in_flight[route] += 1
+        ADMISSION_IN_FLIGHT.labels(route).inc()
+    
+    def _reject(self, route: str, reason: str, retry_after: float):
+        ADMISSION_REJECTIONS.labels(route, reason).inc()
+        raise AdmissionRejected(route, reason, retry_after)
+
+
+_admission_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    global _admission_controller
+    if _admission_controller is None:
+        _admission_controller = AdmissionController()
+    return _admission_controller
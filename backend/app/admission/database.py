@@ -0,0 +1,59 @@
+import asyncio
+import math
+import time
+from typing import Callable
+from sqlalchemy import case, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.admission.interface import TokenBucket
+from app.models import SessionLocal
+from app.models.rate_limit import RateLimitBucket
+
+BUCKETS = RateLimitBucket.__table__
+
+
+def refilled_tokens(bucket: TokenBucket, now_ms: int):
+    elapsed = case((BUCKETS.c.updated_ms < now_ms, now_ms - BUCKETS.c.updated_ms), else_=0)
+    tokens = BUCKETS.c.tokens + elapsed * (bucket.per_second / 1000)
+    return case((tokens > bucket.capacity, bucket.capacity), else_=tokens)
+
+
+def take_tokens(key: str, bucket: TokenBucket, cost: float, now_ms: int):
+    tokens = refilled_tokens(bucket, now_ms)
+    return update(BUCKETS).where(BUCKETS.c.bucket_key == key, tokens >= cost).ordered_values(
+        (BUCKETS.c.tokens, tokens - cost),
+        (BUCKETS.c.updated_ms, now_ms)
+    )
+
+
+class DatabaseRateLimitBackend:
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal, clock: Callable[[], float] = time.time):
+        self.session_factory = session_factory
+        self.clock = clock
+    
+    async def acquire(self, key: str, bucket: TokenBucket, cost: float = 1.0) -> float:
+        if cost > bucket.capacity:
+            return math.inf
+        return await asyncio.to_thread(self._acquire, key, bucket, cost)
+    
+    def _acquire(self, key: str, bucket: TokenBucket, cost: float) -> float:
+        now_ms = int(self.clock() * 1000)
+        db = self.session_factory()
+        try:
+            for _ in range(2):
+                if db.execute(take_tokens(key, bucket, cost, now_ms)).rowcount:
+                    db.commit()
+                    return 0.0
+                row = db.execute(select(BUCKETS.c.tokens, BUCKETS.c.updated_ms).where(BUCKETS.c.bucket_key == key)).first()
+                if row is not None:
+                    db.rollback()
+                    return max(bucket.wait_seconds(bucket.refill(row.tokens, (now_ms - row.updated_ms) / 1000), cost), 0.001)
+                try:
+                    db.execute(insert(BUCKETS).values(bucket_key=key, tokens=bucket.capacity - cost, updated_ms=now_ms))
+                    db.commit()
+                    return 0.0
+                except IntegrityError:
+                    db.rollback()
+            return bucket.wait_seconds(0.0, cost)
+        finally:
+            db.close()
@@ -0,0 +1,24 @@
+import math
+from dataclasses import dataclass
+from typing import Protocol
+
+
+@dataclass(frozen=True)
+class TokenBucket:
+    capacity: float
+    per_second: float
+    
+    def refill(self, tokens: float, elapsed: float) -> float:
+        return min(self.capacity, tokens + max(0.0, elapsed) * self.per_second)
+    
+    def wait_seconds(self, tokens: float, cost: float) -> float:
+        if cost > self.capacity:
+            return math.inf
+        if tokens >= cost:
+            return 0.0
+        return (cost - tokens) / self.per_second if self.per_second > 0 else math.inf
+
+
+class RateLimitBackend(Protocol):
+    async def acquire(self, key: str, bucket: TokenBucket, cost: float = 1.0) -> float:
+        ...
@@ -0,0 +1,30 @@
+import threading
+import time
+from typing import Callable, Dict, Tuple
+from app.admission.interface import TokenBucket
+
+MAX_KEYS = 100_000
+
+
+class InMemoryRateLimitBackend:
+    def __init__(self, clock: Callable[[], float] = time.monotonic, max_keys: int = MAX_KEYS):
+        self.clock = clock
+        self.max_keys = max_keys
+        self._buckets: Dict[str, Tuple[float, float, TokenBucket]] = {}
+        self._lock = threading.Lock()
+    
+    async def acquire(self, key: str, bucket: TokenBucket, cost: float = 1.0) -> float:
+        with self._lock:
+            now = self.clock()
+            tokens, updated, _ = self._buckets.get(key, (bucket.capacity, now, bucket))
+            tokens = bucket.refill(tokens, now - updated)
+            wait = bucket.wait_seconds(tokens, cost)
+            self._buckets[key] = (tokens if wait else tokens - cost, now, bucket)
+            if len(self._buckets) > self.max_keys:
+                self._prune(now)
+            return wait
+    
+    def _prune(self, now: float):
+        full = [key for key, (tokens, updated, bucket) in self._buckets.items() if bucket.refill(tokens, now - updated) >= bucket.capacity]
+        for key in full:
+            del self._buckets[key]
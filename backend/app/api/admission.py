@@ -0,0 +1,53 @@
+import math
+from typing import AsyncIterator, Callable
+from fastapi import Depends, HTTPException
+from app.admission.controller import AdmissionController, AdmissionRejected, get_admission_controller
+from app.core.security import get_current_user_id
+
+REJECTION_DETAILS = {
+    "rate_limit": "Rate limit exceeded",
+    "concurrency": "Too many concurrent requests",
+    "too_large": "Request exceeds the rate limit burst",
+}
+
+
+def rejection_error(rejected: AdmissionRejected) -> HTTPException:
+    if rejected.reason == "too_large":
+        return HTTPException(status_code=413, detail=REJECTION_DETAILS[rejected.reason])
+    return HTTPException(
+        status_code=429,
+        detail=REJECTION_DETAILS[rejected.reason],
+        headers={"Retry-After": str(max(1, math.ceil(rejected.retry_after)))}
+    )
+
+
+class Admission:
+    def __init__(self, controller: AdmissionController, route: str, user_id: str, cost: float = 1.0):
+        self.controller = controller
+        self.route = route
+        self.user_id = user_id
+        self.cost = cost
+    
+    async def charge(self, cost: float):
+        self.cost += cost
+        try:
+            await self.controller.charge(self.route, self.user_id, cost, total=self.cost)
+        except AdmissionRejected as e:
+            raise rejection_error(e) from e
+
+
+def admit(route: str) -> Callable[..., AsyncIterator[Admission]]:
+    async def dependency(
+        user_id: str = Depends(get_current_user_id),
+        controller: AdmissionController = Depends(get_admission_controller)
+    ) -> AsyncIterator[Admission]:
+        try:
+            await controller.enter(route, user_id)
+        except AdmissionRejected as e:
+            raise rejection_error(e) from e
+        try:
+            yield Admission(controller, route, user_id)
+        finally:
+            controller.release(route)
+    
+    return dependency
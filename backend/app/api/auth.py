@@ -1,9 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
-from app.models import get_db
-from app.repositories.user_repository import MySQLUserRepository
-from app.services.auth_service import oauth
+from app.repositories.dependencies import get_user_repository
+from app.repositories.interfaces import AsyncUserRepository
+from app.services.auth_service import get_oauth
 from app.core.security import create_access_token
 from app.core.config import settings
 
@@ -13,13 +12,13 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 @router.get("/google/login")
 async def google_login(request: Request):
     redirect_uri = request.url_for('google_callback')
-    return await oauth.google.authorize_redirect(request, redirect_uri)
+    return await get_oauth().google.authorize_redirect(request, redirect_uri)
 
 
 @router.get("/google/callback")
-async def google_callback(request: Request, db: Session = Depends(get_db)):
+async def google_callback(request: Request, user_repo: AsyncUserRepository = Depends(get_user_repository)):
     try:
-        token = await oauth.google.authorize_access_token(request)
+        token = await get_oauth().google.authorize_access_token(request)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Authentication failed: {str(e)}")
     
@@ -32,11 +31,10 @@ async def google_callback(request: Request, db: Session = Depends(get_db)):
     display_name = user_info.get('name', email)
     avatar_url = user_info.get('picture')
     
-    user_repo = MySQLUserRepository(db)
-    user = user_repo.get_user_by_google_id(google_id)
+    user = await user_repo.get_user_by_google_id(google_id)
     
     if not user:
-        user = user_repo.create_user(
+        user = await user_repo.create_user(
             google_id=google_id,
             email=email,
             display_name=display_name,
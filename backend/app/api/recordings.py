@@ -1,22 +1,45 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+import asyncio
+import logging
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Header, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import BinaryIO, Callable, List, Optional, Tuple
 from pydantic import BaseModel
-from app.models import get_db
-from app.repositories.recording_repository import MySQLRecordingRepository
+from app.admission.controller import CHUNK_UPLOADS, EXPORT, FINISH
+from app.api.admission import Admission, admit
+from app.api.conditional import etag_matches, not_modified, strong_etag
+from app.models.recording import RecordingChunk
+from app.models.transcription_job import TranscriptionJobStatus
+from app.repositories.chunk_ranges import IndexRange, index_ranges, missing_ranges
+from app.repositories.chunk_upsert import ChunkUpload
+from app.repositories.dependencies import get_export_session_factory, get_recording_repository, get_transcription_job_repository
+from app.repositories.interfaces import AsyncRecordingRepository, AsyncTranscriptionJobRepository
+from app.repositories.pagination import TEXT_FIELDS, decode_cursor, encode_cursor
+from app.core.config import settings
+from app.core.metrics import CHUNK_SIZE_BYTES, CHUNK_UPLOAD_BYTES
 from app.core.security import get_current_user_id
-from app.services.audio_service import AudioService
-from app.llm.requestyai_provider import RequestYaiProvider
+from app.search.index import get_search_index
+from app.search.interface import SearchIndex
+from app.services.audio_service import AudioService, ChunkTooLargeError
+from app.services.chunk_transcriber import ChunkTranscriber, get_chunk_transcriber, stitch_partials
+from app.services.export import accepts_gzip, export_ndjson
+from app.services.transcription_queue import TranscriptionQueue, get_transcription_queue
 
 router = APIRouter(prefix="/recordings", tags=["recordings"])
 
+logger = logging.getLogger(__name__)
+
 
 class RecordingResponse(BaseModel):
     id: str
     status: str
     created_at: str
-    transcription_text: str = None
-    notes: str = None
+    transcription_text: Optional[str] = None
+    notes: Optional[str] = None
+    incremental_transcription: bool = False
+    transcript_preview: Optional[str] = None
+    duration_seconds: Optional[float] = None
+    size_bytes: Optional[int] = None
     
     class Config:
         from_attributes = True
@@ -26,75 +49,282 @@ class NotesUpdate(BaseModel):
     notes: str
 
 
+class ChunkTranscriptResponse(BaseModel):
+    chunk_index: int
+    status: Optional[str] = None
+    text: Optional[str] = None
+
+
+class ChunkRangeResponse(BaseModel):
+    start: int
+    end: int
+
+
+class ReceivedChunksResponse(ChunkRangeResponse):
+    checksums: List[Optional[str]]
+
+
+class ChunkStatusResponse(BaseModel):
+    recording_id: str
+    status: str
+    received_count: int
+    received_bytes: int
+    next_chunk_index: int
+    received: List[ReceivedChunksResponse]
+    missing: List[ChunkRangeResponse]
+
+
+class PartialTranscriptResponse(BaseModel):
+    recording_id: str
+    text: str
+    chunks: List[ChunkTranscriptResponse]
+
+
+class SearchResultResponse(BaseModel):
+    recording_id: str
+    score: float
+    snippet: str
+
+
+class SearchResponse(BaseModel):
+    results: List[SearchResultResponse]
+    next_offset: Optional[int] = None
+
+
+class TranscriptionJobResponse(BaseModel):
+    id: str
+    recording_id: str
+    status: str
+    attempts: int
+    error: Optional[str] = None
+    transcription: Optional[str] = None
+
+
+JOB_POLL_INTERVAL_SECONDS = 0.5
+
+
 @router.post("", response_model=RecordingResponse)
 async def create_recording(
+    incremental: Optional[bool] = None,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    repo: AsyncRecordingRepository = Depends(get_recording_repository)
 ):
-    repo = MySQLRecordingRepository(db)
-    recording = repo.create_recording(user_id)
+    if incremental is None:
+        incremental = settings.INCREMENTAL_TRANSCRIPTION
+    recording = await repo.create_recording(user_id, incremental_transcription=incremental)
     return RecordingResponse(
         id=recording.id,
         status=recording.status.value,
         created_at=recording.created_at.isoformat(),
         transcription_text=recording.transcription_text,
-        notes=recording.notes
+        notes=recording.notes,
+        incremental_transcription=recording.incremental_transcription,
+        duration_seconds=recording.duration_seconds,
+        size_bytes=recording.size_bytes
     )
 
 
 @router.get("", response_model=List[RecordingResponse])
 async def list_recordings(
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    repo: AsyncRecordingRepository = Depends(get_recording_repository)
 ):
-    repo = MySQLRecordingRepository(db)
-    recordings = repo.list_recordings(user_id)
+    requested_fields = set(fields.split(",")) if fields else set()
+    if not requested_fields <= TEXT_FIELDS:
+        raise HTTPException(status_code=400, detail=f"fields must be a subset of {sorted(TEXT_FIELDS)}")
+    
+    try:
+        position = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    
+    version = await repo.get_list_version(user_id)
+    etag = strong_etag("recordings", user_id, version, limit, cursor, ",".join(sorted(requested_fields)))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    
+    recordings = await repo.list_recordings_page(user_id, limit + 1, position, requested_fields)
+    if len(recordings) > limit:
+        recordings = recordings[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(recordings[-1])
+    
     return [
         RecordingResponse(
             id=r.id,
             status=r.status.value,
             created_at=r.created_at.isoformat(),
-            transcription_text=r.transcription_text,
-            notes=r.notes
+            transcription_text=r.transcription_text if "transcription_text" in requested_fields else None,
+            notes=r.notes if "notes" in requested_fields else None,
+            incremental_transcription=r.incremental_transcription,
+            transcript_preview=r.transcript_preview,
+            duration_seconds=r.duration_seconds,
+            size_bytes=r.size_bytes
         )
         for r in recordings
     ]
 
 
+@router.get("/search", response_model=SearchResponse)
+async def search_recordings(
+    q: str = Query(..., min_length=1, max_length=256),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    user_id: str = Depends(get_current_user_id),
+    index: SearchIndex = Depends(get_search_index)
+):
+    hits = await asyncio.to_thread(index.search, user_id, q, limit + 1, offset)
+    return SearchResponse(
+        results=[
+            SearchResultResponse(recording_id=hit.recording_id, score=hit.score, snippet=hit.snippet)
+            for hit in hits[:limit]
+        ],
+        next_offset=offset + limit if len(hits) > limit else None
+    )
+
+
+@router.get("/export", dependencies=[Depends(admit(EXPORT))])
+async def export_recordings(
+    cursor: Optional[str] = None,
+    accept_encoding: Optional[str] = Header(None),
+    user_id: str = Depends(get_current_user_id),
+    session_factory: Callable[[], Session] = Depends(get_export_session_factory)
+):
+    try:
+        position = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    
+    compress = accepts_gzip(accept_encoding)
+    headers = {"Content-Disposition": 'attachment; filename="recordings.ndjson"', "Vary": "Accept-Encoding"}
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        export_ndjson(session_factory, user_id, position, compress),
+        media_type="application/x-ndjson",
+        headers=headers
+    )
+
+
 @router.get("/{recording_id}", response_model=RecordingResponse)
 async def get_recording(
     recording_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    repo: AsyncRecordingRepository = Depends(get_recording_repository)
 ):
-    repo = MySQLRecordingRepository(db)
-    recording = repo.get_recording(recording_id)
+    validator = await repo.get_recording_validator(recording_id)
     
-    if not recording:
+    if not validator:
         raise HTTPException(status_code=404, detail="Recording not found")
     
-    if recording.user_id != user_id:
+    if validator.user_id != user_id:
         raise HTTPException(status_code=403, detail="Access denied")
     
+    etag = strong_etag(recording_id, validator.updated_at, validator.version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    
+    recording = await repo.get_recording(recording_id)
+    if not recording:
+        raise HTTPException(status_code=404, detail="Recording not found")
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    
     return RecordingResponse(
         id=recording.id,
         status=recording.status.value,
         created_at=recording.created_at.isoformat(),
         transcription_text=recording.transcription_text,
-        notes=recording.notes
+        notes=recording.notes,
+        incremental_transcription=recording.incremental_transcription,
+        duration_seconds=recording.duration_seconds,
+        size_bytes=recording.size_bytes
     )
 
 
-@router.post("/{recording_id}/chunks")
+def chunk_ranges(ranges: List[IndexRange]) -> List[ChunkRangeResponse]:
+    return [ChunkRangeResponse(start=start, end=end) for start, end in ranges]
+
+
+@router.get("/{recording_id}/chunks", response_model=ChunkStatusResponse)
+async def get_chunk_status(
+    recording_id: str,
+    expected_chunks: Optional[int] = Query(None, ge=0),
+    user_id: str = Depends(get_current_user_id),
+    repo: AsyncRecordingRepository = Depends(get_recording_repository)
+):
+    recording = await repo.get_recording(recording_id)
+    
+    if not recording:
+        raise HTTPException(status_code=404, detail="Recording not found")
+    
+    if recording.user_id != user_id:
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    chunks = await repo.list_chunk_checksums(recording_id)
+    checksums = {chunk.chunk_index: chunk.checksum for chunk in chunks}
+    received = index_ranges(checksums)
+    
+    return ChunkStatusResponse(
+        recording_id=recording_id,
+        status=recording.status.value,
+        received_count=len(chunks),
+        received_bytes=sum(chunk.size_bytes or 0 for chunk in chunks),
+        next_chunk_index=received[-1][1] + 1 if received else 0,
+        received=[
+            ReceivedChunksResponse(start=start, end=end, checksums=[checksums[index] for index in range(start, end + 1)])
+            for start, end in received
+        ],
+        missing=chunk_ranges(missing_ranges(received, expected_chunks))
+    )
+
+
+@router.post("/{recording_id}/chunks", dependencies=[Depends(admit(CHUNK_UPLOADS))])
 async def upload_chunk(
     recording_id: str,
     chunk_index: int = Form(...),
     audio_chunk: UploadFile = File(...),
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    repo: AsyncRecordingRepository = Depends(get_recording_repository),
+    transcriber: ChunkTranscriber = Depends(get_chunk_transcriber)
+):
+    recording = await repo.get_recording(recording_id)
+    
+    if not recording:
+        raise HTTPException(status_code=404, detail="Recording not found")
+    
+    if recording.user_id != user_id:
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    stored = await store_chunks(repo, recording, [(chunk_index, audio_chunk)], transcriber)
+    
+    return {
+        "status": "success",
+        "chunk_index": chunk_index,
+        "checksum": stored[0].checksum,
+        "duration_seconds": stored[0].duration
+    }
+
+
+@router.post("/{recording_id}/chunks/batch")
+async def upload_chunk_batch(
+    recording_id: str,
+    chunk_indices: List[int] = Form(...),
+    audio_chunks: List[UploadFile] = File(...),
+    user_id: str = Depends(get_current_user_id),
+    repo: AsyncRecordingRepository = Depends(get_recording_repository),
+    transcriber: ChunkTranscriber = Depends(get_chunk_transcriber),
+    admission: Admission = Depends(admit(CHUNK_UPLOADS))
 ):
-    repo = MySQLRecordingRepository(db)
-    recording = repo.get_recording(recording_id)
+    recording = await repo.get_recording(recording_id)
     
     if not recording:
         raise HTTPException(status_code=404, detail="Recording not found")
@@ -102,23 +332,107 @@ async def upload_chunk(
     if recording.user_id != user_id:
         raise HTTPException(status_code=403, detail="Access denied")
     
+    if len(chunk_indices) != len(audio_chunks):
+        raise HTTPException(status_code=400, detail="chunk_indices and audio_chunks must have the same length")
+    
+    if len(set(chunk_indices)) != len(chunk_indices):
+        raise HTTPException(status_code=400, detail="chunk_indices must be unique")
+    
+    await admission.charge(len(chunk_indices) - 1)
+    
+    stored = await store_chunks(repo, recording, list(zip(chunk_indices, audio_chunks)), transcriber)
+    
+    return {
+        "status": "success",
+        "chunks": [
+            {"chunk_index": chunk.index, "checksum": chunk.checksum, "duration_seconds": chunk.duration}
+            for chunk in stored
+        ]
+    }
+
+
+async def store_chunks(
+    repo: AsyncRecordingRepository,
+    recording,
+    uploads: List[Tuple[int, UploadFile]],
+    transcriber: ChunkTranscriber
+) -> List[ChunkUpload]:
+    if any(upload.size is not None and upload.size > settings.MAX_CHUNK_SIZE_BYTES for _, upload in uploads):
+        raise HTTPException(status_code=413, detail="Audio chunk too large")
+    
+    try:
+        stored, chunks = await persist_chunks(repo, recording, [(chunk_index, upload.file) for chunk_index, upload in uploads])
+    except ChunkTooLargeError:
+        raise HTTPException(status_code=413, detail="Audio chunk too large")
+    
+    if recording.incremental_transcription:
+        for chunk in chunks:
+            transcriber.submit(chunk.id)
+    
+    return stored
+
+
+async def persist_chunks(
+    repo: AsyncRecordingRepository,
+    recording,
+    sources: List[Tuple[int, BinaryIO]]
+) -> Tuple[List[ChunkUpload], List[RecordingChunk]]:
     audio_service = AudioService()
-    chunk_data = await audio_chunk.read()
-    chunk_path = audio_service.save_chunk(recording_id, chunk_index, chunk_data)
+    stored = []
+    for chunk_index, source in sources:
+        saved = await asyncio.to_thread(audio_service.save_chunk_stream, recording.id, chunk_index, source)
+        stored.append(ChunkUpload(
+            index=chunk_index,
+            path=saved.path,
+            duration=saved.timeline.duration_seconds,
+            size_bytes=saved.size_bytes,
+            checksum=saved.checksum,
+            start_ms=saved.timeline.start_ms,
+            end_ms=saved.timeline.end_ms
+        ))
+        CHUNK_UPLOAD_BYTES.inc(saved.size_bytes)
+        CHUNK_SIZE_BYTES.observe(saved.size_bytes)
     
-    repo.add_chunk(recording_id, chunk_path, chunk_index, None)
+    chunks = await repo.add_chunks(recording.id, stored, transcribe=recording.incremental_transcription)
+    return stored, chunks
+
+
+@router.get("/{recording_id}/transcript/partial", response_model=PartialTranscriptResponse)
+async def get_partial_transcript(
+    recording_id: str,
+    user_id: str = Depends(get_current_user_id),
+    repo: AsyncRecordingRepository = Depends(get_recording_repository)
+):
+    recording = await repo.get_recording(recording_id)
+    
+    if not recording:
+        raise HTTPException(status_code=404, detail="Recording not found")
+    
+    if recording.user_id != user_id:
+        raise HTTPException(status_code=403, detail="Access denied")
     
-    return {"status": "success", "chunk_index": chunk_index}
+    chunks = await repo.list_chunks(recording_id)
+    return PartialTranscriptResponse(
+        recording_id=recording_id,
+        text=stitch_partials(chunks),
+        chunks=[
+            ChunkTranscriptResponse(
+                chunk_index=chunk.chunk_index,
+                status=chunk.transcription_status.value if chunk.transcription_status else None,
+                text=chunk.transcription_text
+            )
+            for chunk in chunks
+        ]
+    )
 
 
 @router.patch("/{recording_id}/pause")
 async def pause_recording(
     recording_id: str,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    repo: AsyncRecordingRepository = Depends(get_recording_repository)
 ):
-    repo = MySQLRecordingRepository(db)
-    recording = repo.get_recording(recording_id)
+    recording = await repo.get_recording(recording_id)
     
     if not recording:
         raise HTTPException(status_code=404, detail="Recording not found")
@@ -126,18 +440,21 @@ async def pause_recording(
     if recording.user_id != user_id:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    repo.mark_paused(recording_id)
+    await repo.mark_paused(recording_id)
     return {"status": "paused"}
 
 
-@router.post("/{recording_id}/finish")
+@router.post("/{recording_id}/finish", status_code=202, dependencies=[Depends(admit(FINISH))])
 async def finish_recording(
     recording_id: str,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    repo: AsyncRecordingRepository = Depends(get_recording_repository),
+    job_repo: AsyncTranscriptionJobRepository = Depends(get_transcription_job_repository),
+    queue: TranscriptionQueue = Depends(get_transcription_queue),
+    expected_chunks: Optional[int] = Query(None, ge=0),
+    allow_missing: bool = Query(False)
 ):
-    repo = MySQLRecordingRepository(db)
-    recording = repo.get_recording(recording_id)
+    recording = await repo.get_recording(recording_id)
     
     if not recording:
         raise HTTPException(status_code=404, detail="Recording not found")
@@ -145,19 +462,67 @@ async def finish_recording(
     if recording.user_id != user_id:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    chunk_paths = [chunk.audio_blob_path for chunk in sorted(recording.chunks, key=lambda c: c.chunk_index)]
+    job = await job_repo.get_active_job(recording_id)
+    missing: List[IndexRange] = []
     
-    audio_service = AudioService()
-    full_audio_path = audio_service.assemble_chunks(recording_id, chunk_paths)
+    if not job:
+        chunks = await repo.list_chunk_checksums(recording_id)
+        missing = missing_ranges(index_ranges(chunk.chunk_index for chunk in chunks), expected_chunks)
+        if missing and settings.FINISH_REJECT_MISSING_CHUNKS and not allow_missing:
+            raise HTTPException(
+                status_code=409,
+                detail={"message": "Recording is missing chunks", "missing": [span.model_dump() for span in chunk_ranges(missing)]}
+            )
+        if missing:
+            logger.warning("Finishing recording %s with missing chunks %s", recording_id, missing)
+        full_audio_path = AudioService().full_audio_path(recording_id)
+        job = await job_repo.create_job(recording_id, full_audio_path, settings.TRANSCRIPTION_MAX_ATTEMPTS)
+        queue.enqueue(job.id)
     
-    llm_provider = RequestYaiProvider()
-    transcription = llm_provider.transcribe_audio(full_audio_path)
+    return {"status": job.status.value, "job_id": job.id, "missing": chunk_ranges(missing)}
+
+
+@router.get("/{recording_id}/jobs/{job_id}", response_model=TranscriptionJobResponse)
+async def get_transcription_job(
+    recording_id: str,
+    job_id: str,
+    wait: float = Query(0, ge=0, le=60),
+    user_id: str = Depends(get_current_user_id),
+    repo: AsyncRecordingRepository = Depends(get_recording_repository),
+    job_repo: AsyncTranscriptionJobRepository = Depends(get_transcription_job_repository)
+):
+    recording = await repo.get_recording(recording_id)
     
-    repo.mark_ended(recording_id, full_audio_path, transcription)
+    if not recording:
+        raise HTTPException(status_code=404, detail="Recording not found")
     
-    audio_service.cleanup_chunks(chunk_paths)
+    if recording.user_id != user_id:
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    job = await job_repo.get_job(job_id)
+    
+    if not job or job.recording_id != recording_id:
+        raise HTTPException(status_code=404, detail="Transcription job not found")
     
-    return {"status": "completed", "transcription": transcription}
+    deadline = asyncio.get_running_loop().time() + wait
+    while job.status in (TranscriptionJobStatus.queued, TranscriptionJobStatus.running):
+        if asyncio.get_running_loop().time() >= deadline:
+            break
+        await asyncio.sleep(JOB_POLL_INTERVAL_SECONDS)
+        job = await job_repo.reload_job(job_id)
+    
+    transcription = None
+    if job.status == TranscriptionJobStatus.done:
+        transcription = await job_repo.get_transcription_text(recording_id)
+    
+    return TranscriptionJobResponse(
+        id=job.id,
+        recording_id=job.recording_id,
+        status=job.status.value,
+        attempts=job.attempts,
+        error=job.error,
+        transcription=transcription
+    )
 
 
 @router.patch("/{recording_id}/notes")
@@ -165,10 +530,9 @@ async def update_notes(
     recording_id: str,
     notes_data: NotesUpdate,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    repo: AsyncRecordingRepository = Depends(get_recording_repository)
 ):
-    repo = MySQLRecordingRepository(db)
-    recording = repo.get_recording(recording_id)
+    recording = await repo.get_recording(recording_id)
     
     if not recording:
         raise HTTPException(status_code=404, detail="Recording not found")
@@ -176,5 +540,5 @@ async def update_notes(
     if recording.user_id != user_id:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    repo.update_notes(recording_id, notes_data.notes)
+    await repo.update_notes(recording_id, notes_data.notes)
     return {"status": "success"}
@@ -0,0 +1,171 @@
+import asyncio
+import io
+import json
+import logging
+from typing import AsyncContextManager, Callable, Dict, Optional
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, WebSocketException, status
+from app.admission.controller import CHUNK_UPLOADS, AdmissionController, get_admission_controller
+from app.api.recordings import persist_chunks
+from app.core.config import settings
+from app.core.security import get_websocket_user_id
+from app.models.recording import ChunkTranscriptionStatus
+from app.repositories.dependencies import get_recording_repository_opener
+from app.repositories.interfaces import AsyncRecordingRepository
+from app.repositories.routing import get_read_your_writes_tracker
+from app.services.audio_service import ChunkTooLargeError
+from app.services.chunk_transcriber import ChunkTranscriber, get_chunk_transcriber
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/recordings", tags=["recordings"])
+
+RepositoryOpener = Callable[[], AsyncContextManager[AsyncRecordingRepository]]
+
+
+class ChunkStream:
+    def __init__(
+        self,
+        websocket: WebSocket,
+        recording,
+        user_id: str,
+        next_index: int,
+        partials: Dict[int, str],
+        open_repository: RepositoryOpener,
+        transcriber: ChunkTranscriber,
+        admission: AdmissionController
+    ):
+        self.websocket = websocket
+        self.recording = recording
+        self.user_id = user_id
+        self.next_index = next_index
+        self.partials = partials
+        self.open_repository = open_repository
+        self.transcriber = transcriber
+        self.admission = admission
+        self.chunks_received = 0
+        self.bytes_received = 0
+        self._outbox: asyncio.Queue = asyncio.Queue()
+    
+    async def run(self):
+        sender = asyncio.create_task(self._send_loop())
+        try:
+            self.push({
+                "type": "ready",
+                "recording_id": self.recording.id,
+                "next_chunk_index": self.next_index,
+                "window": settings.WEBSOCKET_MAX_UNACKED_CHUNKS,
+                "incremental_transcription": self.recording.incremental_transcription,
+            })
+            while True:
+                message = await self.websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                if message.get("bytes") is not None:
+                    await self._store_frame(message["bytes"])
+                elif message.get("text") is not None:
+                    await self._handle_control(message["text"])
+        finally:
+            sender.cancel()
+            await asyncio.gather(sender, return_exceptions=True)
+    
+    def push(self, payload: dict):
+        self._outbox.put_nowait(payload)
+    
+    async def _store_frame(self, data: bytes):
+        chunk_index = self.next_index
+        await self.admission.wait_to_enter(CHUNK_UPLOADS, self.user_id)
+        try:
+            async with self.open_repository() as repo:
+                stored, chunks = await persist_chunks(repo, self.recording, [(chunk_index, io.BytesIO(data))])
+        except ChunkTooLargeError:
+            self.push({"type": "error", "chunk_index": chunk_index, "detail": "Audio chunk too large"})
+            return
+        except Exception:
+            logger.exception("Failed to store chunk %d of recording %s", chunk_index, self.recording.id)
+            self.push({"type": "error", "chunk_index": chunk_index, "detail": "Failed to store audio chunk"})
+            return
+        finally:
+            self.admission.release(CHUNK_UPLOADS)
+        get_read_your_writes_tracker().record_write(self.user_id)
+        
+        self.next_index += 1
+        self.chunks_received += 1
+        self.bytes_received += stored[0].size_bytes
+        self.push({
+            "type": "ack",
+            "chunk_index": chunk_index,
+            "checksum": stored[0].checksum,
+            "size_bytes": stored[0].size_bytes,
+            "duration_seconds": stored[0].duration,
+            "chunks_received": self.chunks_received,
+            "bytes_received": self.bytes_received,
+        })
+        
+        if self.recording.incremental_transcription:
+            task = self.transcriber.submit(chunks[0].id)
+            task.add_done_callback(lambda done: self._push_partial(chunk_index, done))
+    
+    def _push_partial(self, chunk_index: int, task: asyncio.Task):
+        text = None if task.cancelled() or task.exception() else task.result()
+        if text is None:
+            self.push({"type": "partial", "chunk_index": chunk_index, "status": ChunkTranscriptionStatus.failed.value})
+            return
+        self.partials[chunk_index] = text.strip()
+        self.push({
+            "type": "partial",
+            "chunk_index": chunk_index,
+            "status": ChunkTranscriptionStatus.done.value,
+            "text": text,
+            "transcript": " ".join(self.partials[index] for index in sorted(self.partials) if self.partials[index]),
+        })
+    
+    async def _handle_control(self, text: str):
+        try:
+            command = json.loads(text).get("type")
+        except (ValueError, AttributeError):
+            command = None
+        if command == "pause":
+            async with self.open_repository() as repo:
+                await repo.mark_paused(self.recording.id)
+            get_read_your_writes_tracker().record_write(self.user_id)
+            self.push({"type": "status", "status": "paused", "next_chunk_index": self.next_index})
+        elif command == "ping":
+            self.push({"type": "pong", "next_chunk_index": self.next_index})
+        else:
+            self.push({"type": "error", "detail": "Unknown message"})
+    
+    async def _send_loop(self):
+        while True:
+            payload = await self._outbox.get()
+            try:
+                await self.websocket.send_json(payload)
+            except (WebSocketDisconnect, RuntimeError):
+                return
+
+
+@router.websocket("/{recording_id}/stream")
+async def stream_chunks(
+    websocket: WebSocket,
+    recording_id: str,
+    user_id: str = Depends(get_websocket_user_id),
+    open_repository: RepositoryOpener = Depends(get_recording_repository_opener),
+    transcriber: ChunkTranscriber = Depends(get_chunk_transcriber),
+    admission: AdmissionController = Depends(get_admission_controller)
+):
+    async with open_repository() as repo:
+        recording = await repo.get_recording(recording_id)
+        if not recording:
+            raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason="Recording not found")
+        if recording.user_id != user_id:
+            raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason="Access denied")
+        chunks = await repo.list_chunks(recording_id)
+    
+    partials = {
+        chunk.chunk_index: chunk.transcription_text.strip()
+        for chunk in chunks
+        if chunk.transcription_status == ChunkTranscriptionStatus.done and chunk.transcription_text
+    }
+    next_index = max((chunk.chunk_index for chunk in chunks), default=-1) + 1
+    
+    await websocket.accept()
+    await ChunkStream(websocket, recording, user_id, next_index, partials, open_repository, transcriber, admission).run()
@@ -1,5 +1,6 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, Optional
 
 
 class Settings(BaseSettings):
@@ -7,15 +8,116 @@ class Settings(BaseSettings):
     GOOGLE_CLIENT_SECRET: str
     LLM_API_KEY: str
     MYSQL_URL: str
+    ASYNC_MYSQL_URL: Optional[str] = None
+    MYSQL_REPLICA_URL: Optional[str] = None
+    ASYNC_MYSQL_REPLICA_URL: Optional[str] = None
+    DB_READ_YOUR_WRITES_SECONDS: float = 5.0
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_ASYNC: bool = False
+    SEARCH_BACKEND: str = "auto"
     AUDIO_STORAGE_PATH: str
+    AUDIO_STORAGE_BACKEND: str = "directory"
+    SEGMENT_FSYNC_MODE: str = "batch"
+    SEGMENT_FSYNC_BATCH_SIZE: int = 16
+    S3_ENDPOINT_URL: str = "https://s3.amazonaws.com"
+    S3_BUCKET: str = ""
+    S3_REGION: str = "us-east-1"
+    S3_ACCESS_KEY_ID: str = ""
+    S3_SECRET_ACCESS_KEY: str = ""
+    S3_PREFIX: str = "recordings"
+    S3_MIN_PART_SIZE_BYTES: int = 5 * 1024 * 1024
+    S3_MAX_CONNECTIONS: int = 10
+    S3_TIMEOUT_SECONDS: float = 60.0
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_MINUTES: int = 10080
     FRONTEND_URL: str = "http://localhost:3000"
+    MAX_CHUNK_SIZE_BYTES: int = 25 * 1024 * 1024
+    CHUNK_WRITE_BLOCK_SIZE: int = 64 * 1024
+    FINISH_REJECT_MISSING_CHUNKS: bool = True
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_RETRY_AFTER_SECONDS: float = 1.0
+    RATE_LIMIT_BACKEND: str = "memory"
+    RATE_LIMIT_CHUNK_UPLOADS_PER_SECOND: float = 10.0
+    RATE_LIMIT_CHUNK_UPLOADS_BURST: int = 100
+    RATE_LIMIT_FINISH_PER_MINUTE: float = 10.0
+    RATE_LIMIT_FINISH_BURST: int = 5
+    RATE_LIMIT_EXPORT_PER_MINUTE: float = 2.0
+    RATE_LIMIT_EXPORT_BURST: int = 3
+    MAX_CONCURRENT_CHUNK_UPLOADS: int = 64
+    MAX_CONCURRENT_FINISHES: int = 16
+    WEBSOCKET_MAX_UNACKED_CHUNKS: int = 4
+    TRANSCRIPTION_WORKERS: int = 2
+    TRANSCRIPTION_MAX_ATTEMPTS: int = 3
+    TRANSCRIPTION_RETRY_DELAY_SECONDS: float = 5.0
+    TRANSCRIPTION_STALE_JOB_MINUTES: int = 15
+    TRANSCRIPTION_HEARTBEAT_SECONDS: float = 60.0
+    TRANSCRIPTION_RECOVERY_INTERVAL_SECONDS: float = 60.0
+    INCREMENTAL_TRANSCRIPTION: bool = False
+    CHUNK_TRANSCRIPTION_CONCURRENCY: int = 4
+    CHUNK_TIMECODE_TOLERANCE_MS: int = 250
+    CHUNK_DEFAULT_DURATION_SECONDS: float = 10.0
+    TRANSCRIPTION_SEGMENT_SECONDS: float = 600.0
+    TRANSCRIPTION_SEGMENT_OVERLAP_SECONDS: float = 10.0
+    TRANSCRIPTION_SEGMENT_CONCURRENCY: int = 4
+    TRANSCRIPTION_SEGMENT_MAX_ATTEMPTS: int = 3
+    LLM_BASE_URL: str = "https://api.requestyai.com/v1"
+    LLM_TIMEOUT_SECONDS: float = 300.0
+    LLM_HTTP2: bool = False
+    LLM_MAX_CONNECTIONS: int = 20
+    LLM_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    LLM_MAX_IN_FLIGHT: int = 8
+    LLM_MAX_RETRIES: int = 3
+    LLM_RETRY_BACKOFF_SECONDS: float = 0.5
+    LLM_RETRY_MAX_BACKOFF_SECONDS: float = 30.0
+    LLM_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    LLM_CIRCUIT_RESET_SECONDS: float = 30.0
+    LLM_PROVIDERS: str = "requestyai"
+    LLM_PROVIDER_MAX_BYTES: Dict[str, int] = {}
+    LLM_HEDGE_ENABLED: bool = True
+    LLM_HEDGE_DEFAULT_DELAY_SECONDS: float = 0.0
+    LLM_HEDGE_MIN_DELAY_SECONDS: float = 2.0
+    LLM_ROUTING_MIN_SAMPLES: int = 20
+    LLM_ROUTING_MAX_ERROR_RATE: float = 0.5
+    LLM_ROUTING_STATS_WINDOW: int = 200
+    TRANSCRIPTION_CACHE_ENABLED: bool = True
+    TRANSCRIPTION_CACHE_MEMORY_ENTRIES: int = 256
+    TRANSCRIPTION_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+    TRANSCRIPTION_CACHE_TOUCH_INTERVAL_SECONDS: float = 60.0
+    EVENT_LOOP_LAG_INTERVAL_SECONDS: float = 0.5
+    EXPORT_BATCH_SIZE: int = 1000
+    EXPORT_BUFFER_BYTES: int = 64 * 1024
+    RETENTION_SWEEP_ENABLED: bool = True
+    RETENTION_SWEEP_INTERVAL_SECONDS: float = 3600.0
+    RETENTION_DAYS: Dict[str, float] = {"active": 30.0, "paused": 30.0}
+    RETENTION_BATCH_SIZE: int = 100
+    RETENTION_DELETES_PER_SECOND: float = 50.0
+    RETENTION_ORPHAN_GRACE_MINUTES: float = 60.0
+    RETENTION_DRY_RUN: bool = False
+    DB_AUTO_MIGRATE: bool = False
+    STARTUP_IMPORT_BUDGET_SECONDS: float = 2.0
+    STARTUP_FIRST_REQUEST_BUDGET_SECONDS: float = 1.0
     
     class Config:
         env_file = ".env"
         case_sensitive = True
 
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
+
+
+class LazySettings:
+    def __getattr__(self, name: str):
+        return getattr(get_settings(), name)
+    
+    def __setattr__(self, name: str, value):
+        setattr(get_settings(), name, value)
+
+
+settings = LazySettings()
@@ -0,0 +1,143 @@
+import asyncio
+import time
+from typing import Optional
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+from app.core.config import settings
+
+SIZE_BUCKETS = tuple(2 ** power for power in range(12, 27))
+DB_OPERATIONS = ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"]
+)
+CHUNK_UPLOAD_BYTES = Counter("chunk_upload_bytes_total", "Audio bytes received in chunk uploads")
+CHUNK_SIZE_BYTES = Histogram("chunk_size_bytes", "Size of uploaded audio chunks", buckets=SIZE_BUCKETS)
+ASSEMBLE_SECONDS = Histogram("assemble_chunks_duration_seconds", "Time spent assembling chunks into full audio", ["backend"])
+LLM_REQUEST_SECONDS = Histogram("llm_request_duration_seconds", "Latency of individual LLM provider calls", ["provider"])
+LLM_RESPONSES = Counter("llm_responses_total", "LLM provider responses by status code", ["provider", "status"])
+LLM_RETRIES = Counter("llm_retries_total", "LLM provider calls that were retried", ["provider"])
+LLM_HEDGES = Counter("llm_hedged_requests_total", "Hedged requests fired at a backup LLM provider", ["provider"])
+LLM_FALLBACKS = Counter("llm_fallbacks_total", "Requests that fell back to another LLM provider after a failure", ["provider"])
+DB_QUERY_SECONDS = Histogram(
+    "db_query_duration_seconds",
+    "Database statement execution time",
+    ["operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled database connection",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+)
+DB_POOL_CONNECTIONS = Gauge("db_pool_connections", "Pooled database connections by state", ["engine", "state"])
+RETENTION_FILES_DELETED = Counter("retention_deleted_files_total", "Stored audio files removed by the retention sweeper", ["reason"])
+RETENTION_BYTES_RECLAIMED = Counter("retention_reclaimed_bytes_total", "Storage bytes reclaimed by the retention sweeper", ["reason"])
+ADMISSION_REJECTIONS = Counter("admission_rejected_requests_total", "Requests refused with 429 by admission control", ["route", "reason"])
+ADMISSION_IN_FLIGHT = Gauge("admission_in_flight_requests", "Admitted requests currently running per limited route", ["route"])
+TRANSCRIPTION_QUEUE_DEPTH = Gauge("transcription_queue_depth", "Jobs waiting in the transcription queue")
+EVENT_LOOP_LAG_SECONDS = Histogram(
+    "event_loop_lag_seconds",
+    "Delay between a scheduled event loop wake-up and when it ran",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+
+
+def statement_operation(statement: str) -> str:
+    operation = statement.lstrip()[:6].upper()
+    return operation if operation in DB_OPERATIONS else "OTHER"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    DB_QUERY_SECONDS.labels(statement_operation(statement)).observe(elapsed)
+
+
+def _time_pool_checkouts(pool: Pool):
+    connect = pool.connect
+    
+    def timed_connect():
+        start = time.perf_counter()
+        try:
+            return connect()
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - start)
+    
+    pool.connect = timed_connect
+
+
+def _pool_reading(engine: Engine, method: str):
+    return lambda: getattr(engine.pool, method)() if hasattr(engine.pool, method) else 0
+
+
+def instrument_engine(engine: Engine, name: str = "primary"):
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "engine_disposed", lambda disposed: _time_pool_checkouts(disposed.pool))
+    _time_pool_checkouts(engine.pool)
+    for state, method in (("checked_out", "checkedout"), ("checked_in", "checkedin"), ("overflow", "overflow")):
+        DB_POOL_CONNECTIONS.labels(name, state).set_function(_pool_reading(engine, method))
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start = time.perf_counter()
+        status = 500
+        
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.labels(
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                str(status)
+            ).observe(time.perf_counter() - start)
+
+
+class EventLoopLagMonitor:
+    def __init__(self, interval: Optional[float] = None):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self):
+        if self.interval is None:
+            self.interval = settings.EVENT_LOOP_LAG_INTERVAL_SECONDS
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            EVENT_LOOP_LAG_SECONDS.observe(max(0.0, loop.time() - scheduled))
+
+
+event_loop_monitor = EventLoopLagMonitor()
@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
-from fastapi import HTTPException, Security
+from fastapi import HTTPException, Query, Security, WebSocket, WebSocketException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.core.config import settings
 
@@ -34,3 +34,16 @@ def get_current_user_id(credentials: HTTPAuthorizationCredentials = Security(sec
     if user_id is None:
         raise HTTPException(status_code=401, detail="Invalid authentication credentials")
     return user_id
+
+
+def get_websocket_user_id(websocket: WebSocket, token: Optional[str] = Query(None)) -> str:
+    if token is None:
+        scheme, _, credentials = websocket.headers.get("authorization", "").partition(" ")
+        token = credentials if scheme.lower() == "bearer" else None
+    try:
+        user_id = decode_access_token(token).get("sub") if token else None
+    except HTTPException:
+        user_id = None
+    if user_id is None:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason="Invalid authentication credentials")
+    return user_id
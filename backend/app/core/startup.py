@@ -0,0 +1,84 @@
+import logging
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.import_seconds: Optional[float] = None
+        self.lifespan_seconds: Optional[float] = None
+        self.first_request_seconds: Optional[float] = None
+        self.time_to_first_request_seconds: Optional[float] = None
+    
+    def mark_imported(self):
+        self.import_seconds = time.perf_counter() - self.started
+    
+    def mark_ready(self, lifespan_started: float):
+        self.lifespan_seconds = time.perf_counter() - lifespan_started
+        self._check("import", self.import_seconds, _budget("STARTUP_IMPORT_BUDGET_SECONDS"))
+    
+    def mark_first_request(self, request_started: float):
+        now = time.perf_counter()
+        self.first_request_seconds = now - request_started
+        self.time_to_first_request_seconds = now - self.started
+        self._check("first request", self.first_request_seconds, _budget("STARTUP_FIRST_REQUEST_BUDGET_SECONDS"))
+    
+    def report(self) -> dict:
+        import_budget = _budget("STARTUP_IMPORT_BUDGET_SECONDS")
+        first_request_budget = _budget("STARTUP_FIRST_REQUEST_BUDGET_SECONDS")
+        return {
+            "import_seconds": self.import_seconds,
+            "lifespan_seconds": self.lifespan_seconds,
+            "first_request_seconds": self.first_request_seconds,
+            "time_to_first_request_seconds": self.time_to_first_request_seconds,
+            "import_budget_seconds": import_budget,
+            "first_request_budget_seconds": first_request_budget,
+            "within_budget": _within(self.import_seconds, import_budget) and _within(self.first_request_seconds, first_request_budget),
+        }
+    
+    def _check(self, phase: str, seconds: Optional[float], budget: float):
+        if not _within(seconds, budget):
+            logger.warning("Startup %s took %.3fs, over the %.3fs budget", phase, seconds, budget)
+
+
+def _budget(name: str) -> float:
+    from app.core.config import settings
+    return getattr(settings, name)
+
+
+def _within(seconds: Optional[float], budget: float) -> bool:
+    return seconds is None or seconds <= budget
+
+
+class FirstRequestTimingMiddleware:
+    def __init__(self, app, timer: StartupTimer):
+        self.app = app
+        self.timer = timer
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self.timer.first_request_seconds is not None:
+            return await self.app(scope, receive, send)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if self.timer.first_request_seconds is None:
+                self.timer.mark_first_request(start)
+
+
+class LazyMiddleware:
+    def __init__(self, app, factory):
+        self.app = app
+        self.factory = factory
+        self._middleware = None
+    
+    async def __call__(self, scope, receive, send):
+        if self._middleware is None:
+            self._middleware = self.factory(self.app)
+        await self._middleware(scope, receive, send)
+
+
+startup_timer = StartupTimer()
@@ -1,6 +1,28 @@
-from typing import Protocol
+import asyncio
+import inspect
+from typing import BinaryIO, Callable, Protocol, Union
 
 
 class LLMProvider(Protocol):
     def transcribe_audio(self, audio_path: str) -> str:
         ...
+    
+    def transcribe_stream(self, stream: BinaryIO, filename: str) -> str:
+        ...
+
+
+class AsyncLLMProvider(Protocol):
+    async def transcribe_audio(self, audio_path: str) -> str:
+        ...
+    
+    async def transcribe_stream(self, stream: BinaryIO, filename: str) -> str:
+        ...
+
+
+AnyLLMProvider = Union[LLMProvider, AsyncLLMProvider]
+
+
+async def call_provider(method: Callable, *args) -> str:
+    if inspect.iscoroutinefunction(method):
+        return await method(*args)
+    return await asyncio.to_thread(method, *args)
@@ -0,0 +1,44 @@
+import asyncio
+import io
+import mimetypes
+import os
+from typing import AsyncIterator, BinaryIO, Dict, Optional, Tuple
+
+UPLOAD_BLOCK_BYTES = 1024 * 1024
+
+
+def stream_length(stream: BinaryIO) -> Optional[int]:
+    start = stream.tell()
+    try:
+        end = stream.seek(0, io.SEEK_END)
+    except (OSError, ValueError):
+        return None
+    stream.seek(start)
+    return end - start
+
+
+def multipart_file(stream: BinaryIO, filename: str, field: str = "file") -> Tuple[Dict[str, str], AsyncIterator[bytes]]:
+    boundary = os.urandom(16).hex()
+    content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    quoted = filename.replace("\\", "\\\\").replace('"', "%22")
+    head = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="{field}"; filename="{quoted}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode()
+    tail = f"\r\n--{boundary}--\r\n".encode()
+    headers = {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+    length = stream_length(stream)
+    if length is not None:
+        headers["Content-Length"] = str(len(head) + length + len(tail))
+    
+    async def body() -> AsyncIterator[bytes]:
+        yield head
+        while True:
+            block = await asyncio.to_thread(stream.read, UPLOAD_BLOCK_BYTES)
+            if not block:
+                break
+            yield block
+        yield tail
+    
+    return headers, body()
@@ -0,0 +1,249 @@
+import asyncio
+import io
+import logging
+import math
+import os
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import BinaryIO, Callable, Deque, Dict, List, Optional
+from app.core.config import settings
+from app.core.metrics import LLM_FALLBACKS, LLM_HEDGES
+from app.llm.interface import AnyLLMProvider, call_provider
+from app.llm.requestyai_async_provider import AsyncRequestYaiProvider
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+PROVIDER_FACTORIES: Dict[str, Callable[[], AnyLLMProvider]] = {
+    "requestyai": AsyncRequestYaiProvider,
+}
+
+
+def register_provider_factory(name: str, factory: Callable[[], AnyLLMProvider]):
+    PROVIDER_FACTORIES[name] = factory
+
+
+class NoProviderAvailableError(Exception):
+    pass
+
+
+class ProviderStats:
+    def __init__(self, window: int = 100):
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+    
+    def record_success(self, seconds: float, size_bytes: int):
+        self.latencies.append(seconds / max(size_bytes / MB, 1.0))
+        self.outcomes.append(True)
+    
+    def record_failure(self):
+        self.outcomes.append(False)
+    
+    @property
+    def samples(self) -> int:
+        return len(self.outcomes)
+    
+    @property
+    def error_rate(self) -> float:
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+    
+    def p95_seconds_per_mb(self) -> Optional[float]:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+
+
+@dataclass
+class ProviderEntry:
+    name: str
+    factory: Callable[[], AnyLLMProvider]
+    priority: int
+    max_bytes: Optional[int] = None
+    stats: ProviderStats = field(default_factory=ProviderStats)
+
+
+def stream_size(stream: BinaryIO) -> int:
+    position = stream.tell()
+    size = stream.seek(0, io.SEEK_END) - position
+    stream.seek(position)
+    return size
+
+
+class ProviderRouter:
+    def __init__(
+        self,
+        hedging: Optional[bool] = None,
+        hedge_default_delay: Optional[float] = None,
+        hedge_min_delay: Optional[float] = None,
+        min_samples: Optional[int] = None,
+        max_error_rate: Optional[float] = None,
+        stats_window: Optional[int] = None
+    ):
+        self.hedging = hedging if hedging is not None else settings.LLM_HEDGE_ENABLED
+        self.hedge_default_delay = hedge_default_delay if hedge_default_delay is not None else settings.LLM_HEDGE_DEFAULT_DELAY_SECONDS
+        self.hedge_min_delay = hedge_min_delay if hedge_min_delay is not None else settings.LLM_HEDGE_MIN_DELAY_SECONDS
+        self.min_samples = min_samples or settings.LLM_ROUTING_MIN_SAMPLES
+        self.max_error_rate = max_error_rate if max_error_rate is not None else settings.LLM_ROUTING_MAX_ERROR_RATE
+        self.stats_window = stats_window or settings.LLM_ROUTING_STATS_WINDOW
+        self.entries: List[ProviderEntry] = []
+    
+    def register(self, name: str, factory: Callable[[], AnyLLMProvider], max_bytes: Optional[int] = None) -> ProviderEntry:
+        entry = ProviderEntry(name, factory, len(self.entries), max_bytes, ProviderStats(self.stats_window))
+        self.entries.append(entry)
+        return entry
+    
+    @property
+    def name(self) -> str:
+        return "+".join(entry.name for entry in self.entries)
+    
+    @property
+    def version(self) -> str:
+        return "+".join(str(getattr(entry.factory, "version", "1")) for entry in self.entries)
+    
+    def session(self) -> "RoutedProvider":
+        return RoutedProvider(self)
+    
+    def is_healthy(self, entry: ProviderEntry) -> bool:
+        return entry.stats.samples < self.min_samples or entry.stats.error_rate <= self.max_error_rate
+    
+    def expected_seconds_per_mb(self, entry: ProviderEntry) -> float:
+        if entry.stats.samples < self.min_samples:
+            return math.inf
+        return entry.stats.p95_seconds_per_mb() or math.inf
+    
+    def rank(self, size_bytes: int) -> List[ProviderEntry]:
+        eligible = [entry for entry in self.entries if entry.max_bytes is None or size_bytes <= entry.max_bytes]
+        return sorted(eligible, key=lambda entry: (not self.is_healthy(entry), self.expected_seconds_per_mb(entry), entry.priority))
+    
+    def hedge_delay(self, entry: ProviderEntry, size_bytes: int) -> Optional[float]:
+        p95 = self.expected_seconds_per_mb(entry)
+        if math.isinf(p95):
+            return self.hedge_default_delay or None
+        return max(self.hedge_min_delay, p95 * max(size_bytes / MB, 1.0))
+    
+    async def transcribe_stream(self, stream: BinaryIO, filename: str, used: Optional[Counter] = None) -> str:
+        size = stream_size(stream)
+        candidates = iter(self.rank(size))
+        first = next(candidates, None)
+        if first is None:
+            raise NoProviderAvailableError(f"No LLM provider accepts {size} bytes")
+        
+        start = stream.tell()
+        can_hedge = self.hedging and callable(getattr(stream, "reopen", None))
+        hedged = False
+        extra_streams: List[BinaryIO] = []
+        pending: Dict[asyncio.Task, ProviderEntry] = {}
+        
+        def launch(entry: ProviderEntry, source: BinaryIO):
+            pending[asyncio.create_task(self._call(entry, source, filename, size))] = entry
+        
+        launch(first, stream)
+        deadline = self.hedge_delay(first, size) if can_hedge else None
+        started = time.monotonic()
+        last_error: Optional[BaseException] = None
+        try:
+            while pending:
+                timeout = None
+                if deadline is not None and not hedged:
+                    timeout = max(0.0, started + deadline - time.monotonic())
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    hedged = True
+                    entry = next(candidates, None)
+                    if entry is not None:
+                        LLM_HEDGES.labels(entry.name).inc()
+                        logger.info("Hedging %s after %.1fs with %s", filename, deadline, entry.name)
+                        extra_streams.append(stream.reopen())
+                        extra_streams[-1].seek(start)
+                        launch(entry, extra_streams[-1])
+                    continue
+                
+                for task in done:
+                    entry = pending.pop(task)
+                    if task.exception() is None:
+                        if used is not None:
+                            used[entry.name] += 1
+                        return task.result()
+                    last_error = task.exception()
+                    logger.warning("LLM provider %s failed on %s: %s", entry.name, filename, last_error)
+                
+                if not pending:
+                    entry = next(candidates, None)
+                    if entry is None:
+                        raise last_error
+                    LLM_FALLBACKS.labels(entry.name).inc()
+                    hedged = True
+                    stream.seek(start)
+                    launch(entry, stream)
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for extra in extra_streams:
+                extra.close()
+    
+    async def _call(self, entry: ProviderEntry, stream: BinaryIO, filename: str, size_bytes: int) -> str:
+        start = time.perf_counter()
+        try:
+            transcription = await call_provider(entry.factory().transcribe_stream, stream, filename)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            entry.stats.record_failure()
+            raise
+        entry.stats.record_success(time.perf_counter() - start, size_bytes)
+        return transcription
+
+
+class RoutedProvider:
+    def __init__(self, router: ProviderRouter):
+        self.router = router
+        self.used: Counter = Counter()
+    
+    @property
+    def name(self) -> str:
+        return self.router.name
+    
+    @property
+    def version(self) -> str:
+        return self.router.version
+    
+    async def transcribe_audio(self, audio_path: str) -> str:
+        with open(audio_path, "rb") as audio_file:
+            return await self.transcribe_stream(audio_file, os.path.basename(audio_path))
+    
+    async def transcribe_stream(self, stream: BinaryIO, filename: str) -> str:
+        return await self.router.transcribe_stream(stream, filename, self.used)
+
+
+def provider_used(provider: AnyLLMProvider) -> Optional[str]:
+    used = getattr(provider, "used", None)
+    if used is not None:
+        return used.most_common(1)[0][0] if used else None
+    return getattr(provider, "name", None)
+
+
+def create_provider_router() -> ProviderRouter:
+    router = ProviderRouter()
+    for name in filter(None, (name.strip() for name in settings.LLM_PROVIDERS.split(","))):
+        if name not in PROVIDER_FACTORIES:
+            raise ValueError(f"Unknown LLM provider: {name}")
+        router.register(name, PROVIDER_FACTORIES[name], settings.LLM_PROVIDER_MAX_BYTES.get(name))
+    return router
+
+
+_router: Optional[ProviderRouter] = None
+
+
+def get_provider_router() -> ProviderRouter:
+    global _router
+    if _router is None:
+        _router = create_provider_router()
+    return _router
+
+
+def create_provider() -> RoutedProvider:
+    return get_provider_router().session()
@@ -0,0 +1,124 @@
+import asyncio
+import os
+import time
+from typing import BinaryIO, Optional
+import httpx
+from app.core.config import settings
+from app.core.metrics import LLM_REQUEST_SECONDS, LLM_RESPONSES, LLM_RETRIES
+from app.llm.multipart import multipart_file
+from app.llm.resilience import CircuitBreaker, backoff_delay, is_retryable
+
+_client: Optional[httpx.AsyncClient] = None
+_semaphore: Optional[asyncio.Semaphore] = None
+_circuit_breaker: Optional[CircuitBreaker] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=settings.LLM_HTTP2,
+            timeout=settings.LLM_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=settings.LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS
+            )
+        )
+    return _client
+
+
+def get_request_semaphore() -> asyncio.Semaphore:
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(settings.LLM_MAX_IN_FLIGHT)
+    return _semaphore
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    global _circuit_breaker
+    if _circuit_breaker is None:
+        _circuit_breaker = CircuitBreaker(settings.LLM_CIRCUIT_FAILURE_THRESHOLD, settings.LLM_CIRCUIT_RESET_SECONDS)
+    return _circuit_breaker
+
+
+async def close_http_client():
+    global _client, _semaphore
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _semaphore = None
+
+
+class AsyncRequestYaiProvider:
+    name = "requestyai"
+    version = "v1"
+    
+    def __init__(
+        self,
+        api_key: str = None,
+        base_url: str = None,
+        client: Optional[httpx.AsyncClient] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        max_retries: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        backoff_max: Optional[float] = None
+    ):
+        self.api_key = api_key or settings.LLM_API_KEY
+        self.base_url = base_url or settings.LLM_BASE_URL
+        self.client = client or get_http_client()
+        self.semaphore = semaphore or get_request_semaphore()
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker()
+        self.max_retries = max_retries if max_retries is not None else settings.LLM_MAX_RETRIES
+        self.backoff_base = backoff_base if backoff_base is not None else settings.LLM_RETRY_BACKOFF_SECONDS
+        self.backoff_max = backoff_max if backoff_max is not None else settings.LLM_RETRY_MAX_BACKOFF_SECONDS
+    
+    async def transcribe_audio(self, audio_path: str) -> str:
+        with open(audio_path, "rb") as audio_file:
+            return await self._transcribe(audio_file, os.path.basename(audio_path))
+    
+    async def transcribe_stream(self, stream: BinaryIO, filename: str) -> str:
+        return await self._transcribe(stream, filename)
+    
+    async def _transcribe(self, stream: BinaryIO, filename: str) -> str:
+        start = stream.tell()
+        attempt = 0
+        while True:
+            self.circuit_breaker.before_call()
+            response = None
+            try:
+                stream.seek(start)
+                async with self.semaphore:
+                    response = await self._post(stream, filename)
+            except httpx.TransportError:
+                self.circuit_breaker.record_failure()
+                if attempt >= self.max_retries:
+                    raise
+            else:
+                if not is_retryable(response):
+                    self.circuit_breaker.record_success()
+                    response.raise_for_status()
+                    return response.json().get("transcription", "")
+                self.circuit_breaker.record_failure()
+                if attempt >= self.max_retries:
+                    response.raise_for_status()
+            
+            LLM_RETRIES.labels(self.name).inc()
+            await asyncio.sleep(backoff_delay(attempt, self.backoff_base, self.backoff_max, response))
+            attempt += 1
+    
+    async def _post(self, stream: BinaryIO, filename: str) -> httpx.Response:
+        start = time.perf_counter()
+        status = "error"
+        try:
+            headers, body = multipart_file(stream, filename)
+            response = await self.client.post(
+                f"{self.base_url}/transcribe",
+                content=body,
+                headers={**headers, "Authorization": f"Bearer {self.api_key}"}
+            )
+            status = str(response.status_code)
+            return response
+        finally:
+            LLM_REQUEST_SECONDS.labels(self.name).observe(time.perf_counter() - start)
+            LLM_RESPONSES.labels(self.name, status).inc()
@@ -1,23 +1,34 @@
+import os
+from typing import BinaryIO
 import httpx
 from app.core.config import settings
 
 
 class RequestYaiProvider:
+    name = "requestyai"
+    version = "v1"
+    
     def __init__(self, api_key: str = None):
         self.api_key = api_key or settings.LLM_API_KEY
-        self.base_url = "https://api.requestyai.com/v1"
+        self.base_url = settings.LLM_BASE_URL
     
     def transcribe_audio(self, audio_path: str) -> str:
         with open(audio_path, "rb") as audio_file:
-            files = {"file": audio_file}
-            headers = {"Authorization": f"Bearer {self.api_key}"}
-            
-            with httpx.Client(timeout=300.0) as client:
-                response = client.post(
-                    f"{self.base_url}/transcribe",
-                    files=files,
-                    headers=headers
-                )
-                response.raise_for_status()
-                result = response.json()
-                return result.get("transcription", "")
+            return self._transcribe(audio_file, os.path.basename(audio_path), timeout=settings.LLM_TIMEOUT_SECONDS)
+    
+    def transcribe_stream(self, stream: BinaryIO, filename: str) -> str:
+        return self._transcribe(stream, filename, timeout=settings.LLM_TIMEOUT_SECONDS)
+    
+    def _transcribe(self, stream: BinaryIO, filename: str, timeout: float) -> str:
+        files = {"file": (filename, stream)}
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        
+        with httpx.Client(timeout=timeout) as client:
+            response = client.post(
+                f"{self.base_url}/transcribe",
+                files=files,
+                headers=headers
+            )
+            response.raise_for_status()
+            result = response.json()
+            return result.get("transcription", "")
@@ -1,26 +1,71 @@
-from fastapi import FastAPI
+from app.core.startup import FirstRequestTimingMiddleware, LazyMiddleware, startup_timer
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from starlette.middleware.sessions import SessionMiddleware
-from app.api import auth, recordings
-from app.core.config import settings
-from app.models import Base, engine
+from app.api import auth, recordings, streaming
+from app.core.config import get_settings, settings
+from app.core.metrics import MetricsMiddleware, event_loop_monitor
+from app.llm.requestyai_async_provider import close_http_client, get_http_client
+from app.models import get_engine, pool_stats
+from app.models.schema import upgrade_database
+from app.repositories.routing import LAST_WRITE_HEADER
+from app.search.index import warm_search_index
+from app.services.auth_service import get_oauth
+from app.services.chunk_transcriber import get_chunk_transcriber
+from app.services.retention import get_retention_sweeper
+from app.services.transcription_cache import get_transcription_cache
+from app.services.transcription_queue import get_transcription_queue
+from app.storage.s3 import close_s3_http_client
 
-Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title="Audio Transcription Service")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    started = time.perf_counter()
+    get_settings()
+    get_engine()
+    get_oauth()
+    get_http_client()
+    if settings.DB_AUTO_MIGRATE:
+        await asyncio.to_thread(upgrade_database)
+    await asyncio.to_thread(warm_search_index)
+    await get_transcription_queue().start()
+    event_loop_monitor.start()
+    if settings.RETENTION_SWEEP_ENABLED:
+        get_retention_sweeper().start()
+    startup_timer.mark_ready(started)
+    yield
+    await event_loop_monitor.stop()
+    await get_retention_sweeper().stop()
+    await get_transcription_queue().stop()
+    await get_chunk_transcriber().stop()
+    await close_http_client()
+    close_s3_http_client()
 
-app.add_middleware(SessionMiddleware, secret_key=settings.JWT_SECRET)
 
-app.add_middleware(
-    CORSMiddleware,
+app = FastAPI(title="Audio Transcription Service", lifespan=lifespan)
+
+app.add_middleware(LazyMiddleware, factory=lambda inner: SessionMiddleware(inner, secret_key=settings.JWT_SECRET))
+
+app.add_middleware(LazyMiddleware, factory=lambda inner: CORSMiddleware(
+    inner,
     allow_origins=[settings.FRONTEND_URL],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-)
+    expose_headers=["X-Next-Cursor", LAST_WRITE_HEADER],
+))
+
+app.add_middleware(MetricsMiddleware)
+
+app.add_middleware(FirstRequestTimingMiddleware, timer=startup_timer)
 
 app.include_router(auth.router)
 app.include_router(recordings.router)
+app.include_router(streaming.router)
 
 
 @app.get("/")
@@ -31,3 +76,26 @@ async def root():
 @app.get("/health")
 async def health():
     return {"status": "healthy", "service": "scribe-crush"}
+
+
+@app.get("/health/startup")
+async def startup_stats():
+    return startup_timer.report()
+
+
+@app.get("/health/db-pool")
+async def db_pool_stats():
+    return pool_stats()
+
+
+@app.get("/health/transcription-cache")
+async def transcription_cache_stats():
+    return get_transcription_cache().stats()
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+startup_timer.mark_imported()
@@ -1,12 +1,123 @@
+from typing import Dict, Optional
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from app.core.config import settings
+from app.core.metrics import instrument_engine
+
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+}
 
-engine = create_engine(settings.MYSQL_URL, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+_engines: Dict[str, Engine] = {}
+_session_factories: Dict[str, sessionmaker] = {}
+_async_engines: Dict[str, AsyncEngine] = {}
+_async_session_factories: Dict[str, async_sessionmaker] = {}
+
+
+def to_async_url(url: str) -> str:
+    parsed = make_url(url)
+    return parsed.set(drivername=ASYNC_DRIVERS[parsed.get_backend_name()]).render_as_string(hide_password=False)
+
+
+def engine_options(url: str) -> dict:
+    options = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+    }
+    if make_url(url).get_backend_name() != "sqlite":
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        )
+    return options
+
+
+def _engine(name: str, url: str) -> Engine:
+    if name not in _engines:
+        _engines[name] = create_engine(url, **engine_options(url))
+        instrument_engine(_engines[name], name)
+    return _engines[name]
+
+
+def _async_engine(name: str, url: str) -> AsyncEngine:
+    if name not in _async_engines:
+        _async_engines[name] = create_async_engine(url, **engine_options(url))
+        instrument_engine(_async_engines[name].sync_engine, f"async_{name}")
+    return _async_engines[name]
+
+
+def get_engine() -> Engine:
+    return _engine("primary", settings.MYSQL_URL)
+
+
+def get_replica_engine() -> Optional[Engine]:
+    if not settings.MYSQL_REPLICA_URL:
+        return None
+    return _engine("replica", settings.MYSQL_REPLICA_URL)
+
+
+def get_session_factory() -> sessionmaker:
+    if "primary" not in _session_factories:
+        _session_factories["primary"] = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+    return _session_factories["primary"]
+
+
+def get_replica_session_factory() -> Optional[sessionmaker]:
+    if "replica" not in _session_factories:
+        engine = get_replica_engine()
+        if engine is None:
+            return None
+        _session_factories["replica"] = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    return _session_factories["replica"]
+
+
+def SessionLocal() -> Session:
+    return get_session_factory()()
+
+
+def get_async_engine() -> AsyncEngine:
+    return _async_engine("primary", settings.ASYNC_MYSQL_URL or to_async_url(settings.MYSQL_URL))
+
+
+def get_async_replica_engine() -> Optional[AsyncEngine]:
+    if not (settings.ASYNC_MYSQL_REPLICA_URL or settings.MYSQL_REPLICA_URL):
+        return None
+    return _async_engine("replica", settings.ASYNC_MYSQL_REPLICA_URL or to_async_url(settings.MYSQL_REPLICA_URL))
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    if "primary" not in _async_session_factories:
+        _async_session_factories["primary"] = async_sessionmaker(get_async_engine(), autoflush=False, expire_on_commit=False)
+    return _async_session_factories["primary"]
+
+
+def get_async_replica_session_factory() -> Optional[async_sessionmaker]:
+    if "replica" not in _async_session_factories:
+        engine = get_async_replica_engine()
+        if engine is None:
+            return None
+        _async_session_factories["replica"] = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+    return _async_session_factories["replica"]
+
+
+def pool_stats() -> Dict[str, dict]:
+    engines = {**_engines, **{f"async_{name}": engine.sync_engine for name, engine in _async_engines.items()}}
+    stats = {}
+    for name, engine in engines.items():
+        pool = engine.pool
+        stats[name] = {"pool": type(pool).__name__, "status": pool.status()}
+        for field, method in (("size", "size"), ("checked_in", "checkedin"), ("checked_out", "checkedout"), ("overflow", "overflow")):
+            if hasattr(pool, method):
+                stats[name][field] = getattr(pool, method)()
+    return stats
+
 
 def get_db():
     db = SessionLocal()
@@ -14,3 +125,20 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_replica_db():
+    factory = get_replica_session_factory()
+    if factory is None:
+        yield None
+        return
+    db = factory()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    async with get_async_session_factory()() as db:
+        yield db
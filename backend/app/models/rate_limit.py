@@ -0,0 +1,10 @@
+from sqlalchemy import BigInteger, Column, Double, String
+from app.models import Base
+
+
+class RateLimitBucket(Base):
+    __tablename__ = "rate_limit_buckets"
+
+    bucket_key = Column(String(191), primary_key=True)
+    tokens = Column(Double, nullable=False)
+    updated_ms = Column(BigInteger, nullable=False)
@@ -1,31 +1,57 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, Text, Float, Integer
-from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy import BigInteger, Column, String, DateTime, ForeignKey, Enum, Text, Float, Integer, Boolean, Index, UniqueConstraint
+from sqlalchemy.sql import func, text
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import relationship, query_expression
 import enum
 from app.models import Base
 import uuid
 
 
+Timestamp = DateTime(timezone=True).with_variant(
+    sqlite.DATETIME(storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"),
+    "sqlite"
+)
+
+
 class RecordingStatus(str, enum.Enum):
     active = "active"
     paused = "paused"
     ended = "ended"
 
 
+class ChunkTranscriptionStatus(str, enum.Enum):
+    pending = "pending"
+    done = "done"
+    failed = "failed"
+
+
 class Recording(Base):
     __tablename__ = "recordings"
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
     status = Column(Enum(RecordingStatus), default=RecordingStatus.active, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at = Column(Timestamp, server_default=func.now())
+    updated_at = Column(Timestamp, server_default=func.now(), onupdate=func.now())
     audio_file_path = Column(String(512))
     transcription_text = Column(Text)
     llm_provider = Column(String(50), default="requestyai")
     notes = Column(Text)
+    incremental_transcription = Column(Boolean, default=False, nullable=False)
+    duration_seconds = Column(Float)
+    size_bytes = Column(BigInteger)
+    timecode_gaps = Column(Integer, default=0, server_default="0", nullable=False)
+    timecode_overlaps = Column(Integer, default=0, server_default="0", nullable=False)
+    chunks_missing_timecodes = Column(Integer, default=0, server_default="0", nullable=False)
+    version = Column(Integer, default=0, server_default="0", onupdate=text("version + 1"), nullable=False)
+    transcript_preview = query_expression()
     
     chunks = relationship("RecordingChunk", back_populates="recording", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        Index("ix_recordings_user_created_id", "user_id", "created_at", "id"),
+        Index("ft_recordings_text", "transcription_text", "notes", mysql_prefix="FULLTEXT").ddl_if(dialect="mysql"),
+    )
 
 
 class RecordingChunk(Base):
@@ -36,6 +62,17 @@ class RecordingChunk(Base):
     chunk_index = Column(Integer, nullable=False)
     audio_blob_path = Column(String(512), nullable=False)
     duration_seconds = Column(Float)
+    size_bytes = Column(Integer)
+    checksum = Column(String(64))
+    start_timecode_ms = Column(BigInteger)
+    end_timecode_ms = Column(BigInteger)
+    timecode_gap_ms = Column(BigInteger)
     uploaded_at = Column(DateTime(timezone=True), server_default=func.now())
+    transcription_status = Column(Enum(ChunkTranscriptionStatus))
+    transcription_text = Column(Text)
     
     recording = relationship("Recording", back_populates="chunks")
+    
+    __table_args__ = (
+        UniqueConstraint("recording_id", "chunk_index", name="uq_recording_chunks_recording_index"),
+    )
@@ -0,0 +1,38 @@
+from pathlib import Path
+from typing import Optional
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+MYSQL_ONLY_INDEXES = {"ft_recordings_text"}
+BASELINE_REVISION = "0001"
+BASELINE_TABLES = {"users", "recordings", "recording_chunks"}
+
+
+def object_filter(dialect_name: str):
+    def include_object(obj, name, type_, reflected, compare_to) -> bool:
+        return dialect_name == "mysql" or not (type_ == "index" and name in MYSQL_ONLY_INDEXES)
+    return include_object
+
+
+def adopt_baseline(context: MigrationContext, script: ScriptDirectory):
+    tables = set(inspect(context.connection).get_table_names())
+    if BASELINE_TABLES <= tables and context.get_current_revision() is None:
+        context.stamp(script, BASELINE_REVISION)
+
+
+def alembic_config(connection: Optional[Connection] = None) -> Config:
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "migrations"))
+    config.attributes["configure_logging"] = False
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+def upgrade_database(revision: str = "head", connection: Optional[Connection] = None):
+    command.upgrade(alembic_config(connection), revision)
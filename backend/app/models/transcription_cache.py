@@ -0,0 +1,16 @@
+from sqlalchemy import Column, String, DateTime, Text, Integer
+from sqlalchemy.sql import func
+from app.models import Base
+
+
+class TranscriptionCacheEntry(Base):
+    __tablename__ = "transcription_cache"
+
+    cache_key = Column(String(191), primary_key=True)
+    content_hash = Column(String(64), nullable=False)
+    provider = Column(String(50), nullable=False)
+    provider_version = Column(String(50), nullable=False)
+    transcription = Column(Text, nullable=False)
+    size_bytes = Column(Integer, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_accessed_at = Column(DateTime(timezone=True), nullable=False, index=True)
@@ -0,0 +1,31 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, Text, Integer
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+import enum
+from app.models import Base
+import uuid
+
+
+class TranscriptionJobStatus(str, enum.Enum):
+    queued = "queued"
+    running = "running"
+    done = "done"
+    failed = "failed"
+
+
+class TranscriptionJob(Base):
+    __tablename__ = "transcription_jobs"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    recording_id = Column(String(36), ForeignKey("recordings.id"), nullable=False, index=True)
+    status = Column(Enum(TranscriptionJobStatus), default=TranscriptionJobStatus.queued, nullable=False, index=True)
+    audio_path = Column(String(512), nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    max_attempts = Column(Integer, default=3, nullable=False)
+    error = Column(Text)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+    
+    recording = relationship("Recording")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Integer
 from sqlalchemy.sql import func
 from app.models import Base
 import uuid
@@ -12,5 +12,6 @@ class User(Base):
     email = Column(String(255), nullable=False)
     display_name = Column(String(255), nullable=False)
     avatar_url = Column(String(512))
+    recordings_version = Column(Integer, default=0, server_default="0", nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
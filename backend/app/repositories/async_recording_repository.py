@@ -0,0 +1,144 @@
+from typing import Iterable, List, Optional
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.models.recording import Recording, RecordingChunk, RecordingStatus, ChunkTranscriptionStatus
+from app.repositories.chunk_ranges import ChunkChecksum, chunk_checksums_query
+from app.repositories.chunk_upsert import ChunkUpload, build_chunk_upsert, build_recording_totals, select_timeline, timecode_gap_updates
+from app.repositories.pagination import PAGE_ORDER, RecordingCursor, after_cursor, summary_options
+from app.repositories.versioning import RecordingValidator, list_version_query, recording_validator_query
+
+
+class AsyncMySQLRecordingRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def create_recording(self, user_id: str, incremental_transcription: bool = False) -> Recording:
+        recording = Recording(
+            user_id=user_id,
+            status=RecordingStatus.active,
+            incremental_transcription=incremental_transcription
+        )
+        self.db.add(recording)
+        await self.db.commit()
+        await self.db.refresh(recording)
+        return recording
+    
+    async def get_recording(self, recording_id: str) -> Optional[Recording]:
+        result = await self.db.execute(
+            select(Recording).where(Recording.id == recording_id).execution_options(populate_existing=True)
+        )
+        return result.scalars().first()
+    
+    async def list_recordings(self, user_id: str) -> List[Recording]:
+        result = await self.db.execute(
+            select(Recording).where(Recording.user_id == user_id).order_by(Recording.created_at.desc())
+        )
+        return list(result.scalars().all())
+    
+    async def list_recordings_page(self, user_id: str, limit: int, cursor: Optional[RecordingCursor] = None, fields: Iterable[str] = ()) -> List[Recording]:
+        result = await self.db.execute(
+            select(Recording).where(
+                Recording.user_id == user_id,
+                after_cursor(cursor)
+            ).options(*summary_options(fields)).order_by(*PAGE_ORDER).limit(limit)
+        )
+        return list(result.scalars().all())
+    
+    async def get_list_version(self, user_id: str) -> Optional[int]:
+        return (await self.db.execute(list_version_query(user_id))).scalar()
+    
+    async def get_recording_validator(self, recording_id: str) -> Optional[RecordingValidator]:
+        row = (await self.db.execute(recording_validator_query(recording_id))).first()
+        return RecordingValidator(*row) if row else None
+    
+    async def add_chunk(
+        self,
+        recording_id: str,
+        chunk_path: str,
+        index: int,
+        duration: Optional[float],
+        transcribe: bool = False,
+        size_bytes: Optional[int] = None,
+        checksum: Optional[str] = None
+    ) -> RecordingChunk:
+        upload = ChunkUpload(index=index, path=chunk_path, duration=duration, size_bytes=size_bytes, checksum=checksum)
+        return (await self.add_chunks(recording_id, [upload], transcribe=transcribe))[0]
+    
+    async def add_chunks(self, recording_id: str, chunks: List[ChunkUpload], transcribe: bool = False) -> List[RecordingChunk]:
+        await self.db.execute(build_chunk_upsert(self.db.get_bind().dialect.name, recording_id, chunks, transcribe))
+        await self._refresh_timeline(recording_id, [chunk.index for chunk in chunks])
+        await self.db.commit()
+        result = await self.db.execute(
+            select(RecordingChunk).where(
+                RecordingChunk.recording_id == recording_id,
+                RecordingChunk.chunk_index.in_([chunk.index for chunk in chunks])
+            ).order_by(RecordingChunk.chunk_index).execution_options(populate_existing=True)
+        )
+        return list(result.scalars().all())
+    
+    async def _refresh_timeline(self, recording_id: str, indexes: List[int]):
+        rows = (await self.db.execute(select_timeline(recording_id, indexes))).all()
+        updates = timecode_gap_updates(rows, indexes)
+        if updates:
+            await self.db.execute(update(RecordingChunk), updates)
+        await self.db.execute(build_recording_totals(recording_id, settings.CHUNK_TIMECODE_TOLERANCE_MS))
+    
+    async def get_chunk(self, chunk_id: str) -> Optional[RecordingChunk]:
+        result = await self.db.execute(select(RecordingChunk).where(RecordingChunk.id == chunk_id))
+        return result.scalars().first()
+    
+    async def list_chunks(self, recording_id: str) -> List[RecordingChunk]:
+        result = await self.db.execute(
+            select(RecordingChunk).where(RecordingChunk.recording_id == recording_id).order_by(RecordingChunk.chunk_index)
+        )
+        return list(result.scalars().all())
+    
+    async def list_chunk_checksums(self, recording_id: str) -> List[ChunkChecksum]:
+        result = await self.db.execute(chunk_checksums_query(recording_id))
+        return [ChunkChecksum(*row) for row in result]
+    
+    async def save_chunk_transcription(self, chunk_id: str, transcription: str) -> Optional[RecordingChunk]:
+        chunk = await self.get_chunk(chunk_id)
+        if chunk:
+            chunk.transcription_status = ChunkTranscriptionStatus.done
+            chunk.transcription_text = transcription
+            await self.db.commit()
+            await self.db.refresh(chunk)
+        return chunk
+    
+    async def mark_chunk_transcription_failed(self, chunk_id: str) -> Optional[RecordingChunk]:
+        chunk = await self.get_chunk(chunk_id)
+        if chunk:
+            chunk.transcription_status = ChunkTranscriptionStatus.failed
+            await self.db.commit()
+            await self.db.refresh(chunk)
+        return chunk
+    
+    async def mark_paused(self, recording_id: str) -> Optional[Recording]:
+        recording = await self.get_recording(recording_id)
+        if recording:
+            recording.status = RecordingStatus.paused
+            await self.db.commit()
+            await self.db.refresh(recording)
+        return recording
+    
+    async def mark_ended(self, recording_id: str, full_audio_path: str, transcription: str, llm_provider: Optional[str] = None) -> Optional[Recording]:
+        recording = await self.get_recording(recording_id)
+        if recording:
+            recording.status = RecordingStatus.ended
+            recording.audio_file_path = full_audio_path
+            recording.transcription_text = transcription
+            if llm_provider:
+                recording.llm_provider = llm_provider
+            await self.db.commit()
+            await self.db.refresh(recording)
+        return recording
+    
+    async def update_notes(self, recording_id: str, notes: str) -> Optional[Recording]:
+        recording = await self.get_recording(recording_id)
+        if recording:
+            recording.notes = notes
+            await self.db.commit()
+            await self.db.refresh(recording)
+        return recording
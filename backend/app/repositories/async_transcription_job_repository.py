@@ -0,0 +1,42 @@
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.recording import Recording
+from app.models.transcription_job import TranscriptionJob, TranscriptionJobStatus
+
+
+class AsyncMySQLTranscriptionJobRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def create_job(self, recording_id: str, audio_path: str, max_attempts: int) -> TranscriptionJob:
+        job = TranscriptionJob(
+            recording_id=recording_id,
+            audio_path=audio_path,
+            max_attempts=max_attempts,
+            status=TranscriptionJobStatus.queued
+        )
+        self.db.add(job)
+        await self.db.commit()
+        await self.db.refresh(job)
+        return job
+    
+    async def get_job(self, job_id: str) -> Optional[TranscriptionJob]:
+        result = await self.db.execute(
+            select(TranscriptionJob).where(TranscriptionJob.id == job_id).execution_options(populate_existing=True)
+        )
+        return result.scalars().first()
+    
+    async def get_active_job(self, recording_id: str) -> Optional[TranscriptionJob]:
+        result = await self.db.execute(select(TranscriptionJob).where(
+            TranscriptionJob.recording_id == recording_id,
+            TranscriptionJob.status.in_([TranscriptionJobStatus.queued, TranscriptionJobStatus.running])
+        ))
+        return result.scalars().first()
+    
+    async def reload_job(self, job_id: str) -> Optional[TranscriptionJob]:
+        await self.db.rollback()
+        return await self.get_job(job_id)
+    
+    async def get_transcription_text(self, recording_id: str) -> Optional[str]:
+        return (await self.db.execute(select(Recording.transcription_text).where(Recording.id == recording_id))).scalar()
@@ -0,0 +1,39 @@
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.user import User
+
+
+class AsyncMySQLUserRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def create_user(self, google_id: str, email: str, display_name: str, avatar_url: Optional[str]) -> User:
+        user = User(
+            google_id=google_id,
+            email=email,
+            display_name=display_name,
+            avatar_url=avatar_url
+        )
+        self.db.add(user)
+        await self.db.commit()
+        await self.db.refresh(user)
+        return user
+    
+    async def get_user_by_id(self, user_id: str) -> Optional[User]:
+        result = await self.db.execute(select(User).where(User.id == user_id))
+        return result.scalars().first()
+    
+    async def get_user_by_google_id(self, google_id: str) -> Optional[User]:
+        result = await self.db.execute(select(User).where(User.google_id == google_id))
+        return result.scalars().first()
+    
+    async def update_user(self, user_id: str, **kwargs) -> Optional[User]:
+        user = await self.get_user_by_id(user_id)
+        if user:
+            for key, value in kwargs.items():
+                if hasattr(user, key):
+                    setattr(user, key, value)
+            await self.db.commit()
+            await self.db.refresh(user)
+        return user
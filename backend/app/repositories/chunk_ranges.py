@@ -0,0 +1,43 @@
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+from sqlalchemy import select
+from app.models.recording import RecordingChunk
+
+IndexRange = Tuple[int, int]
+
+
+class ChunkChecksum(NamedTuple):
+    chunk_index: int
+    checksum: Optional[str]
+    size_bytes: Optional[int]
+
+
+def chunk_checksums_query(recording_id: str):
+    return select(RecordingChunk.chunk_index, RecordingChunk.checksum, RecordingChunk.size_bytes).where(
+        RecordingChunk.recording_id == recording_id
+    ).order_by(RecordingChunk.chunk_index)
+
+
+def index_ranges(indexes: Iterable[int]) -> List[IndexRange]:
+    ranges = []
+    for index in indexes:
+        if ranges and index == ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], index)
+        else:
+            ranges.append((index, index))
+    return ranges
+
+
+def missing_ranges(received: List[IndexRange], expected_count: Optional[int] = None) -> List[IndexRange]:
+    if expected_count is None:
+        expected_count = received[-1][1] + 1 if received else 0
+    missing = []
+    next_index = 0
+    for start, end in received:
+        if start >= expected_count:
+            break
+        if start > next_index:
+            missing.append((next_index, start - 1))
+        next_index = max(next_index, end + 1)
+    if next_index < expected_count:
+        missing.append((next_index, expected_count - 1))
+    return missing
@@ -0,0 +1,104 @@
+import uuid
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set
+from sqlalchemy import case, func, select, update
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from app.models.recording import Recording, RecordingChunk, ChunkTranscriptionStatus
+
+TRANSCRIPTION_COLUMNS = ("transcription_status", "transcription_text")
+UPDATED_COLUMNS = (
+    "audio_blob_path", "duration_seconds", "size_bytes", "checksum",
+    "start_timecode_ms", "end_timecode_ms"
+)
+
+
+@dataclass
+class ChunkUpload:
+    index: int
+    path: str
+    duration: Optional[float] = None
+    size_bytes: Optional[int] = None
+    checksum: Optional[str] = None
+    start_ms: Optional[int] = None
+    end_ms: Optional[int] = None
+
+
+def build_chunk_upsert(dialect_name: str, recording_id: str, chunks: List[ChunkUpload], transcribe: bool):
+    rows = [
+        {
+            "id": str(uuid.uuid4()),
+            "recording_id": recording_id,
+            "chunk_index": chunk.index,
+            "audio_blob_path": chunk.path,
+            "duration_seconds": chunk.duration,
+            "size_bytes": chunk.size_bytes,
+            "checksum": chunk.checksum,
+            "start_timecode_ms": chunk.start_ms,
+            "end_timecode_ms": chunk.end_ms,
+            "transcription_status": ChunkTranscriptionStatus.pending if transcribe else None,
+            "transcription_text": None
+        }
+        for chunk in chunks
+    ]
+    if dialect_name == "mysql":
+        stmt = mysql.insert(RecordingChunk).values(rows)
+        return stmt.on_duplicate_key_update(upsert_assignments(stmt.inserted))
+    
+    dialect = {"sqlite": sqlite, "postgresql": postgresql}[dialect_name]
+    stmt = dialect.insert(RecordingChunk).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=["recording_id", "chunk_index"],
+        set_=dict(upsert_assignments(stmt.excluded))
+    )
+
+
+def upsert_assignments(incoming) -> List[tuple]:
+    unchanged = RecordingChunk.checksum == incoming.checksum
+    return [
+        *((name, case((unchanged, getattr(RecordingChunk, name)), else_=incoming[name])) for name in TRANSCRIPTION_COLUMNS),
+        *((name, incoming[name]) for name in UPDATED_COLUMNS)
+    ]
+
+
+def timeline_neighbours(indexes: Iterable[int]) -> Set[int]:
+    return {index + offset for index in indexes for offset in (-1, 0, 1) if index + offset >= 0}
+
+
+def select_timeline(recording_id: str, indexes: Iterable[int]):
+    return select(
+        RecordingChunk.id,
+        RecordingChunk.chunk_index,
+        RecordingChunk.start_timecode_ms,
+        RecordingChunk.end_timecode_ms
+    ).where(
+        RecordingChunk.recording_id == recording_id,
+        RecordingChunk.chunk_index.in_(timeline_neighbours(indexes))
+    )
+
+
+def timecode_gap_updates(rows, indexes: Iterable[int]) -> List[Dict]:
+    by_index = {row.chunk_index: row for row in rows}
+    updates = []
+    for index in sorted({index + offset for index in indexes for offset in (0, 1)}):
+        row = by_index.get(index)
+        if row is None:
+            continue
+        previous = by_index.get(index - 1)
+        gap = None
+        if previous is not None and row.start_timecode_ms is not None and previous.end_timecode_ms is not None:
+            gap = row.start_timecode_ms - previous.end_timecode_ms
+        updates.append({"id": row.id, "timecode_gap_ms": gap})
+    return updates
+
+
+def build_recording_totals(recording_id: str, tolerance_ms: int):
+    def aggregate(expression, *criteria):
+        return select(expression).where(RecordingChunk.recording_id == recording_id, *criteria).scalar_subquery()
+    
+    return update(Recording).where(Recording.id == recording_id).values(
+        duration_seconds=aggregate(func.sum(RecordingChunk.duration_seconds)),
+        size_bytes=aggregate(func.sum(RecordingChunk.size_bytes)),
+        timecode_gaps=aggregate(func.count(), RecordingChunk.timecode_gap_ms > tolerance_ms),
+        timecode_overlaps=aggregate(func.count(), RecordingChunk.timecode_gap_ms < -tolerance_ms),
+        chunks_missing_timecodes=aggregate(func.count(), RecordingChunk.start_timecode_ms.is_(None))
+    ).execution_options(synchronize_session=False)
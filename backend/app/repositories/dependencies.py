@@ -0,0 +1,100 @@
+from contextlib import asynccontextmanager
+from typing import Any, AsyncContextManager, AsyncIterator, Callable, Optional
+from fastapi import Depends, Request, Response
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.security import get_current_user_id
+from app.models import (
+    SessionLocal,
+    get_async_replica_session_factory,
+    get_async_session_factory,
+    get_db,
+    get_replica_db,
+    get_replica_session_factory,
+    get_session_factory,
+)
+from app.repositories.async_recording_repository import AsyncMySQLRecordingRepository
+from app.repositories.async_transcription_job_repository import AsyncMySQLTranscriptionJobRepository
+from app.repositories.async_user_repository import AsyncMySQLUserRepository
+from app.repositories.interfaces import AsyncRecordingRepository, AsyncTranscriptionJobRepository, AsyncUserRepository
+from app.repositories.recording_repository import MySQLRecordingRepository
+from app.repositories.routing import LAST_WRITE_HEADER, READ_ONLY_METHODS, get_read_your_writes_tracker, last_write_from
+from app.repositories.transcription_job_repository import MySQLTranscriptionJobRepository
+from app.repositories.user_repository import MySQLUserRepository
+
+
+class AwaitableRepository:
+    def __init__(self, repo: Any):
+        self.repo = repo
+    
+    def __getattr__(self, name: str):
+        attr = getattr(self.repo, name)
+        if not callable(attr):
+            return attr
+        
+        async def call(*args, **kwargs):
+            return attr(*args, **kwargs)
+        
+        return call
+
+
+async def get_recording_repository(
+    request: Request,
+    response: Response,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+    replica_db: Optional[Session] = Depends(get_replica_db)
+) -> AsyncIterator[AsyncRecordingRepository]:
+    tracker = get_read_your_writes_tracker()
+    use_replica = tracker.use_replica(request.method, user_id, last_write_from(request))
+    if request.method not in READ_ONLY_METHODS:
+        response.headers[LAST_WRITE_HEADER] = f"{tracker.clock():.3f}"
+    try:
+        if settings.DB_ASYNC:
+            session_factory = (use_replica and get_async_replica_session_factory()) or get_async_session_factory()
+            async with session_factory() as async_db:
+                yield AsyncMySQLRecordingRepository(async_db)
+        else:
+            yield AwaitableRepository(MySQLRecordingRepository(replica_db if use_replica and replica_db is not None else db))
+    finally:
+        if request.method not in READ_ONLY_METHODS:
+            tracker.record_write(user_id)
+
+
+def get_export_session_factory(request: Request, user_id: str = Depends(get_current_user_id)) -> Callable[[], Session]:
+    if get_read_your_writes_tracker().use_replica(request.method, user_id, last_write_from(request)):
+        return get_replica_session_factory() or get_session_factory()
+    return get_session_factory()
+
+
+async def get_user_repository(db: Session = Depends(get_db)) -> AsyncIterator[AsyncUserRepository]:
+    if settings.DB_ASYNC:
+        async with get_async_session_factory()() as async_db:
+            yield AsyncMySQLUserRepository(async_db)
+    else:
+        yield AwaitableRepository(MySQLUserRepository(db))
+
+
+async def get_transcription_job_repository(db: Session = Depends(get_db)) -> AsyncIterator[AsyncTranscriptionJobRepository]:
+    if settings.DB_ASYNC:
+        async with get_async_session_factory()() as async_db:
+            yield AsyncMySQLTranscriptionJobRepository(async_db)
+    else:
+        yield AwaitableRepository(MySQLTranscriptionJobRepository(db))
+
+
+@asynccontextmanager
+async def open_recording_repository() -> AsyncIterator[AsyncRecordingRepository]:
+    if settings.DB_ASYNC:
+        async with get_async_session_factory()() as async_db:
+            yield AsyncMySQLRecordingRepository(async_db)
+    else:
+        db = SessionLocal()
+        try:
+            yield AwaitableRepository(MySQLRecordingRepository(db))
+        finally:
+            db.close()
+
+
+def get_recording_repository_opener() -> Callable[[], AsyncContextManager[AsyncRecordingRepository]]:
+    return open_recording_repository
@@ -1,6 +1,13 @@
-from typing import Protocol, List, Optional
+from datetime import datetime, timedelta
+from typing import Iterable, Protocol, List, Optional, Tuple
 from app.models.user import User
 from app.models.recording import Recording, RecordingChunk
+from app.models.transcription_job import TranscriptionJob
+from app.models.transcription_cache import TranscriptionCacheEntry
+from app.repositories.chunk_ranges import ChunkChecksum
+from app.repositories.chunk_upsert import ChunkUpload
+from app.repositories.pagination import RecordingCursor
+from app.repositories.versioning import RecordingValidator
 
 
 class UserRepository(Protocol):
@@ -18,7 +25,7 @@ class UserRepository(Protocol):
 
 
 class RecordingRepository(Protocol):
-    def create_recording(self, user_id: str) -> Recording:
+    def create_recording(self, user_id: str, incremental_transcription: bool = False) -> Recording:
         ...
     
     def get_recording(self, recording_id: str) -> Optional[Recording]:
@@ -27,14 +34,195 @@ class RecordingRepository(Protocol):
     def list_recordings(self, user_id: str) -> List[Recording]:
         ...
     
-    def add_chunk(self, recording_id: str, chunk_path: str, index: int, duration: Optional[float]) -> RecordingChunk:
+    def list_recordings_page(self, user_id: str, limit: int, cursor: Optional[RecordingCursor] = None, fields: Iterable[str] = ()) -> List[Recording]:
+        ...
+    
+    def get_list_version(self, user_id: str) -> Optional[int]:
+        ...
+    
+    def get_recording_validator(self, recording_id: str) -> Optional[RecordingValidator]:
+        ...
+    
+    def add_chunk(
+        self,
+        recording_id: str,
+        chunk_path: str,
+        index: int,
+        duration: Optional[float],
+        transcribe: bool = False,
+        size_bytes: Optional[int] = None,
+        checksum: Optional[str] = None
+    ) -> RecordingChunk:
+        ...
+    
+    def add_chunks(self, recording_id: str, chunks: List[ChunkUpload], transcribe: bool = False) -> List[RecordingChunk]:
+        ...
+    
+    def get_chunk(self, chunk_id: str) -> Optional[RecordingChunk]:
+        ...
+    
+    def list_chunks(self, recording_id: str) -> List[RecordingChunk]:
+        ...
+    
+    def list_chunk_checksums(self, recording_id: str) -> List[ChunkChecksum]:
+        ...
+    
+    def save_chunk_transcription(self, chunk_id: str, transcription: str) -> Optional[RecordingChunk]:
+        ...
+    
+    def mark_chunk_transcription_failed(self, chunk_id: str) -> Optional[RecordingChunk]:
         ...
     
     def mark_paused(self, recording_id: str) -> Optional[Recording]:
         ...
     
-    def mark_ended(self, recording_id: str, full_audio_path: str, transcription: str) -> Optional[Recording]:
+    def mark_ended(self, recording_id: str, full_audio_path: str, transcription: str, llm_provider: Optional[str] = None) -> Optional[Recording]:
         ...
     
     def update_notes(self, recording_id: str, notes: str) -> Optional[Recording]:
         ...
+
+
+class AsyncUserRepository(Protocol):
+    async def create_user(self, google_id: str, email: str, display_name: str, avatar_url: Optional[str]) -> User:
+        ...
+    
+    async def get_user_by_id(self, user_id: str) -> Optional[User]:
+        ...
+    
+    async def get_user_by_google_id(self, google_id: str) -> Optional[User]:
+        ...
+    
+    async def update_user(self, user_id: str, **kwargs) -> Optional[User]:
+        ...
+
+
+class AsyncRecordingRepository(Protocol):
+    async def create_recording(self, user_id: str, incremental_transcription: bool = False) -> Recording:
+        ...
+    
+    async def get_recording(self, recording_id: str) -> Optional[Recording]:
+        ...
+    
+    async def list_recordings(self, user_id: str) -> List[Recording]:
+        ...
+    
+    async def list_recordings_page(self, user_id: str, limit: int, cursor: Optional[RecordingCursor] = None, fields: Iterable[str] = ()) -> List[Recording]:
+        ...
+    
+    async def get_list_version(self, user_id: str) -> Optional[int]:
+        ...
+    
+    async def get_recording_validator(self, recording_id: str) -> Optional[RecordingValidator]:
+        ...
+    
+    async def add_chunk(
+        self,
+        recording_id: str,
+        chunk_path: str,
+        index: int,
+        duration: Optional[float],
+        transcribe: bool = False,
+        size_bytes: Optional[int] = None,
+        checksum: Optional[str] = None
+    ) -> RecordingChunk:
+        ...
+    
+    async def add_chunks(self, recording_id: str, chunks: List[ChunkUpload], transcribe: bool = False) -> List[RecordingChunk]:
+        ...
+    
+    async def get_chunk(self, chunk_id: str) -> Optional[RecordingChunk]:
+        ...
+    
+    async def list_chunks(self, recording_id: str) -> List[RecordingChunk]:
+        ...
+    
+    async def list_chunk_checksums(self, recording_id: str) -> List[ChunkChecksum]:
+        ...
+    
+    async def save_chunk_transcription(self, chunk_id: str, transcription: str) -> Optional[RecordingChunk]:
+        ...
+    
+    async def mark_chunk_transcription_failed(self, chunk_id: str) -> Optional[RecordingChunk]:
+        ...
+    
+    async def mark_paused(self, recording_id: str) -> Optional[Recording]:
+        ...
+    
+    async def mark_ended(self, recording_id: str, full_audio_path: str, transcription: str, llm_provider: Optional[str] = None) -> Optional[Recording]:
+        ...
+    
+    async def update_notes(self, recording_id: str, notes: str) -> Optional[Recording]:
+        ...
+
+
+class TranscriptionJobRepository(Protocol):
+    def create_job(self, recording_id: str, audio_path: str, max_attempts: int) -> TranscriptionJob:
+        ...
+    
+    def get_job(self, job_id: str) -> Optional[TranscriptionJob]:
+        ...
+    
+    def get_active_job(self, recording_id: str) -> Optional[TranscriptionJob]:
+        ...
+    
+    def reload_job(self, job_id: str) -> Optional[TranscriptionJob]:
+        ...
+    
+    def get_transcription_text(self, recording_id: str) -> Optional[str]:
+        ...
+    
+    def list_queued_job_ids(self) -> List[str]:
+        ...
+    
+    def claim_job(self, job_id: str) -> Optional[TranscriptionJob]:
+        ...
+    
+    def requeue_job(self, job_id: str, error: str) -> Optional[TranscriptionJob]:
+        ...
+    
+    def mark_done(self, job_id: str) -> Optional[TranscriptionJob]:
+        ...
+    
+    def mark_failed(self, job_id: str, error: str) -> Optional[TranscriptionJob]:
+        ...
+    
+    def heartbeat(self, job_id: str) -> bool:
+        ...
+    
+    def requeue_stale_jobs(self, lease: timedelta) -> List[str]:
+        ...
+
+
+class AsyncTranscriptionJobRepository(Protocol):
+    async def create_job(self, recording_id: str, audio_path: str, max_attempts: int) -> TranscriptionJob:
+        ...
+    
+    async def get_job(self, job_id: str) -> Optional[TranscriptionJob]:
+        ...
+    
+    async def get_active_job(self, recording_id: str) -> Optional[TranscriptionJob]:
+        ...
+    
+    async def reload_job(self, job_id: str) -> Optional[TranscriptionJob]:
+        ...
+    
+    async def get_transcription_text(self, recording_id: str) -> Optional[str]:
+        ...
+
+
+class TranscriptionCacheRepository(Protocol):
+    def get_entry(self, cache_key: str) -> Optional[TranscriptionCacheEntry]:
+        ...
+    
+    def put_entry(self, cache_key: str, content_hash: str, provider: str, provider_version: str, transcription: str) -> int:
+        ...
+    
+    def total_size(self) -> int:
+        ...
+    
+    def touch_entries(self, cache_keys: List[str], accessed_at: datetime, batch_size: int = 500) -> int:
+        ...
+    
+    def evict_oldest(self, excess: int, batch_size: int = 100) -> Tuple[int, int]:
+        ...
@@ -0,0 +1,51 @@
+import base64
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+from sqlalchemy import and_, func, or_, true
+from sqlalchemy.orm import defer, with_expression
+from app.models.recording import Recording
+
+RecordingCursor = Tuple[datetime, str]
+
+TRANSCRIPT_PREVIEW_LENGTH = 200
+TEXT_FIELDS = {"transcription_text", "notes"}
+PAGE_ORDER = (Recording.created_at.desc(), Recording.id.desc())
+
+
+def encode_cursor(recording: Recording) -> str:
+    raw = f"{recording.created_at.isoformat()}|{recording.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> RecordingCursor:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, recording_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), recording_id
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def after_cursor(cursor: Optional[RecordingCursor]):
+    if cursor is None:
+        return true()
+    created_at, recording_id = cursor
+    return or_(
+        Recording.created_at < created_at,
+        and_(Recording.created_at == created_at, Recording.id < recording_id)
+    )
+
+
+def summary_options(fields: Iterable[str] = ()) -> List:
+    options = [
+        with_expression(
+            Recording.transcript_preview,
+            func.substr(Recording.transcription_text, 1, TRANSCRIPT_PREVIEW_LENGTH)
+        )
+    ]
+    if "transcription_text" not in fields:
+        options.append(defer(Recording.transcription_text))
+    if "notes" not in fields:
+        options.append(defer(Recording.notes))
+    return options
+
@@ -1,14 +1,24 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional
+from sqlalchemy import update
 from sqlalchemy.orm import Session
-from app.models.recording import Recording, RecordingChunk, RecordingStatus
+from app.core.config import settings
+from app.models.recording import Recording, RecordingChunk, RecordingStatus, ChunkTranscriptionStatus
+from app.repositories.chunk_ranges import ChunkChecksum, chunk_checksums_query
+from app.repositories.chunk_upsert import ChunkUpload, build_chunk_upsert, build_recording_totals, select_timeline, timecode_gap_updates
+from app.repositories.pagination import PAGE_ORDER, RecordingCursor, after_cursor, summary_options
+from app.repositories.versioning import RecordingValidator, list_version_query, recording_validator_query
 
 
 class MySQLRecordingRepository:
     def __init__(self, db: Session):
         self.db = db
     
-    def create_recording(self, user_id: str) -> Recording:
-        recording = Recording(user_id=user_id, status=RecordingStatus.active)
+    def create_recording(self, user_id: str, incremental_transcription: bool = False) -> Recording:
+        recording = Recording(
+            user_id=user_id,
+            status=RecordingStatus.active,
+            incremental_transcription=incremental_transcription
+        )
         self.db.add(recording)
         self.db.commit()
         self.db.refresh(recording)
@@ -20,16 +30,71 @@ class MySQLRecordingRepository:
     def list_recordings(self, user_id: str) -> List[Recording]:
         return self.db.query(Recording).filter(Recording.user_id == user_id).order_by(Recording.created_at.desc()).all()
     
-    def add_chunk(self, recording_id: str, chunk_path: str, index: int, duration: Optional[float]) -> RecordingChunk:
-        chunk = RecordingChunk(
-            recording_id=recording_id,
-            chunk_index=index,
-            audio_blob_path=chunk_path,
-            duration_seconds=duration
-        )
-        self.db.add(chunk)
+    def list_recordings_page(self, user_id: str, limit: int, cursor: Optional[RecordingCursor] = None, fields: Iterable[str] = ()) -> List[Recording]:
+        return self.db.query(Recording).filter(
+            Recording.user_id == user_id,
+            after_cursor(cursor)
+        ).options(*summary_options(fields)).order_by(*PAGE_ORDER).limit(limit).all()
+    
+    def get_list_version(self, user_id: str) -> Optional[int]:
+        return self.db.execute(list_version_query(user_id)).scalar()
+    
+    def get_recording_validator(self, recording_id: str) -> Optional[RecordingValidator]:
+        row = self.db.execute(recording_validator_query(recording_id)).first()
+        return RecordingValidator(*row) if row else None
+    
+    def add_chunk(
+        self,
+        recording_id: str,
+        chunk_path: str,
+        index: int,
+        duration: Optional[float],
+        transcribe: bool = False,
+        size_bytes: Optional[int] = None,
+        checksum: Optional[str] = None
+    ) -> RecordingChunk:
+        upload = ChunkUpload(index=index, path=chunk_path, duration=duration, size_bytes=size_bytes, checksum=checksum)
+        return self.add_chunks(recording_id, [upload], transcribe=transcribe)[0]
+    
+    def add_chunks(self, recording_id: str, chunks: List[ChunkUpload], transcribe: bool = False) -> List[RecordingChunk]:
+        self.db.execute(build_chunk_upsert(self.db.get_bind().dialect.name, recording_id, chunks, transcribe))
+        self._refresh_timeline(recording_id, [chunk.index for chunk in chunks])
         self.db.commit()
-        self.db.refresh(chunk)
+        return self.db.query(RecordingChunk).filter(
+            RecordingChunk.recording_id == recording_id,
+            RecordingChunk.chunk_index.in_([chunk.index for chunk in chunks])
+        ).order_by(RecordingChunk.chunk_index).populate_existing().all()
+    
+    def _refresh_timeline(self, recording_id: str, indexes: List[int]):
+        updates = timecode_gap_updates(self.db.execute(select_timeline(recording_id, indexes)).all(), indexes)
+        if updates:
+            self.db.execute(update(RecordingChunk), updates)
+        self.db.execute(build_recording_totals(recording_id, settings.CHUNK_TIMECODE_TOLERANCE_MS))
+    
+    def get_chunk(self, chunk_id: str) -> Optional[RecordingChunk]:
+        return self.db.query(RecordingChunk).filter(RecordingChunk.id == chunk_id).first()
+    
+    def list_chunks(self, recording_id: str) -> List[RecordingChunk]:
+        return self.db.query(RecordingChunk).filter(RecordingChunk.recording_id == recording_id).order_by(RecordingChunk.chunk_index).all()
+    
+    def list_chunk_checksums(self, recording_id: str) -> List[ChunkChecksum]:
+        return [ChunkChecksum(*row) for row in self.db.execute(chunk_checksums_query(recording_id))]
+    
+    def save_chunk_transcription(self, chunk_id: str, transcription: str) -> Optional[RecordingChunk]:
+        chunk = self.get_chunk(chunk_id)
+        if chunk:
+            chunk.transcription_status = ChunkTranscriptionStatus.done
+            chunk.transcription_text = transcription
+            self.db.commit()
+            self.db.refresh(chunk)
+        return chunk
+    
+    def mark_chunk_transcription_failed(self, chunk_id: str) -> Optional[RecordingChunk]:
+        chunk = self.get_chunk(chunk_id)
+        if chunk:
+            chunk.transcription_status = ChunkTranscriptionStatus.failed
+            self.db.commit()
+            self.db.refresh(chunk)
         return chunk
     
     def mark_paused(self, recording_id: str) -> Optional[Recording]:
@@ -40,12 +105,14 @@ class MySQLRecordingRepository:
             self.db.refresh(recording)
         return recording
     
-    def mark_ended(self, recording_id: str, full_audio_path: str, transcription: str) -> Optional[Recording]:
+    def mark_ended(self, recording_id: str, full_audio_path: str, transcription: str, llm_provider: Optional[str] = None) -> Optional[Recording]:
         recording = self.get_recording(recording_id)
         if recording:
             recording.status = RecordingStatus.ended
             recording.audio_file_path = full_audio_path
             recording.transcription_text = transcription
+            if llm_provider:
+                recording.llm_provider = llm_provider
             self.db.commit()
             self.db.refresh(recording)
         return recording
@@ -0,0 +1,46 @@
+import time
+from typing import Dict, Optional
+from fastapi import Request
+from app.core.config import settings
+
+READ_ONLY_METHODS = frozenset({"GET", "HEAD"})
+PRUNE_THRESHOLD = 10000
+LAST_WRITE_HEADER = "X-Last-Write"
+
+
+def last_write_from(request: Request) -> Optional[float]:
+    try:
+        return float(request.headers[LAST_WRITE_HEADER])
+    except (KeyError, ValueError):
+        return None
+
+
+class ReadYourWritesTracker:
+    def __init__(self, window: Optional[float] = None, clock=time.time):
+        self.window = window if window is not None else settings.DB_READ_YOUR_WRITES_SECONDS
+        self.clock = clock
+        self._pinned_until: Dict[str, float] = {}
+    
+    def record_write(self, user_id: str) -> float:
+        now = self.clock()
+        if len(self._pinned_until) >= PRUNE_THRESHOLD:
+            self._pinned_until = {key: until for key, until in self._pinned_until.items() if until > now}
+        self._pinned_until[user_id] = now + self.window
+        return now
+    
+    def pinned_to_primary(self, user_id: str, last_write: Optional[float] = None) -> bool:
+        now = self.clock()
+        return self._pinned_until.get(user_id, 0.0) > now or (last_write is not None and last_write + self.window > now)
+    
+    def use_replica(self, method: str, user_id: str, last_write: Optional[float] = None) -> bool:
+        return method in READ_ONLY_METHODS and not self.pinned_to_primary(user_id, last_write)
+
+
+_tracker: Optional[ReadYourWritesTracker] = None
+
+
+def get_read_your_writes_tracker() -> ReadYourWritesTracker:
+    global _tracker
+    if _tracker is None:
+        _tracker = ReadYourWritesTracker()
+    return _tracker
@@ -0,0 +1,61 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.models.transcription_cache import TranscriptionCacheEntry
+
+
+class MySQLTranscriptionCacheRepository:
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_entry(self, cache_key: str) -> Optional[TranscriptionCacheEntry]:
+        return self.db.query(TranscriptionCacheEntry).filter(TranscriptionCacheEntry.cache_key == cache_key).first()
+    
+    def touch_entries(self, cache_keys: List[str], accessed_at: datetime, batch_size: int = 500) -> int:
+        touched = 0
+        for offset in range(0, len(cache_keys), batch_size):
+            touched += self.db.query(TranscriptionCacheEntry).filter(
+                TranscriptionCacheEntry.cache_key.in_(cache_keys[offset:offset + batch_size])
+            ).update({TranscriptionCacheEntry.last_accessed_at: accessed_at}, synchronize_session=False)
+        self.db.commit()
+        return touched
+    
+    def put_entry(self, cache_key: str, content_hash: str, provider: str, provider_version: str, transcription: str) -> int:
+        entry = self.db.get(TranscriptionCacheEntry, cache_key) or TranscriptionCacheEntry(cache_key=cache_key, size_bytes=0)
+        previous_size = entry.size_bytes
+        entry.content_hash = content_hash
+        entry.provider = provider
+        entry.provider_version = provider_version
+        entry.transcription = transcription
+        entry.size_bytes = len(transcription.encode())
+        entry.last_accessed_at = datetime.utcnow()
+        self.db.add(entry)
+        self.db.commit()
+        return entry.size_bytes - previous_size
+    
+    def total_size(self) -> int:
+        return self.db.query(func.coalesce(func.sum(TranscriptionCacheEntry.size_bytes), 0)).scalar()
+    
+    def evict_oldest(self, excess: int, batch_size: int = 100) -> Tuple[int, int]:
+        evicted = 0
+        freed = 0
+        while excess > 0:
+            oldest = self.db.query(TranscriptionCacheEntry.cache_key, TranscriptionCacheEntry.size_bytes).order_by(
+                TranscriptionCacheEntry.last_accessed_at
+            ).limit(batch_size).all()
+            if not oldest:
+                break
+            victims = []
+            for row in oldest:
+                victims.append(row.cache_key)
+                excess -= row.size_bytes
+                freed += row.size_bytes
+                if excess <= 0:
+                    break
+            self.db.query(TranscriptionCacheEntry).filter(
+                TranscriptionCacheEntry.cache_key.in_(victims)
+            ).delete(synchronize_session=False)
+            self.db.commit()
+            evicted += len(victims)
+        return evicted, freed
@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
+from sqlalchemy.orm import Session
+from app.models.recording import Recording
+from app.models.transcription_job import TranscriptionJob, TranscriptionJobStatus
+
+
+class MySQLTranscriptionJobRepository:
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def create_job(self, recording_id: str, audio_path: str, max_attempts: int) -> TranscriptionJob:
+        job = TranscriptionJob(
+            recording_id=recording_id,
+            audio_path=audio_path,
+            max_attempts=max_attempts,
+            status=TranscriptionJobStatus.queued
+        )
+        self.db.add(job)
+        self.db.commit()
+        self.db.refresh(job)
+        return job
+    
+    def get_job(self, job_id: str) -> Optional[TranscriptionJob]:
+        return self.db.query(TranscriptionJob).filter(TranscriptionJob.id == job_id).populate_existing().first()
+    
+    def get_active_job(self, recording_id: str) -> Optional[TranscriptionJob]:
+        return self.db.query(TranscriptionJob).filter(
+            TranscriptionJob.recording_id == recording_id,
+            TranscriptionJob.status.in_([TranscriptionJobStatus.queued, TranscriptionJobStatus.running])
+        ).first()
+    
+    def reload_job(self, job_id: str) -> Optional[TranscriptionJob]:
+        self.db.rollback()
+        return self.get_job(job_id)
+    
+    def get_transcription_text(self, recording_id: str) -> Optional[str]:
+        return self.db.query(Recording.transcription_text).filter(Recording.id == recording_id).scalar()
+    
+    def list_queued_job_ids(self) -> List[str]:
+        rows = self.db.query(TranscriptionJob.id).filter(
+            TranscriptionJob.status == TranscriptionJobStatus.queued
+        ).order_by(TranscriptionJob.created_at).all()
+        return [row.id for row in rows]
+    
+    def claim_job(self, job_id: str) -> Optional[TranscriptionJob]:
+        claimed = self.db.query(TranscriptionJob).filter(
+            TranscriptionJob.id == job_id,
+            TranscriptionJob.status == TranscriptionJobStatus.queued
+        ).update({
+            TranscriptionJob.status: TranscriptionJobStatus.running,
+            TranscriptionJob.attempts: TranscriptionJob.attempts + 1,
+            TranscriptionJob.started_at: datetime.utcnow(),
+            TranscriptionJob.updated_at: datetime.utcnow()
+        }, synchronize_session=False)
+        self.db.commit()
+        if not claimed:
+            return None
+        return self.get_job(job_id)
+    
+    def requeue_job(self, job_id: str, error: str) -> Optional[TranscriptionJob]:
+        return self._set_status(job_id, TranscriptionJobStatus.queued, error=error)
+    
+    def mark_done(self, job_id: str) -> Optional[TranscriptionJob]:
+        return self._set_status(job_id, TranscriptionJobStatus.done, error=None, finished=True)
+    
+    def mark_failed(self, job_id: str, error: str) -> Optional[TranscriptionJob]:
+        return self._set_status(job_id, TranscriptionJobStatus.failed, error=error, finished=True)
+    
+    def heartbeat(self, job_id: str) -> bool:
+        touched = self.db.query(TranscriptionJob).filter(
+            TranscriptionJob.id == job_id,
+            TranscriptionJob.status == TranscriptionJobStatus.running
+        ).update({TranscriptionJob.updated_at: datetime.utcnow()}, synchronize_session=False)
+        self.db.commit()
+        return bool(touched)
+    
+    def requeue_stale_jobs(self, lease: timedelta) -> List[str]:
+        cutoff = datetime.utcnow() - lease
+        stale = [
+            TranscriptionJob.status == TranscriptionJobStatus.running,
+            TranscriptionJob.updated_at < cutoff
+        ]
+        job_ids = [row.id for row in self.db.query(TranscriptionJob.id).filter(*stale)]
+        if job_ids:
+            self.db.query(TranscriptionJob).filter(TranscriptionJob.id.in_(job_ids), *stale).update({
+                TranscriptionJob.status: TranscriptionJobStatus.queued,
+                TranscriptionJob.updated_at: datetime.utcnow()
+            }, synchronize_session=False)
+        self.db.commit()
+        return job_ids
+    
+    def _set_status(self, job_id: str, status: TranscriptionJobStatus, error: Optional[str], finished: bool = False) -> Optional[TranscriptionJob]:
+        job = self.get_job(job_id)
+        if job:
+            job.status = status
+            job.error = error
+            if finished:
+                job.finished_at = datetime.utcnow()
+            self.db.commit()
+            self.db.refresh(job)
+        return job
@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import NamedTuple, Optional
+from sqlalchemy import event, inspect, select, update
+from app.models.recording import Recording
+from app.models.user import User
+
+LIST_FIELDS = ("status", "transcription_text", "notes", "incremental_transcription", "duration_seconds", "size_bytes")
+
+
+class RecordingValidator(NamedTuple):
+    user_id: str
+    updated_at: Optional[datetime]
+    version: int
+
+
+def bump_list_version(user_id):
+    return update(User.__table__).where(User.__table__.c.id == user_id).values(
+        recordings_version=User.__table__.c.recordings_version + 1
+    )
+
+
+def list_version_query(user_id: str):
+    return select(User.recordings_version).where(User.id == user_id)
+
+
+def recording_validator_query(recording_id: str):
+    return select(Recording.user_id, Recording.updated_at, Recording.version).where(Recording.id == recording_id)
+
+
+@event.listens_for(Recording, "after_insert")
+@event.listens_for(Recording, "after_delete")
+def _bump_owner_list_version(mapper, connection, target: Recording):
+    connection.execute(bump_list_version(target.user_id))
+
+
+@event.listens_for(Recording, "after_update")
+def _bump_owner_list_version_on_change(mapper, connection, target: Recording):
+    attrs = inspect(target).attrs
+    if any(getattr(attrs, name).history.has_changes() for name in LIST_FIELDS):
+        connection.execute(bump_list_version(target.user_id))
@@ -0,0 +1,91 @@
+import logging
+from typing import Callable, Optional
+from sqlalchemy import event, inspect, or_
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models import SessionLocal, get_engine
+from app.models.recording import Recording
+from app.search.interface import SearchIndex
+from app.search.inverted_index import InMemorySearchIndex
+from app.search.mysql_fulltext import MySQLFullTextSearchIndex
+
+logger = logging.getLogger(__name__)
+
+PENDING_DOCUMENTS = "search_pending_documents"
+
+_search_index: Optional[SearchIndex] = None
+
+
+def create_search_index() -> SearchIndex:
+    backend = settings.SEARCH_BACKEND
+    dialect = get_engine().dialect.name
+    if backend == "auto":
+        backend = "mysql" if dialect == "mysql" else "memory"
+    if backend == "mysql":
+        return MySQLFullTextSearchIndex(SessionLocal)
+    if dialect != "sqlite":
+        logger.warning("The in-memory search index only sees writes made by this process; use SEARCH_BACKEND=mysql with more than one worker")
+    return InMemorySearchIndex()
+
+
+def get_search_index() -> SearchIndex:
+    global _search_index
+    if _search_index is None:
+        _search_index = create_search_index()
+    return _search_index
+
+
+def set_search_index(index: Optional[SearchIndex]):
+    global _search_index
+    _search_index = index
+
+
+def rebuild_search_index(index: InMemorySearchIndex, session_factory: Callable[[], Session] = SessionLocal, batch_size: int = 500):
+    db = session_factory()
+    try:
+        rows = db.query(Recording.id, Recording.user_id, Recording.transcription_text, Recording.notes).filter(
+            or_(Recording.transcription_text.isnot(None), Recording.notes.isnot(None))
+        ).yield_per(batch_size)
+        for row in rows:
+            index.index_document(row.id, row.user_id, row.transcription_text, row.notes)
+    finally:
+        db.close()
+
+
+def warm_search_index():
+    index = get_search_index()
+    if isinstance(index, InMemorySearchIndex):
+        rebuild_search_index(index)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_recording_text(session: Session, flush_context):
+    if _search_index is None:
+        return
+    pending = session.info.setdefault(PENDING_DOCUMENTS, {})
+    for target in session.new | session.dirty:
+        if not isinstance(target, Recording):
+            continue
+        attrs = inspect(target).attrs
+        if attrs.transcription_text.history.has_changes() or attrs.notes.history.has_changes():
+            pending[target.id] = (target.user_id, target.transcription_text, target.notes)
+    for target in session.deleted:
+        if isinstance(target, Recording):
+            pending[target.id] = None
+
+
+@event.listens_for(Session, "after_commit")
+def _index_committed_text(session: Session):
+    pending = session.info.pop(PENDING_DOCUMENTS, None)
+    if not pending or _search_index is None:
+        return
+    for recording_id, document in pending.items():
+        if document is None:
+            _search_index.remove_recording(recording_id)
+        else:
+            _search_index.index_document(recording_id, *document)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_text(session: Session):
+    session.info.pop(PENDING_DOCUMENTS, None)
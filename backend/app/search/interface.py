@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import List, Optional, Protocol
+
+
+@dataclass
+class SearchHit:
+    recording_id: str
+    score: float
+    snippet: str
+
+
+class SearchIndex(Protocol):
+    def index_document(self, recording_id: str, user_id: str, transcription_text: Optional[str], notes: Optional[str]):
+        ...
+    
+    def remove_recording(self, recording_id: str):
+        ...
+    
+    def search(self, user_id: str, query: str, limit: int, offset: int) -> List[SearchHit]:
+        ...
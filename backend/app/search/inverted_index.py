@@ -0,0 +1,75 @@
+import math
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+from app.search.interface import SearchHit
+from app.search.text import build_snippet, tokenize
+
+
+class InMemorySearchIndex:
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self._lengths: Dict[str, int] = {}
+        self._owners: Dict[str, str] = {}
+        self._texts: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        self._total_length = 0
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._lengths)
+    
+    def index_document(self, recording_id: str, user_id: str, transcription_text: Optional[str], notes: Optional[str]):
+        tokens = tokenize(" ".join(text for text in (transcription_text, notes) if text))
+        with self._lock:
+            self._remove(recording_id)
+            if not tokens:
+                return
+            for term, frequency in Counter(tokens).items():
+                self._postings[term][recording_id] = frequency
+            self._lengths[recording_id] = len(tokens)
+            self._owners[recording_id] = user_id
+            self._texts[recording_id] = (transcription_text, notes)
+            self._total_length += len(tokens)
+    
+    def remove_recording(self, recording_id: str):
+        with self._lock:
+            self._remove(recording_id)
+    
+    def search(self, user_id: str, query: str, limit: int, offset: int) -> List[SearchHit]:
+        terms = set(tokenize(query))
+        with self._lock:
+            if not terms or not self._lengths:
+                return []
+            document_count = len(self._lengths)
+            average_length = self._total_length / document_count
+            scores: Dict[str, float] = defaultdict(float)
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (document_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for recording_id, frequency in postings.items():
+                    if self._owners[recording_id] != user_id:
+                        continue
+                    length_norm = 1 - self.b + self.b * self._lengths[recording_id] / average_length
+                    scores[recording_id] += idf * frequency * (self.k1 + 1) / (frequency + self.k1 * length_norm)
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[offset:offset + limit]
+            return [
+                SearchHit(recording_id=recording_id, score=score, snippet=build_snippet(self._texts[recording_id], terms))
+                for recording_id, score in ranked
+            ]
+    
+    def _remove(self, recording_id: str):
+        if recording_id not in self._lengths:
+            return
+        transcription_text, notes = self._texts.pop(recording_id)
+        for term in set(tokenize(" ".join(text for text in (transcription_text, notes) if text))):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(recording_id, None)
+                if not postings:
+                    del self._postings[term]
+        self._total_length -= self._lengths.pop(recording_id)
+        del self._owners[recording_id]
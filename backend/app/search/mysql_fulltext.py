@@ -0,0 +1,38 @@
+from typing import Callable, List, Optional
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.search.interface import SearchHit
+from app.search.text import build_snippet, tokenize
+
+FULLTEXT_SEARCH = text("""
+    SELECT id, transcription_text, notes,
+           MATCH(transcription_text, notes) AGAINST (:query IN NATURAL LANGUAGE MODE) AS score
+    FROM recordings
+    WHERE user_id = :user_id
+      AND MATCH(transcription_text, notes) AGAINST (:query IN NATURAL LANGUAGE MODE)
+    ORDER BY score DESC, id
+    LIMIT :limit OFFSET :offset
+""")
+
+
+class MySQLFullTextSearchIndex:
+    def __init__(self, session_factory: Callable[[], Session]):
+        self.session_factory = session_factory
+    
+    def index_document(self, recording_id: str, user_id: str, transcription_text: Optional[str], notes: Optional[str]):
+        pass
+    
+    def remove_recording(self, recording_id: str):
+        pass
+    
+    def search(self, user_id: str, query: str, limit: int, offset: int) -> List[SearchHit]:
+        terms = set(tokenize(query))
+        db = self.session_factory()
+        try:
+            rows = db.execute(FULLTEXT_SEARCH, {"query": query, "user_id": user_id, "limit": limit, "offset": offset}).all()
+        finally:
+            db.close()
+        return [
+            SearchHit(recording_id=row.id, score=float(row.score), snippet=build_snippet((row.transcription_text, row.notes), terms))
+            for row in rows
+        ]
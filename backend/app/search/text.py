@@ -0,0 +1,42 @@
+import html
+import re
+from typing import Iterable, List, Optional, Set
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "but", "by", "for", "if", "in", "into", "is", "it",
+    "no", "not", "of", "on", "or", "such", "that", "the", "their", "then", "there", "these",
+    "they", "this", "to", "was", "will", "with"
+}
+SNIPPET_RADIUS = 80
+
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def build_snippet(texts: Iterable[Optional[str]], terms: Set[str]) -> str:
+    candidates = [text for text in texts if text]
+    for text in candidates:
+        for match in TOKEN_PATTERN.finditer(text):
+            if match.group().lower() in terms:
+                start = max(0, match.start() - SNIPPET_RADIUS)
+                end = min(len(text), match.end() + SNIPPET_RADIUS)
+                return _highlight(text, start, end, terms)
+    if candidates:
+        return _highlight(candidates[0], 0, min(len(candidates[0]), 2 * SNIPPET_RADIUS), terms)
+    return ""
+
+
+def _highlight(text: str, start: int, end: int, terms: Set[str]) -> str:
+    parts = []
+    position = start
+    for match in TOKEN_PATTERN.finditer(text, start, end):
+        if match.group().lower() in terms:
+            parts.append(html.escape(text[position:match.start()]))
+            parts.append(f"<mark>{html.escape(match.group())}</mark>")
+            position = match.end()
+    parts.append(html.escape(text[position:end]))
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(text) else ""
+    return prefix + "".join(parts) + suffix
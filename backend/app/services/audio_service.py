@@ -1,39 +1,52 @@
-import os
-import shutil
+import dataclasses
+import time
+from io import BytesIO
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, List, Optional
 from app.core.config import settings
+from app.core.metrics import ASSEMBLE_SECONDS
+from app.storage.factory import get_chunk_storage
+from app.services.webm_timecodes import TimecodeTap
+from app.storage.interface import ChunkStorage, ChunkTooLargeError, SavedChunk
 
 
 class AudioService:
-    def __init__(self):
-        self.storage_path = Path(settings.AUDIO_STORAGE_PATH)
+    def __init__(self, storage_path: Optional[str] = None, storage: Optional[ChunkStorage] = None):
+        self.storage_path = Path(storage_path or settings.AUDIO_STORAGE_PATH)
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.storage = storage or get_chunk_storage(str(self.storage_path))
     
     def save_chunk(self, recording_id: str, chunk_index: int, chunk_data: bytes) -> str:
-        recording_dir = self.storage_path / recording_id
-        recording_dir.mkdir(parents=True, exist_ok=True)
-        
-        chunk_path = recording_dir / f"chunk_{chunk_index:04d}.webm"
-        with open(chunk_path, "wb") as f:
-            f.write(chunk_data)
-        
-        return str(chunk_path)
+        return self.save_chunk_stream(recording_id, chunk_index, BytesIO(chunk_data)).path
+    
+    def save_chunk_stream(
+        self,
+        recording_id: str,
+        chunk_index: int,
+        source: BinaryIO,
+        max_size: Optional[int] = None,
+        block_size: Optional[int] = None
+    ) -> SavedChunk:
+        tap = TimecodeTap(source)
+        saved = self.storage.write_chunk(
+            recording_id, chunk_index, tap,
+            max_size or settings.MAX_CHUNK_SIZE_BYTES,
+            block_size or settings.CHUNK_WRITE_BLOCK_SIZE
+        )
+        return dataclasses.replace(saved, timeline=tap.parser.timeline())
+    
+    def full_audio_path(self, recording_id: str) -> str:
+        return self.storage.full_audio_path(recording_id)
+    
+    def open_chunks(self, chunk_paths: List[str]) -> BinaryIO:
+        return self.storage.open_chunks(chunk_paths)
     
     def assemble_chunks(self, recording_id: str, chunk_paths: List[str]) -> str:
-        recording_dir = self.storage_path / recording_id
-        final_path = recording_dir / "full_audio.webm"
-        
-        with open(final_path, "wb") as outfile:
-            for chunk_path in sorted(chunk_paths):
-                with open(chunk_path, "rb") as infile:
-                    shutil.copyfileobj(infile, outfile)
-        
-        return str(final_path)
+        start = time.perf_counter()
+        self.storage.sync(recording_id)
+        full_audio_path = self.storage.assemble(chunk_paths, self.full_audio_path(recording_id))
+        ASSEMBLE_SECONDS.labels(type(self.storage).__name__).observe(time.perf_counter() - start)
+        return full_audio_path
     
     def cleanup_chunks(self, chunk_paths: List[str]):
-        for chunk_path in chunk_paths:
-            try:
-                os.remove(chunk_path)
-            except OSError:
-                pass
+        self.storage.delete_chunks(chunk_paths)
@@ -0,0 +1,130 @@
+import bisect
+import io
+import os
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, List, Optional
+
+
+@dataclass(frozen=True)
+class FileRange:
+    path: str
+    offset: int
+    length: int
+    
+    @classmethod
+    def whole_file(cls, path: str) -> "FileRange":
+        return cls(path=path, offset=0, length=os.path.getsize(path))
+
+
+def _open_local(path: str) -> BinaryIO:
+    return open(path, "rb", buffering=0)
+
+
+class ConcatenatedAudioReader(io.RawIOBase):
+    def __init__(self, ranges: List[FileRange], opener: Optional[Callable[[str], BinaryIO]] = None):
+        self.ranges = list(ranges)
+        self.opener = opener or _open_local
+        self.sizes = [file_range.length for file_range in self.ranges]
+        self.offsets = []
+        total = 0
+        for size in self.sizes:
+            self.offsets.append(total)
+            total += size
+        self.length = total
+        self._position = 0
+        self._index: Optional[int] = None
+        self._file: Optional[BinaryIO] = None
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self._position
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.length + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._position = position
+        return position
+    
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast("B")
+        written = 0
+        while written < len(view) and self._position < self.length:
+            index = bisect.bisect_right(self.offsets, self._position) - 1
+            local_offset = self._position - self.offsets[index]
+            available = self.sizes[index] - local_offset
+            if available <= 0:
+                self._position = self.offsets[index] + self.sizes[index]
+                continue
+            source = self._open(index)
+            source.seek(self.ranges[index].offset + local_offset)
+            count = source.readinto(view[written:written + min(len(view) - written, available)])
+            if not count:
+                break
+            written += count
+            self._position += count
+        return written
+    
+    def reopen(self) -> "ConcatenatedAudioReader":
+        return ConcatenatedAudioReader(self.ranges, self.opener)
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        super().close()
+    
+    def _open(self, index: int) -> BinaryIO:
+        if self._index != index:
+            if self._file is not None:
+                self._file.close()
+            self._file = self.opener(self.ranges[index].path)
+            self._index = index
+        return self._file
+
+
+def _copy_file_range(in_fd: int, out_fd: int, offset: int, count: int) -> int:
+    return os.copy_file_range(in_fd, out_fd, count, offset)
+
+
+def _sendfile(in_fd: int, out_fd: int, offset: int, count: int) -> int:
+    return os.sendfile(out_fd, in_fd, offset, count)
+
+
+def _copy_buffered(in_fd: int, out_fd: int, offset: int, count: int) -> int:
+    block = os.pread(in_fd, min(count, 1024 * 1024), offset)
+    view = memoryview(block)
+    while view:
+        view = view[os.write(out_fd, view):]
+    return len(block)
+
+
+def copy_file_range(infile: BinaryIO, outfile: BinaryIO, offset: int, length: int):
+    copied = 0
+    for kernel_copy in (_copy_file_range, _sendfile):
+        try:
+            while copied < length:
+                count = kernel_copy(infile.fileno(), outfile.fileno(), offset + copied, length - copied)
+                if count == 0:
+                    break
+                copied += count
+            return
+        except (AttributeError, OSError):
+            continue
+    while copied < length:
+        count = _copy_buffered(infile.fileno(), outfile.fileno(), offset + copied, length - copied)
+        if count == 0:
+            break
+        copied += count
@@ -1,14 +1,24 @@
-from authlib.integrations.starlette_client import OAuth
+from typing import TYPE_CHECKING, Optional
 from app.core.config import settings
 
-oauth = OAuth()
-
-oauth.register(
-    name='google',
-    client_id=settings.GOOGLE_CLIENT_ID,
-    client_secret=settings.GOOGLE_CLIENT_SECRET,
-    server_metadata_url='https://accounts.google.com/.well-known/openid-configuration',
-    client_kwargs={
-        'scope': 'openid email profile'
-    }
-)
+if TYPE_CHECKING:
+    from authlib.integrations.starlette_client import OAuth
+
+_oauth: Optional["OAuth"] = None
+
+
+def get_oauth() -> "OAuth":
+    global _oauth
+    if _oauth is None:
+        from authlib.integrations.starlette_client import OAuth
+        _oauth = OAuth()
+        _oauth.register(
+            name='google',
+            client_id=settings.GOOGLE_CLIENT_ID,
+            client_secret=settings.GOOGLE_CLIENT_SECRET,
+            server_metadata_url='https://accounts.google.com/.well-known/openid-configuration',
+            client_kwargs={
+                'scope': 'openid email profile'
+            }
+        )
+    return _oauth
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+from typing import Callable, List, Optional, Set
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.llm.interface import AnyLLMProvider
+from app.llm.registry import create_provider
+from app.models import SessionLocal
+from app.models.recording import RecordingChunk, ChunkTranscriptionStatus
+from app.repositories.recording_repository import MySQLRecordingRepository
+from app.services.audio_service import AudioService
+from app.services.transcription_cache import TranscriptionCache, get_transcription_cache
+
+logger = logging.getLogger(__name__)
+
+
+def stitch_partials(chunks: List[RecordingChunk]) -> str:
+    ordered = sorted(chunks, key=lambda c: c.chunk_index)
+    return " ".join(
+        chunk.transcription_text.strip()
+        for chunk in ordered
+        if chunk.transcription_text and chunk.transcription_text.strip()
+    )
+
+
+class ChunkTranscriber:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        provider_factory: Callable[[], AnyLLMProvider] = create_provider,
+        audio_service_factory: Callable[[], AudioService] = AudioService,
+        concurrency: Optional[int] = None,
+        cache: Optional[TranscriptionCache] = None
+    ):
+        self.session_factory = session_factory
+        self.provider_factory = provider_factory
+        self.audio_service_factory = audio_service_factory
+        self.cache = cache or get_transcription_cache()
+        self._semaphore = asyncio.Semaphore(concurrency or settings.CHUNK_TRANSCRIPTION_CONCURRENCY)
+        self._tasks: Set[asyncio.Task] = set()
+    
+    def submit(self, chunk_id: str) -> asyncio.Task:
+        task = asyncio.create_task(self._run(chunk_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+    
+    async def stop(self):
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+    
+    async def transcribe(self, chunk: RecordingChunk, provider: AnyLLMProvider) -> Optional[str]:
+        try:
+            transcription = await self._transcribe_cached(chunk, provider)
+        except Exception as e:
+            logger.warning("Chunk %s of recording %s failed to transcribe: %s", chunk.chunk_index, chunk.recording_id, e)
+            await asyncio.to_thread(self._call, "mark_chunk_transcription_failed", chunk.id)
+            return None
+        await asyncio.to_thread(self._call, "save_chunk_transcription", chunk.id, transcription)
+        return transcription
+    
+    async def complete(self, recording_id: str, provider: AnyLLMProvider) -> str:
+        pending = [
+            chunk for chunk in await asyncio.to_thread(self._call, "list_chunks", recording_id)
+            if chunk.transcription_status != ChunkTranscriptionStatus.done
+        ]
+        results = await asyncio.gather(*(self.transcribe(chunk, provider) for chunk in pending))
+        if any(result is None for result in results):
+            raise RuntimeError(f"{results.count(None)} chunk(s) failed to transcribe")
+        return stitch_partials(await asyncio.to_thread(self._call, "list_chunks", recording_id))
+    
+    async def _transcribe_cached(self, chunk: RecordingChunk, provider: AnyLLMProvider) -> str:
+        with self.audio_service_factory().open_chunks([chunk.audio_blob_path]) as reader:
+            return await self.cache.transcribe(provider, reader, f"chunk_{chunk.chunk_index:04d}.webm", chunk.checksum, self._semaphore)
+    
+    async def _run(self, chunk_id: str) -> Optional[str]:
+        chunk = await asyncio.to_thread(self._call, "get_chunk", chunk_id)
+        if not chunk:
+            return None
+        if chunk.transcription_status == ChunkTranscriptionStatus.done:
+            return chunk.transcription_text
+        return await self.transcribe(chunk, self.provider_factory())
+    
+    def _call(self, method: str, *args):
+        db = self.session_factory()
+        try:
+            return getattr(MySQLRecordingRepository(db), method)(*args)
+        finally:
+            db.close()
+
+
+_chunk_transcriber: Optional[ChunkTranscriber] = None
+
+
+def get_chunk_transcriber() -> ChunkTranscriber:
+    global _chunk_transcriber
+    if _chunk_transcriber is None:
+        _chunk_transcriber = ChunkTranscriber()
+    return _chunk_transcriber
@@ -0,0 +1,83 @@
+import zlib
+from typing import Callable, Iterable, Iterator, Optional
+import orjson
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.recording import Recording
+from app.repositories.pagination import PAGE_ORDER, RecordingCursor, after_cursor, encode_cursor
+
+EXPORT_COLUMNS = (
+    Recording.id,
+    Recording.status,
+    Recording.created_at,
+    Recording.updated_at,
+    Recording.incremental_transcription,
+    Recording.duration_seconds,
+    Recording.size_bytes,
+    Recording.llm_provider,
+    Recording.transcription_text,
+    Recording.notes,
+)
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    for coding in (accept_encoding or "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() == "gzip":
+            return params.replace(" ", "").lower() not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+def export_rows(session_factory: Callable[[], Session], user_id: str, cursor: Optional[RecordingCursor], batch_size: int) -> Iterator:
+    db = session_factory()
+    try:
+        rows = db.execute(
+            select(*EXPORT_COLUMNS).where(
+                Recording.user_id == user_id,
+                after_cursor(cursor)
+            ).order_by(*PAGE_ORDER).execution_options(stream_results=True, yield_per=batch_size)
+        )
+        yield from rows
+    finally:
+        db.close()
+
+
+def ndjson_lines(rows: Iterable) -> Iterator[bytes]:
+    for row in rows:
+        record = row._asdict()
+        record["cursor"] = encode_cursor(row)
+        yield orjson.dumps(record) + b"\n"
+
+
+def buffered(lines: Iterable[bytes], buffer_size: int) -> Iterator[bytes]:
+    buffer = bytearray()
+    for line in lines:
+        buffer += line
+        if len(buffer) >= buffer_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def gzipped(blocks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for block in blocks:
+        compressed = compressor.compress(block)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def export_ndjson(
+    session_factory: Callable[[], Session],
+    user_id: str,
+    cursor: Optional[RecordingCursor] = None,
+    compress: bool = False,
+    batch_size: Optional[int] = None,
+    buffer_size: Optional[int] = None
+) -> Iterator[bytes]:
+    rows = export_rows(session_factory, user_id, cursor, batch_size or settings.EXPORT_BATCH_SIZE)
+    blocks = buffered(ndjson_lines(rows), buffer_size or settings.EXPORT_BUFFER_BYTES)
+    return gzipped(blocks) if compress else blocks
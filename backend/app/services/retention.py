@@ -0,0 +1,228 @@
+import argparse
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import groupby, islice
+from operator import attrgetter
+from pathlib import PurePosixPath
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import delete, exists, or_, select, update
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.metrics import RETENTION_BYTES_RECLAIMED, RETENTION_FILES_DELETED
+from app.models import SessionLocal
+from app.models.recording import Recording, RecordingChunk, RecordingStatus
+from app.models.transcription_job import TranscriptionJob, TranscriptionJobStatus
+from app.repositories.versioning import bump_list_version
+from app.services.audio_service import AudioService
+from app.storage.interface import ChunkStorage, StoredObject
+from app.storage.local import SEGMENT_INDEX_SUFFIX, locator_path
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_JOB_STATUSES = (TranscriptionJobStatus.queued, TranscriptionJobStatus.running)
+
+
+@dataclass
+class SweepReport:
+    dry_run: bool
+    recordings: int = 0
+    files: int = 0
+    bytes: int = 0
+    orphan_files: int = 0
+    orphan_bytes: int = 0
+
+
+class DeletePacer:
+    def __init__(self, per_second: float):
+        self.interval = 1.0 / per_second if per_second > 0 else 0.0
+        self._next = 0.0
+    
+    def wait(self):
+        if not self.interval:
+            return
+        now = time.monotonic()
+        if self._next > now:
+            time.sleep(self._next - now)
+            now = self._next
+        self._next = now + self.interval
+
+
+def stored_names(locator: str) -> Tuple[str, ...]:
+    name = PurePosixPath(locator_path(locator)).name
+    return name, str(PurePosixPath(name).with_suffix(SEGMENT_INDEX_SUFFIX))
+
+
+def expired_recordings_query(status: RecordingStatus, cutoff: datetime, after: str, limit: int):
+    has_chunks = exists().where(RecordingChunk.recording_id == Recording.id)
+    fresh_chunks = exists().where(RecordingChunk.recording_id == Recording.id, RecordingChunk.uploaded_at >= cutoff)
+    active_job = exists().where(TranscriptionJob.recording_id == Recording.id, TranscriptionJob.status.in_(ACTIVE_JOB_STATUSES))
+    return select(Recording.id, Recording.user_id).where(
+        Recording.status == status,
+        Recording.updated_at < cutoff,
+        Recording.id > after,
+        or_(Recording.audio_file_path.isnot(None), has_chunks),
+        ~fresh_chunks,
+        ~active_job
+    ).order_by(Recording.id).limit(limit)
+
+
+def referenced_names(db: Session, recording_ids: List[str]) -> Dict[str, Set[str]]:
+    names = {recording_id: set() for recording_id in db.scalars(select(Recording.id).where(Recording.id.in_(recording_ids)))}
+    locators = db.execute(
+        select(RecordingChunk.recording_id, RecordingChunk.audio_blob_path).where(RecordingChunk.recording_id.in_(recording_ids))
+        .union_all(select(Recording.id, Recording.audio_file_path).where(Recording.id.in_(recording_ids), Recording.audio_file_path.isnot(None)))
+    )
+    for recording_id, locator in locators:
+        names[recording_id].update(stored_names(locator))
+    return names
+
+
+def _batches(items: Iterable, size: int) -> Iterable[list]:
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+class RetentionSweeper:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        storage: Optional[ChunkStorage] = None,
+        retention_days: Optional[Dict[str, float]] = None,
+        interval: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        deletes_per_second: Optional[float] = None,
+        orphan_grace: Optional[timedelta] = None,
+        dry_run: Optional[bool] = None
+    ):
+        days = retention_days if retention_days is not None else settings.RETENTION_DAYS
+        self.session_factory = session_factory
+        self.storage = storage
+        self.retention = {RecordingStatus(status): timedelta(days=age) for status, age in days.items()}
+        self.interval = interval if interval is not None else settings.RETENTION_SWEEP_INTERVAL_SECONDS
+        self.batch_size = batch_size or settings.RETENTION_BATCH_SIZE
+        self.deletes_per_second = deletes_per_second if deletes_per_second is not None else settings.RETENTION_DELETES_PER_SECOND
+        self.orphan_grace = orphan_grace if orphan_grace is not None else timedelta(minutes=settings.RETENTION_ORPHAN_GRACE_MINUTES)
+        self.dry_run = dry_run if dry_run is not None else settings.RETENTION_DRY_RUN
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+    
+    def sweep(self) -> SweepReport:
+        if self.storage is None:
+            self.storage = AudioService().storage
+        report = SweepReport(self.dry_run)
+        pacer = DeletePacer(self.deletes_per_second)
+        db = self.session_factory()
+        try:
+            now = datetime.utcnow()
+            for status, age in self.retention.items():
+                self._expire(db, status, now - age, pacer, report)
+            self._reconcile(db, time.time() - self.orphan_grace.total_seconds(), pacer, report)
+        finally:
+            db.close()
+        logger.info(
+            "%s %d file(s) (%d bytes) from %d expired recording(s) and %d orphaned file(s) (%d bytes)",
+            "Would delete" if self.dry_run else "Deleted",
+            report.files, report.bytes, report.recordings, report.orphan_files, report.orphan_bytes
+        )
+        return report
+    
+    def _expire(self, db: Session, status: RecordingStatus, cutoff: datetime, pacer: DeletePacer, report: SweepReport):
+        after = ""
+        while True:
+            batch = db.execute(expired_recordings_query(status, cutoff, after, self.batch_size)).all()
+            if not batch:
+                return
+            after = batch[-1].id
+            recording_ids = [row.id for row in batch]
+            if self.dry_run:
+                db.rollback()
+            else:
+                db.execute(delete(RecordingChunk).where(RecordingChunk.recording_id.in_(recording_ids)))
+                db.execute(
+                    update(Recording).where(Recording.id.in_(recording_ids))
+                    .values(audio_file_path=None, updated_at=Recording.updated_at)
+                )
+                for user_id in {row.user_id for row in batch}:
+                    db.execute(bump_list_version(user_id))
+                db.commit()
+            report.recordings += len(batch)
+            for recording_id in recording_ids:
+                try:
+                    for stored in self.storage.list_objects(recording_id):
+                        self._delete(stored, "expired", pacer)
+                        report.files += 1
+                        report.bytes += stored.size_bytes
+                except Exception:
+                    logger.exception("Failed to delete files of expired recording %s; leaving them to the orphan sweep", recording_id)
+    
+    def _reconcile(self, db: Session, cutoff: float, pacer: DeletePacer, report: SweepReport):
+        owners = ((recording_id, list(objects)) for recording_id, objects in groupby(self.storage.list_objects(), key=attrgetter("recording_id")))
+        for batch in _batches(owners, self.batch_size):
+            stored_by_recording = dict(batch)
+            names = referenced_names(db, list(stored_by_recording))
+            db.rollback()
+            for recording_id, objects in stored_by_recording.items():
+                referenced = names.get(recording_id, ())
+                for stored in objects:
+                    if stored.modified_at < cutoff and stored.name not in referenced:
+                        self._delete(stored, "orphan", pacer)
+                        report.orphan_files += 1
+                        report.orphan_bytes += stored.size_bytes
+    
+    def _delete(self, stored: StoredObject, reason: str, pacer: DeletePacer):
+        if self.dry_run:
+            return
+        pacer.wait()
+        self.storage.delete_chunks([stored.locator])
+        RETENTION_FILES_DELETED.labels(reason).inc()
+        RETENTION_BYTES_RECLAIMED.labels(reason).inc(stored.size_bytes)
+    
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await asyncio.to_thread(self.sweep)
+            except Exception:
+                logger.exception("Retention sweep failed")
+
+
+_retention_sweeper: Optional[RetentionSweeper] = None
+
+
+def get_retention_sweeper() -> RetentionSweeper:
+    global _retention_sweeper
+    if _retention_sweeper is None:
+        _retention_sweeper = RetentionSweeper()
+    return _retention_sweeper
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Delete expired recording audio and orphaned storage files")
+    parser.add_argument("--dry-run", action="store_true", default=settings.RETENTION_DRY_RUN)
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    report = RetentionSweeper(dry_run=args.dry_run).sweep()
+    print(
+        f"{'Would reclaim' if args.dry_run else 'Reclaimed'} {report.bytes + report.orphan_bytes} bytes "
+        f"in {report.files + report.orphan_files} file(s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
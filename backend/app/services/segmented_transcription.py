@@ -0,0 +1,136 @@
+import asyncio
+import difflib
+import logging
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+from app.core.config import settings
+from app.llm.interface import AnyLLMProvider
+from app.models.recording import RecordingChunk
+from app.services.audio_service import AudioService
+from app.services.transcription_cache import TranscriptionCache
+from app.services.webm_timecodes import WEBM_CLUSTER_ID
+from app.storage.local import format_range_locator, resolve_locator
+
+logger = logging.getLogger(__name__)
+
+HEADER_SCAN_BYTES = 256 * 1024
+WORD = re.compile(r"\S+")
+
+
+@dataclass(frozen=True)
+class Segment:
+    index: int
+    start: int
+    end: int
+
+
+def plan_segments(durations: Sequence[float], segment_seconds: float, overlap_seconds: float) -> List[Segment]:
+    segments = []
+    start = 0
+    while start < len(durations):
+        end = start
+        length = 0.0
+        while end < len(durations) and (end == start or length + durations[end] <= segment_seconds):
+            length += durations[end]
+            end += 1
+        segments.append(Segment(len(segments), start, end))
+        if end >= len(durations):
+            break
+        overlap = 0.0
+        next_start = end
+        while next_start - 1 > start and overlap < overlap_seconds:
+            next_start -= 1
+            overlap += durations[next_start]
+        start = next_start
+    return segments
+
+
+def _normalize(word: str) -> str:
+    return re.sub(r"[^\w']", "", word.lower())
+
+
+def stitch_segments(texts: Sequence[str], window: int = 60, min_match: int = 3) -> str:
+    words: List[str] = []
+    for text in texts:
+        incoming = WORD.findall(text or "")
+        if not words:
+            words = incoming
+            continue
+        tail_start = max(0, len(words) - window)
+        tail = [_normalize(word) for word in words[tail_start:]]
+        head = [_normalize(word) for word in incoming[:window]]
+        match = difflib.SequenceMatcher(None, tail, head, autojunk=False).find_longest_match(0, len(tail), 0, len(head))
+        if match.size >= min_match:
+            words = words[:tail_start + match.a] + incoming[match.b:]
+        else:
+            words = words + incoming
+    return " ".join(words)
+
+
+def webm_header_length(data: bytes) -> int:
+    position = data.find(WEBM_CLUSTER_ID)
+    return position if position > 0 else 0
+
+
+class SegmentedTranscriber:
+    def __init__(
+        self,
+        cache: TranscriptionCache,
+        segment_seconds: Optional[float] = None,
+        overlap_seconds: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        retry_delay: Optional[float] = None
+    ):
+        self.cache = cache
+        self.segment_seconds = segment_seconds or settings.TRANSCRIPTION_SEGMENT_SECONDS
+        self.overlap_seconds = overlap_seconds if overlap_seconds is not None else settings.TRANSCRIPTION_SEGMENT_OVERLAP_SECONDS
+        self.concurrency = concurrency or settings.TRANSCRIPTION_SEGMENT_CONCURRENCY
+        self.max_attempts = max_attempts or settings.TRANSCRIPTION_SEGMENT_MAX_ATTEMPTS
+        self.retry_delay = retry_delay if retry_delay is not None else settings.TRANSCRIPTION_RETRY_DELAY_SECONDS
+    
+    def plan(self, chunks: Sequence[RecordingChunk]) -> List[Segment]:
+        durations = [chunk.duration_seconds or settings.CHUNK_DEFAULT_DURATION_SECONDS for chunk in chunks]
+        return plan_segments(durations, self.segment_seconds, self.overlap_seconds)
+    
+    async def transcribe(self, provider: AnyLLMProvider, audio_service: AudioService, chunks: Sequence[RecordingChunk]) -> str:
+        locators = [chunk.audio_blob_path for chunk in chunks]
+        segments = self.plan(chunks)
+        if len(segments) == 1:
+            return await self._transcribe_cached(provider, audio_service, locators, "full_audio.webm")
+        
+        header = await asyncio.to_thread(self._header_locator, audio_service, locators[0])
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def run(segment: Segment) -> str:
+            segment_locators = locators[segment.start:segment.end]
+            if segment.start > 0 and header:
+                segment_locators = [header] + segment_locators
+            async with semaphore:
+                return await self._transcribe_segment(provider, audio_service, segment, segment_locators)
+        
+        texts = await asyncio.gather(*(run(segment) for segment in segments))
+        return stitch_segments(texts)
+    
+    async def _transcribe_segment(self, provider: AnyLLMProvider, audio_service: AudioService, segment: Segment, locators: List[str]) -> str:
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return await self._transcribe_cached(provider, audio_service, locators, f"segment_{segment.index:04d}.webm")
+            except Exception as e:
+                if attempt == self.max_attempts:
+                    raise
+                logger.warning("Segment %d (chunks %d-%d) attempt %d failed: %s", segment.index, segment.start, segment.end - 1, attempt, e)
+                await asyncio.sleep(self.retry_delay * 2 ** (attempt - 1))
+    
+    async def _transcribe_cached(self, provider: AnyLLMProvider, audio_service: AudioService, locators: List[str], filename: str) -> str:
+        with audio_service.open_chunks(locators) as reader:
+            return await self.cache.transcribe(provider, reader, filename)
+    
+    def _header_locator(self, audio_service: AudioService, first_locator: str) -> Optional[str]:
+        with audio_service.open_chunks([first_locator]) as reader:
+            length = webm_header_length(reader.read(HEADER_SCAN_BYTES))
+        if not length:
+            return None
+        first = resolve_locator(first_locator)
+        return format_range_locator(first.path, first.offset, length)
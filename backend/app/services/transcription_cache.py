@@ -0,0 +1,175 @@
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+from datetime import datetime
+from typing import BinaryIO, Callable, Dict, Optional, Set, Tuple
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.llm.interface import AnyLLMProvider, call_provider
+from app.models import SessionLocal
+from app.repositories.transcription_cache_repository import MySQLTranscriptionCacheRepository
+
+logger = logging.getLogger(__name__)
+
+EVICTION_LOW_WATER = 0.9
+
+
+def provider_identity(provider) -> Tuple[str, str]:
+    return getattr(provider, "name", type(provider).__name__), getattr(provider, "version", "1")
+
+
+def hash_stream(stream: BinaryIO, block_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    while True:
+        block = stream.read(block_size)
+        if not block:
+            return digest.hexdigest()
+        digest.update(block)
+
+
+class TranscriptionCache:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        memory_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        enabled: Optional[bool] = None,
+        touch_interval: Optional[float] = None
+    ):
+        self.session_factory = session_factory
+        self.memory_entries = memory_entries if memory_entries is not None else settings.TRANSCRIPTION_CACHE_MEMORY_ENTRIES
+        self.max_bytes = max_bytes if max_bytes is not None else settings.TRANSCRIPTION_CACHE_MAX_BYTES
+        self.enabled = enabled if enabled is not None else settings.TRANSCRIPTION_CACHE_ENABLED
+        self.touch_interval = touch_interval if touch_interval is not None else settings.TRANSCRIPTION_CACHE_TOUCH_INTERVAL_SECONDS
+        self.memory_hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._touched: Set[str] = set()
+        self._touched_flushed = time.monotonic()
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(provider, content_hash: str) -> str:
+        name, version = provider_identity(provider)
+        return f"{name}:{version}:{content_hash}"
+    
+    async def get(self, provider, content_hash: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        key = self.make_key(provider, content_hash)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._touched.add(key)
+                self.memory_hits += 1
+                return self._memory[key]
+        
+        transcription = await asyncio.to_thread(self._load, key)
+        
+        with self._lock:
+            if transcription is None:
+                self.misses += 1
+                return None
+            self.persistent_hits += 1
+            self._touched.add(key)
+            self._remember(key, transcription)
+        return transcription
+    
+    async def put(self, provider, content_hash: str, transcription: str):
+        if not self.enabled:
+            return
+        key = self.make_key(provider, content_hash)
+        with self._lock:
+            self._remember(key, transcription)
+        await asyncio.to_thread(self._store, key, content_hash, provider_identity(provider), transcription)
+    
+    async def transcribe(
+        self,
+        provider: AnyLLMProvider,
+        reader: BinaryIO,
+        filename: str,
+        content_hash: Optional[str] = None,
+        limiter: Optional[asyncio.Semaphore] = None
+    ) -> str:
+        content_hash = content_hash or await asyncio.to_thread(hash_stream, reader)
+        cached = await self.get(provider, content_hash)
+        if cached is not None:
+            return cached
+        reader.seek(0)
+        async with limiter or nullcontext():
+            transcription = await call_provider(provider.transcribe_stream, reader, filename)
+        await self.put(provider, content_hash, transcription)
+        return transcription
+    
+    def _load(self, key: str) -> Optional[str]:
+        db = self.session_factory()
+        try:
+            repo = MySQLTranscriptionCacheRepository(db)
+            entry = repo.get_entry(key)
+            transcription = entry.transcription if entry else None
+            self._flush_touched(repo)
+            return transcription
+        finally:
+            db.close()
+    
+    def _store(self, key: str, content_hash: str, identity: Tuple[str, str], transcription: str):
+        db = self.session_factory()
+        try:
+            repo = MySQLTranscriptionCacheRepository(db)
+            added = repo.put_entry(key, content_hash, *identity, transcription)
+            with self._db_lock:
+                if self._size is None:
+                    self._size = repo.total_size()
+                else:
+                    self._size += added
+                if self._size <= self.max_bytes:
+                    self._flush_touched(repo)
+                    return
+                self._flush_touched(repo, force=True)
+                self._size = repo.total_size()
+                if self._size > self.max_bytes:
+                    evicted, freed = repo.evict_oldest(self._size - int(self.max_bytes * EVICTION_LOW_WATER))
+                    self._size -= freed
+                    logger.info("Evicted %d transcription cache entries", evicted)
+        finally:
+            db.close()
+    
+    def _flush_touched(self, repo: MySQLTranscriptionCacheRepository, force: bool = False):
+        with self._lock:
+            if not self._touched or (not force and time.monotonic() - self._touched_flushed < self.touch_interval):
+                return
+            keys, self._touched = list(self._touched), set()
+            self._touched_flushed = time.monotonic()
+        repo.touch_entries(keys, datetime.utcnow())
+    
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "memory_hits": self.memory_hits,
+                "persistent_hits": self.persistent_hits,
+                "misses": self.misses,
+                "memory_entries": len(self._memory)
+            }
+    
+    def _remember(self, key: str, transcription: str):
+        self._memory[key] = transcription
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+
+_transcription_cache: Optional[TranscriptionCache] = None
+
+
+def get_transcription_cache() -> TranscriptionCache:
+    global _transcription_cache
+    if _transcription_cache is None:
+        _transcription_cache = TranscriptionCache()
+    return _transcription_cache
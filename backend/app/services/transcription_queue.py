@@ -0,0 +1,191 @@
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Callable, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.metrics import TRANSCRIPTION_QUEUE_DEPTH
+from app.llm.interface import AnyLLMProvider
+from app.llm.registry import create_provider, provider_used
+from app.models import SessionLocal
+from app.models.recording import Recording, RecordingChunk
+from app.models.transcription_job import TranscriptionJob
+from app.repositories.recording_repository import MySQLRecordingRepository
+from app.repositories.transcription_job_repository import MySQLTranscriptionJobRepository
+from app.services.audio_service import AudioService
+from app.services.chunk_transcriber import ChunkTranscriber, get_chunk_transcriber
+from app.services.segmented_transcription import SegmentedTranscriber
+from app.services.transcription_cache import TranscriptionCache, get_transcription_cache
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptionQueue:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        provider_factory: Callable[[], AnyLLMProvider] = create_provider,
+        audio_service_factory: Callable[[], AudioService] = AudioService,
+        chunk_transcriber: Optional[ChunkTranscriber] = None,
+        cache: Optional[TranscriptionCache] = None,
+        segmented_transcriber: Optional[SegmentedTranscriber] = None,
+        concurrency: Optional[int] = None,
+        retry_delay: Optional[float] = None,
+        lease: Optional[timedelta] = None,
+        heartbeat_interval: Optional[float] = None,
+        recovery_interval: Optional[float] = None
+    ):
+        self.session_factory = session_factory
+        self.provider_factory = provider_factory
+        self.audio_service_factory = audio_service_factory
+        self.chunk_transcriber = chunk_transcriber or get_chunk_transcriber()
+        self.cache = cache or get_transcription_cache()
+        self.segmented_transcriber = segmented_transcriber or SegmentedTranscriber(self.cache)
+        self.concurrency = concurrency or settings.TRANSCRIPTION_WORKERS
+        self.retry_delay = retry_delay if retry_delay is not None else settings.TRANSCRIPTION_RETRY_DELAY_SECONDS
+        self.lease = lease if lease is not None else timedelta(minutes=settings.TRANSCRIPTION_STALE_JOB_MINUTES)
+        self.heartbeat_interval = heartbeat_interval or settings.TRANSCRIPTION_HEARTBEAT_SECONDS
+        self.recovery_interval = recovery_interval or settings.TRANSCRIPTION_RECOVERY_INTERVAL_SECONDS
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+    
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue else 0
+    
+    async def start(self):
+        self._queue = asyncio.Queue()
+        for job_id in await asyncio.to_thread(self._recover_jobs):
+            self._queue.put_nowait(job_id)
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        self._workers.append(asyncio.create_task(self._recover_stale_jobs()))
+    
+    async def stop(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+    
+    def enqueue(self, job_id: str):
+        if self._queue is None:
+            raise RuntimeError("Transcription queue is not running")
+        self._queue.put_nowait(job_id)
+    
+    async def _worker(self):
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            except Exception:
+                logger.exception("Transcription job %s crashed", job_id)
+            finally:
+                self._queue.task_done()
+    
+    async def _run(self, job_id: str):
+        job = await asyncio.to_thread(self._call, "claim_job", job_id)
+        if job is None:
+            return
+        audio_service = self.audio_service_factory()
+        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+        try:
+            chunk_paths = await self._process(job, audio_service)
+        except Exception as e:
+            logger.warning("Transcription job %s attempt %d failed: %s", job_id, job.attempts, e)
+            if job.attempts < job.max_attempts:
+                await asyncio.to_thread(self._call, "requeue_job", job_id, str(e))
+                self._schedule_retry(job_id, job.attempts)
+            else:
+                await asyncio.to_thread(self._call, "mark_failed", job_id, str(e))
+            return
+        finally:
+            heartbeat.cancel()
+        
+        if chunk_paths:
+            await asyncio.to_thread(audio_service.cleanup_chunks, chunk_paths)
+    
+    async def _process(self, job: TranscriptionJob, audio_service: AudioService) -> Optional[List[str]]:
+        loaded = await asyncio.to_thread(self._load, job.recording_id)
+        if loaded is None:
+            logger.warning("Transcription job %s refers to missing recording %s", job.id, job.recording_id)
+            await asyncio.to_thread(self._call, "mark_failed", job.id, "Recording not found")
+            return None
+        recording, chunks = loaded
+        provider = self.provider_factory()
+        if recording.incremental_transcription:
+            transcription = await self.chunk_transcriber.complete(recording.id, provider)
+        else:
+            transcription = await self.segmented_transcriber.transcribe(provider, audio_service, chunks)
+        chunk_paths = [chunk.audio_blob_path for chunk in chunks]
+        full_audio_path = await asyncio.to_thread(audio_service.assemble_chunks, recording.id, chunk_paths)
+        await asyncio.to_thread(self._finish, job, full_audio_path, transcription, provider_used(provider))
+        return chunk_paths
+    
+    async def _heartbeat(self, job_id: str):
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                await asyncio.to_thread(self._call, "heartbeat", job_id)
+            except Exception:
+                logger.exception("Transcription job %s heartbeat failed", job_id)
+    
+    async def _recover_stale_jobs(self):
+        while True:
+            await asyncio.sleep(self.recovery_interval)
+            try:
+                job_ids = await asyncio.to_thread(self._call, "requeue_stale_jobs", self.lease)
+            except Exception:
+                logger.exception("Stale transcription job recovery failed")
+                continue
+            for job_id in job_ids:
+                logger.warning("Requeued transcription job %s after its lease expired", job_id)
+                self._queue.put_nowait(job_id)
+    
+    def _recover_jobs(self) -> List[str]:
+        db = self.session_factory()
+        try:
+            jobs = MySQLTranscriptionJobRepository(db)
+            jobs.requeue_stale_jobs(self.lease)
+            return jobs.list_queued_job_ids()
+        finally:
+            db.close()
+    
+    def _load(self, recording_id: str) -> Optional[Tuple[Recording, List[RecordingChunk]]]:
+        db = self.session_factory()
+        try:
+            recordings = MySQLRecordingRepository(db)
+            recording = recordings.get_recording(recording_id)
+            if recording is None:
+                return None
+            return recording, recordings.list_chunks(recording.id)
+        finally:
+            db.close()
+    
+    def _finish(self, job: TranscriptionJob, full_audio_path: str, transcription: str, llm_provider: Optional[str]):
+        db = self.session_factory()
+        try:
+            MySQLRecordingRepository(db).mark_ended(job.recording_id, full_audio_path, transcription, llm_provider)
+            MySQLTranscriptionJobRepository(db).mark_done(job.id)
+        finally:
+            db.close()
+    
+    def _call(self, method: str, *args):
+        db = self.session_factory()
+        try:
+            return getattr(MySQLTranscriptionJobRepository(db), method)(*args)
+        finally:
+            db.close()
+    
+    def _schedule_retry(self, job_id: str, attempts: int):
+        delay = self.retry_delay * 2 ** (attempts - 1)
+        asyncio.get_running_loop().call_later(delay, self._queue.put_nowait, job_id)
+
+
+_transcription_queue: Optional[TranscriptionQueue] = None
+
+
+def get_transcription_queue() -> TranscriptionQueue:
+    global _transcription_queue
+    if _transcription_queue is None:
+        _transcription_queue = TranscriptionQueue()
+        TRANSCRIPTION_QUEUE_DEPTH.set_function(lambda: _transcription_queue.depth)
+    return _transcription_queue
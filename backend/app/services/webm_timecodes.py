@@ -0,0 +1,201 @@
+import re
+from dataclasses import dataclass
+from typing import BinaryIO, Optional, Tuple, Union
+
+EBML_HEADER_ID = 0x1A45DFA3
+SEGMENT_ID = 0x18538067
+INFO_ID = 0x1549A966
+TIMECODE_SCALE_ID = 0x2AD7B1
+CLUSTER_ID = 0x1F43B675
+CLUSTER_TIMECODE_ID = 0xE7
+BLOCK_GROUP_ID = 0xA0
+BLOCK_ID = 0xA1
+SIMPLE_BLOCK_ID = 0xA3
+
+CONTAINER_IDS = {SEGMENT_ID, INFO_ID, CLUSTER_ID, BLOCK_GROUP_ID}
+VALUE_IDS = {TIMECODE_SCALE_ID, CLUSTER_TIMECODE_ID}
+BLOCK_IDS = {SIMPLE_BLOCK_ID, BLOCK_ID}
+
+WEBM_EBML_HEADER_ID = EBML_HEADER_ID.to_bytes(4, "big")
+WEBM_CLUSTER_ID = CLUSTER_ID.to_bytes(4, "big")
+CLUSTER_PATTERN = re.compile(re.escape(WEBM_CLUSTER_ID))
+DEFAULT_TIMECODE_SCALE = 1_000_000
+LOOKAHEAD_BYTES = 32
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def read_vint(view: memoryview, position: int, keep_marker: bool = False) -> Optional[Tuple[int, int]]:
+    if position >= len(view):
+        return None
+    first = view[position]
+    length = 9 - first.bit_length()
+    if length > 8:
+        raise ValueError("Invalid EBML variable-length integer")
+    if position + length > len(view):
+        return None
+    value = first if keep_marker else first & (0xFF >> length)
+    for offset in range(1, length):
+        value = (value << 8) | view[position + offset]
+    return value, length
+
+
+def is_unknown_size(value: int, length: int) -> bool:
+    return value == (1 << (7 * length)) - 1
+
+
+@dataclass(frozen=True)
+class ChunkTimeline:
+    start_ms: Optional[int]
+    end_ms: Optional[int]
+    blocks: int
+    
+    @property
+    def duration_seconds(self) -> Optional[float]:
+        if self.start_ms is None:
+            return None
+        return (self.end_ms - self.start_ms) / 1000
+
+
+class WebMTimecodeParser:
+    def __init__(self, timecode_scale: int = DEFAULT_TIMECODE_SCALE):
+        self.timecode_scale = timecode_scale
+        self.cluster_timecode: Optional[int] = None
+        self.first_tick: Optional[int] = None
+        self.last_tick: Optional[int] = None
+        self.frame_ticks = 0
+        self.blocks = 0
+        self._synced = False
+        self._skip = 0
+        self._carry = b""
+    
+    def feed(self, data: Buffer):
+        view = memoryview(data).cast("B")
+        if self._carry:
+            carried = len(self._carry)
+            joined = memoryview(self._carry + view[:LOOKAHEAD_BYTES].tobytes())
+            consumed = self._parse(joined)
+            if consumed < carried:
+                self._carry = joined[consumed:].tobytes()
+                return
+            view = view[consumed - carried:]
+            self._carry = b""
+        consumed = self._parse(view)
+        self._carry = view[consumed:].tobytes()
+    
+    def timeline(self) -> ChunkTimeline:
+        if self.first_tick is None:
+            return ChunkTimeline(None, None, 0)
+        return ChunkTimeline(
+            self._to_ms(self.first_tick),
+            self._to_ms(self.last_tick + self.frame_ticks),
+            self.blocks
+        )
+    
+    def _to_ms(self, ticks: int) -> int:
+        return round(ticks * self.timecode_scale / 1_000_000)
+    
+    def _parse(self, view: memoryview) -> int:
+        position = 0
+        while position < len(view):
+            if self._skip:
+                count = min(self._skip, len(view) - position)
+                self._skip -= count
+                position += count
+                continue
+            if not self._synced:
+                position, self._synced = self._sync(view, position)
+                if not self._synced:
+                    return position
+            try:
+                consumed = self._element(view, position)
+            except ValueError:
+                self._synced = False
+                position += 1
+                continue
+            if consumed is None:
+                return position
+            position = consumed
+        return position
+    
+    def _element(self, view: memoryview, position: int) -> Optional[int]:
+        element_id = read_vint(view, position, keep_marker=True)
+        size = element_id and read_vint(view, position + element_id[1])
+        if size is None:
+            return None
+        if element_id[1] > 4:
+            raise ValueError("Invalid EBML element ID")
+        
+        body = position + element_id[1] + size[1]
+        if element_id[0] in CONTAINER_IDS:
+            if element_id[0] == CLUSTER_ID:
+                self.cluster_timecode = None
+            return body
+        if is_unknown_size(*size):
+            self._synced = False
+            return body
+        if element_id[0] in VALUE_IDS and size[0] <= 8:
+            if body + size[0] > len(view):
+                return None
+            value = int.from_bytes(view[body:body + size[0]], "big")
+            if element_id[0] == TIMECODE_SCALE_ID:
+                self.timecode_scale = value
+            else:
+                self.cluster_timecode = value
+            return body + size[0]
+        if element_id[0] in BLOCK_IDS:
+            track = read_vint(view, body)
+            if track is None or body + track[1] + 2 > len(view):
+                return None
+            self._record_block(int.from_bytes(view[body + track[1]:body + track[1] + 2], "big", signed=True))
+        self._skip = size[0]
+        return body
+    
+    def _sync(self, view: memoryview, position: int) -> Tuple[int, bool]:
+        if len(view) - position < 4:
+            return position, False
+        if view[position:position + 4] == WEBM_EBML_HEADER_ID:
+            return position, True
+        while True:
+            match = CLUSTER_PATTERN.search(view, position)
+            if match is None:
+                return max(position, len(view) - 3), False
+            start = match.start()
+            try:
+                size = read_vint(view, start + 4)
+                child = size and read_vint(view, start + 4 + size[1], keep_marker=True)
+            except ValueError:
+                child = (None, 0)
+            if child is None:
+                return start, False
+            if child[0] == CLUSTER_TIMECODE_ID:
+                return start, True
+            position = start + 1
+    
+    def _record_block(self, relative: int):
+        if self.cluster_timecode is None:
+            return
+        tick = self.cluster_timecode + relative
+        if self.last_tick is not None and tick > self.last_tick:
+            self.frame_ticks = tick - self.last_tick
+        self.first_tick = tick if self.first_tick is None else min(self.first_tick, tick)
+        self.last_tick = tick if self.last_tick is None else max(self.last_tick, tick)
+        self.blocks += 1
+
+
+def parse_timeline(data: Buffer) -> ChunkTimeline:
+    parser = WebMTimecodeParser()
+    parser.feed(data)
+    return parser.timeline()
+
+
+class TimecodeTap:
+    def __init__(self, source: BinaryIO, parser: Optional[WebMTimecodeParser] = None):
+        self.source = source
+        self.parser = parser or WebMTimecodeParser()
+    
+    def read(self, size: int = -1) -> bytes:
+        block = self.source.read(size)
+        if block:
+            self.parser.feed(block)
+        return block
@@ -0,0 +1,41 @@
+import hashlib
+import os
+import tempfile
+from typing import BinaryIO
+from app.storage.interface import ChunkTooLargeError, SavedChunk
+from app.storage.local import LocalChunkStorage
+
+
+class DirectoryChunkStorage(LocalChunkStorage):
+    def chunk_path(self, recording_id: str, chunk_index: int) -> str:
+        return str(self.recording_dir(recording_id) / f"chunk_{chunk_index:04d}.webm")
+    
+    def write_chunk(self, recording_id: str, chunk_index: int, source: BinaryIO, max_size: int, block_size: int) -> SavedChunk:
+        recording_dir = self.recording_dir(recording_id)
+        recording_dir.mkdir(parents=True, exist_ok=True)
+        
+        chunk_path = self.chunk_path(recording_id, chunk_index)
+        digest = hashlib.sha256()
+        size = 0
+        
+        fd, temp_path = tempfile.mkstemp(dir=recording_dir, prefix=f"{os.path.basename(chunk_path)}.", suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                while True:
+                    block = source.read(block_size)
+                    if not block:
+                        break
+                    size += len(block)
+                    if size > max_size:
+                        raise ChunkTooLargeError(f"Chunk exceeds maximum size of {max_size} bytes")
+                    digest.update(block)
+                    f.write(block)
+            os.replace(temp_path, chunk_path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+        
+        return SavedChunk(path=chunk_path, size_bytes=size, checksum=digest.hexdigest())
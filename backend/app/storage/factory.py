@@ -0,0 +1,31 @@
+from functools import lru_cache
+from typing import Optional
+from app.core.config import settings
+from app.storage.directory import DirectoryChunkStorage
+from app.storage.interface import ChunkStorage
+from app.storage.s3 import S3ChunkStorage, S3Client
+from app.storage.segment import SegmentChunkStorage
+
+
+def create_chunk_storage(storage_path: Optional[str] = None, backend: Optional[str] = None) -> ChunkStorage:
+    root = storage_path or settings.AUDIO_STORAGE_PATH
+    backend = backend or settings.AUDIO_STORAGE_BACKEND
+    if backend == "segment":
+        return SegmentChunkStorage(root, settings.SEGMENT_FSYNC_MODE, settings.SEGMENT_FSYNC_BATCH_SIZE)
+    if backend == "directory":
+        return DirectoryChunkStorage(root)
+    if backend == "s3":
+        client = S3Client(
+            settings.S3_ENDPOINT_URL,
+            settings.S3_BUCKET,
+            settings.S3_REGION,
+            settings.S3_ACCESS_KEY_ID,
+            settings.S3_SECRET_ACCESS_KEY
+        )
+        return S3ChunkStorage(client, settings.S3_PREFIX, settings.S3_MIN_PART_SIZE_BYTES)
+    raise ValueError(f"Unknown audio storage backend: {backend}")
+
+
+@lru_cache
+def get_chunk_storage(storage_path: str) -> ChunkStorage:
+    return create_chunk_storage(storage_path)
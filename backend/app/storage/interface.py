@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, List, Optional, Protocol
+from app.services.webm_timecodes import ChunkTimeline
+
+
+class ChunkTooLargeError(ValueError):
+    pass
+
+
+@dataclass
+class SavedChunk:
+    path: str
+    size_bytes: int
+    checksum: str
+    timeline: Optional[ChunkTimeline] = None
+
+
+@dataclass
+class StoredObject:
+    recording_id: str
+    name: str
+    locator: str
+    size_bytes: int
+    modified_at: float
+
+
+class ChunkStorage(Protocol):
+    def full_audio_path(self, recording_id: str) -> str:
+        ...
+    
+    def write_chunk(self, recording_id: str, chunk_index: int, source: BinaryIO, max_size: int, block_size: int) -> SavedChunk:
+        ...
+    
+    def open_chunks(self, locators: List[str]) -> BinaryIO:
+        ...
+    
+    def assemble(self, locators: List[str], destination: str) -> str:
+        ...
+    
+    def delete_chunks(self, locators: List[str]):
+        ...
+    
+    def list_objects(self, recording_id: Optional[str] = None) -> Iterator[StoredObject]:
+        ...
+    
+    def sync(self, recording_id: str):
+        ...
@@ -0,0 +1,101 @@
+import os
+import re
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional
+from app.services.audio_stream import ConcatenatedAudioReader, FileRange, copy_file_range
+from app.storage.interface import StoredObject
+
+RANGE_LOCATOR = re.compile(r"^(?P<path>.+)#(?P<offset>\d+)\+(?P<length>\d+)$")
+SEGMENT_INDEX_SUFFIX = ".idx"
+
+
+def format_range_locator(path: str, offset: int, length: int) -> str:
+    return f"{path}#{offset}+{length}"
+
+
+def resolve_locator(locator: str) -> FileRange:
+    match = RANGE_LOCATOR.match(locator)
+    if match:
+        return FileRange(path=match["path"], offset=int(match["offset"]), length=int(match["length"]))
+    return FileRange.whole_file(locator)
+
+
+def locator_path(locator: str) -> str:
+    match = RANGE_LOCATOR.match(locator)
+    return match["path"] if match else locator
+
+
+def is_range_locator(locator: str) -> bool:
+    return RANGE_LOCATOR.match(locator) is not None
+
+
+class LocalChunkStorage:
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+    
+    def recording_dir(self, recording_id: str) -> Path:
+        return self.root / recording_id
+    
+    def full_audio_path(self, recording_id: str) -> str:
+        return str(self.recording_dir(recording_id) / "full_audio.webm")
+    
+    def open_chunks(self, locators: List[str]) -> ConcatenatedAudioReader:
+        return ConcatenatedAudioReader([resolve_locator(locator) for locator in locators])
+    
+    def assemble(self, locators: List[str], destination: str) -> str:
+        Path(destination).parent.mkdir(parents=True, exist_ok=True)
+        
+        infile: Optional[BinaryIO] = None
+        try:
+            with open(destination, "wb", buffering=0) as outfile:
+                for file_range in map(resolve_locator, locators):
+                    if infile is None or infile.name != file_range.path:
+                        if infile is not None:
+                            infile.close()
+                        infile = open(file_range.path, "rb", buffering=0)
+                    copy_file_range(infile, outfile, file_range.offset, file_range.length)
+        finally:
+            if infile is not None:
+                infile.close()
+        
+        return destination
+    
+    def delete_chunks(self, locators: List[str]):
+        paths = set()
+        for locator in locators:
+            match = RANGE_LOCATOR.match(locator)
+            if match:
+                paths.add(match["path"])
+                paths.add(str(Path(match["path"]).with_suffix(SEGMENT_INDEX_SUFFIX)))
+            else:
+                paths.add(locator)
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        for directory in {Path(path).parent for path in paths}:
+            if directory.parent == self.root:
+                try:
+                    os.rmdir(directory)
+                except OSError:
+                    pass
+    
+    def list_objects(self, recording_id: Optional[str] = None) -> Iterator[StoredObject]:
+        directories = [self.recording_dir(recording_id)] if recording_id else sorted(self.root.iterdir())
+        for directory in directories:
+            try:
+                with os.scandir(directory) as scan:
+                    entries = sorted((entry for entry in scan if entry.is_file(follow_symlinks=False)), key=lambda entry: entry.name)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            for entry in entries:
+                try:
+                    stat = entry.stat(follow_symlinks=False)
+                except FileNotFoundError:
+                    continue
+                yield StoredObject(directory.name, entry.name, entry.path, stat.st_size, stat.st_mtime)
+    
+    def sync(self, recording_id: str):
+        pass
@@ -0,0 +1,72 @@
+import argparse
+import logging
+from typing import List, Optional
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models import SessionLocal
+from app.models.recording import RecordingChunk
+from app.storage.local import is_range_locator
+from app.storage.segment import SegmentChunkStorage
+
+logger = logging.getLogger(__name__)
+
+
+def list_unpacked_recording_ids(db: Session) -> List[str]:
+    rows = db.query(RecordingChunk.recording_id).filter(~RecordingChunk.audio_blob_path.like("%#%+%")).distinct()
+    return [recording_id for recording_id, in rows]
+
+
+def migrate_recording(db: Session, storage: SegmentChunkStorage, recording_id: str, dry_run: bool = False) -> int:
+    chunks = [
+        chunk for chunk in db.query(RecordingChunk).filter(RecordingChunk.recording_id == recording_id).order_by(RecordingChunk.chunk_index)
+        if not is_range_locator(chunk.audio_blob_path)
+    ]
+    if dry_run or not chunks:
+        return len(chunks)
+    
+    moved = []
+    for chunk in chunks:
+        try:
+            with open(chunk.audio_blob_path, "rb") as source:
+                saved = storage.write_chunk(recording_id, chunk.chunk_index, source, settings.MAX_CHUNK_SIZE_BYTES, settings.CHUNK_WRITE_BLOCK_SIZE)
+        except FileNotFoundError:
+            logger.warning("Chunk %s of recording %s is missing at %s", chunk.chunk_index, recording_id, chunk.audio_blob_path)
+            continue
+        moved.append(chunk.audio_blob_path)
+        chunk.audio_blob_path = saved.path
+        chunk.size_bytes = saved.size_bytes
+        chunk.checksum = chunk.checksum or saved.checksum
+    
+    storage.sync(recording_id)
+    db.commit()
+    storage.delete_chunks(moved)
+    return len(moved)
+
+
+def migrate(session_factory=SessionLocal, storage_path: Optional[str] = None, dry_run: bool = False) -> int:
+    storage = SegmentChunkStorage(storage_path or settings.AUDIO_STORAGE_PATH, fsync_mode="batch", fsync_batch_size=settings.SEGMENT_FSYNC_BATCH_SIZE)
+    db = session_factory()
+    try:
+        total = 0
+        for recording_id in list_unpacked_recording_ids(db):
+            count = migrate_recording(db, storage, recording_id, dry_run=dry_run)
+            logger.info("%s %d chunk(s) of recording %s", "Would pack" if dry_run else "Packed", count, recording_id)
+            total += count
+        return total
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack per-chunk audio files into per-recording segment files")
+    parser.add_argument("--storage", default=settings.AUDIO_STORAGE_PATH)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    total = migrate(storage_path=args.storage, dry_run=args.dry_run)
+    print(f"{'Would pack' if args.dry_run else 'Packed'} {total} chunk(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+import hashlib
+import hmac
+import io
+import tempfile
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+import httpx
+from app.core.config import settings
+from app.services.audio_stream import ConcatenatedAudioReader
+from app.storage.interface import ChunkTooLargeError, SavedChunk, StoredObject
+from app.storage.local import format_range_locator, locator_path, resolve_locator
+
+EMPTY_PAYLOAD_HASH = hashlib.sha256(b"").hexdigest()
+MIN_PART_SIZE = 5 * 1024 * 1024
+READ_AHEAD_BYTES = 1024 * 1024
+
+_client: Optional[httpx.Client] = None
+
+
+def get_s3_http_client() -> httpx.Client:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.Client(
+            timeout=settings.S3_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=settings.S3_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.S3_MAX_CONNECTIONS
+            )
+        )
+    return _client
+
+
+def close_s3_http_client():
+    global _client
+    if _client is not None:
+        _client.close()
+    _client = None
+
+
+def _uri_encode(value: str, safe: str = "-_.~") -> str:
+    return quote(value, safe=safe)
+
+
+def _hmac(key: bytes, message: str) -> bytes:
+    return hmac.new(key, message.encode(), hashlib.sha256).digest()
+
+
+def sign_request(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    payload_hash: str,
+    access_key_id: str,
+    secret_access_key: str,
+    region: str,
+    now: datetime
+) -> Dict[str, str]:
+    parsed = httpx.URL(url)
+    amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+    date = now.strftime("%Y%m%d")
+    
+    signed = {name.lower(): " ".join(str(value).split()) for name, value in headers.items()}
+    signed["host"] = parsed.netloc.decode()
+    signed["x-amz-date"] = amz_date
+    signed["x-amz-content-sha256"] = payload_hash
+    names = sorted(signed)
+    
+    query = sorted((_uri_encode(k), _uri_encode(v)) for k, v in parsed.params.multi_items())
+    canonical_request = "\n".join([
+        method,
+        _uri_encode(parsed.path, safe="-_.~/"),
+        "&".join(f"{k}={v}" for k, v in query),
+        "".join(f"{name}:{signed[name]}\n" for name in names),
+        ";".join(names),
+        payload_hash
+    ])
+    scope = f"{date}/{region}/s3/aws4_request"
+    string_to_sign = "\n".join([
+        "AWS4-HMAC-SHA256",
+        amz_date,
+        scope,
+        hashlib.sha256(canonical_request.encode()).hexdigest()
+    ])
+    
+    key = _hmac(f"AWS4{secret_access_key}".encode(), date)
+    for part in (region, "s3", "aws4_request"):
+        key = _hmac(key, part)
+    signature = hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+    
+    signed["authorization"] = (
+        f"AWS4-HMAC-SHA256 Credential={access_key_id}/{scope}, "
+        f"SignedHeaders={';'.join(names)}, Signature={signature}"
+    )
+    return signed
+
+
+class S3Error(Exception):
+    def __init__(self, status_code: int, body: str):
+        super().__init__(f"S3 request failed with {status_code}: {body[:200]}")
+        self.status_code = status_code
+        self.body = body
+
+
+class S3Client:
+    def __init__(
+        self,
+        endpoint_url: str,
+        bucket: str,
+        region: str,
+        access_key_id: str,
+        secret_access_key: str,
+        http_client: Optional[httpx.Client] = None
+    ):
+        self.endpoint_url = endpoint_url.rstrip("/")
+        self.bucket = bucket
+        self.region = region
+        self.access_key_id = access_key_id
+        self.secret_access_key = secret_access_key
+        self.http = http_client or get_s3_http_client()
+    
+    def put_object(self, key: str, body, size: int, payload_hash: str):
+        self._request("PUT", key, content=body, payload_hash=payload_hash, headers={"Content-Length": str(size)})
+    
+    def get_range(self, key: str, start: int, end: int) -> bytes:
+        return self._request("GET", key, headers={"Range": f"bytes={start}-{end}"}).content
+    
+    def delete_object(self, key: str):
+        self._request("DELETE", key)
+    
+    def list_objects(self, prefix: str) -> Iterator[Tuple[str, int, float]]:
+        params = {"list-type": "2", "prefix": prefix}
+        while True:
+            listing = ET.fromstring(self._request("GET", "", params=params).content)
+            for item in listing.iterfind("{*}Contents"):
+                modified = datetime.strptime(item.findtext("{*}LastModified"), "%Y-%m-%dT%H:%M:%S.%fZ")
+                yield item.findtext("{*}Key"), int(item.findtext("{*}Size")), modified.replace(tzinfo=timezone.utc).timestamp()
+            token = listing.findtext("{*}NextContinuationToken")
+            if listing.findtext("{*}IsTruncated") != "true" or not token:
+                return
+            params = {**params, "continuation-token": token}
+    
+    def create_multipart_upload(self, key: str) -> str:
+        response = self._request("POST", key, params={"uploads": ""})
+        return ET.fromstring(response.content).findtext("{*}UploadId")
+    
+    def upload_part(self, key: str, upload_id: str, part_number: int, data: bytes) -> str:
+        response = self._request(
+            "PUT", key,
+            params={"partNumber": str(part_number), "uploadId": upload_id},
+            content=data,
+            payload_hash=hashlib.sha256(data).hexdigest()
+        )
+        return response.headers["ETag"]
+    
+    def upload_part_copy(self, key: str, upload_id: str, part_number: int, source_key: str, start: int, end: int) -> str:
+        response = self._request(
+            "PUT", key,
+            params={"partNumber": str(part_number), "uploadId": upload_id},
+            headers={
+                "x-amz-copy-source": _uri_encode(f"{self.bucket}/{source_key}", safe="-_.~/"),
+                "x-amz-copy-source-range": f"bytes={start}-{end}"
+            }
+        )
+        return ET.fromstring(response.content).findtext("{*}ETag")
+    
+    def complete_multipart_upload(self, key: str, upload_id: str, etags: List[str]):
+        parts = "".join(
+            f"<Part><PartNumber>{number}</PartNumber><ETag>{etag}</ETag></Part>"
+            for number, etag in enumerate(etags, start=1)
+        )
+        body = f"<CompleteMultipartUpload>{parts}</CompleteMultipartUpload>".encode()
+        response = self._request("POST", key, params={"uploadId": upload_id}, content=body, payload_hash=hashlib.sha256(body).hexdigest())
+        if b"<Error>" in response.content:
+            raise S3Error(response.status_code, response.text)
+    
+    def abort_multipart_upload(self, key: str, upload_id: str):
+        self._request("DELETE", key, params={"uploadId": upload_id})
+    
+    def _request(
+        self,
+        method: str,
+        key: str,
+        params: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content=None,
+        payload_hash: str = EMPTY_PAYLOAD_HASH
+    ) -> httpx.Response:
+        url = httpx.URL(f"{self.endpoint_url}/{self.bucket}/{_uri_encode(key, safe='-_.~/')}", params=params)
+        signed = sign_request(
+            method, str(url), headers or {}, payload_hash,
+            self.access_key_id, self.secret_access_key, self.region, datetime.utcnow()
+        )
+        response = self.http.request(method, url, headers=signed, content=content)
+        if response.status_code >= 300:
+            raise S3Error(response.status_code, response.text)
+        return response
+
+
+class S3ObjectReader(io.RawIOBase):
+    def __init__(self, client: S3Client, key: str, read_ahead: int = READ_AHEAD_BYTES):
+        self.client = client
+        self.key = key
+        self.read_ahead = read_ahead
+        self._position = 0
+        self._buffer = b""
+        self._buffer_start = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self._position
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence != io.SEEK_SET:
+            raise ValueError("S3 objects only support SEEK_SET and SEEK_CUR")
+        self._position = offset
+        return offset
+    
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast("B")
+        start = self._position - self._buffer_start
+        if not 0 <= start < len(self._buffer):
+            try:
+                self._buffer = self.client.get_range(self.key, self._position, self._position + max(len(view), self.read_ahead) - 1)
+            except S3Error as e:
+                if e.status_code == 416:
+                    return 0
+                raise
+            self._buffer_start = self._position
+            start = 0
+        count = min(len(view), len(self._buffer) - start)
+        view[:count] = self._buffer[start:start + count]
+        self._position += count
+        return count
+
+
+class S3ChunkStorage:
+    def __init__(self, client: S3Client, prefix: str = "recordings", min_part_size: int = MIN_PART_SIZE):
+        self.client = client
+        self.prefix = prefix.strip("/")
+        self.min_part_size = min_part_size
+    
+    def object_key(self, recording_id: str, name: str) -> str:
+        return f"{self.prefix}/{recording_id}/{name}" if self.prefix else f"{recording_id}/{name}"
+    
+    def locator(self, key: str) -> str:
+        return f"s3://{self.client.bucket}/{key}"
+    
+    def key_for(self, locator: str) -> str:
+        bucket_prefix = f"s3://{self.client.bucket}/"
+        if not locator.startswith(bucket_prefix):
+            raise ValueError(f"Not an object in bucket {self.client.bucket}: {locator}")
+        return locator[len(bucket_prefix):]
+    
+    def full_audio_path(self, recording_id: str) -> str:
+        return self.locator(self.object_key(recording_id, "full_audio.webm"))
+    
+    def write_chunk(self, recording_id: str, chunk_index: int, source: BinaryIO, max_size: int, block_size: int) -> SavedChunk:
+        key = self.object_key(recording_id, f"chunk_{chunk_index:04d}.webm")
+        digest = hashlib.sha256()
+        size = 0
+        
+        with tempfile.SpooledTemporaryFile(max_size=block_size * 16) as spool:
+            while True:
+                block = source.read(block_size)
+                if not block:
+                    break
+                size += len(block)
+                if size > max_size:
+                    raise ChunkTooLargeError(f"Chunk exceeds maximum size of {max_size} bytes")
+                digest.update(block)
+                spool.write(block)
+            spool.seek(0)
+            self.client.put_object(key, spool, size, digest.hexdigest())
+        
+        return SavedChunk(path=format_range_locator(self.locator(key), 0, size), size_bytes=size, checksum=digest.hexdigest())
+    
+    def open_chunks(self, locators: List[str]) -> ConcatenatedAudioReader:
+        return ConcatenatedAudioReader(
+            [resolve_locator(locator) for locator in locators],
+            opener=lambda path: S3ObjectReader(self.client, self.key_for(path))
+        )
+    
+    def assemble(self, locators: List[str], destination: str) -> str:
+        key = self.key_for(destination)
+        upload_id = self.client.create_multipart_upload(key)
+        try:
+            etags = []
+            pending = bytearray()
+            for source_key, start, end in self._source_ranges(locators):
+                if not pending and end - start + 1 >= self.min_part_size:
+                    etags.append(self.client.upload_part_copy(key, upload_id, len(etags) + 1, source_key, start, end))
+                    continue
+                pending += self.client.get_range(source_key, start, end)
+                if len(pending) >= self.min_part_size:
+                    etags.append(self.client.upload_part(key, upload_id, len(etags) + 1, bytes(pending)))
+                    pending.clear()
+            if pending or not etags:
+                etags.append(self.client.upload_part(key, upload_id, len(etags) + 1, bytes(pending)))
+            self.client.complete_multipart_upload(key, upload_id, etags)
+        except BaseException:
+            self.client.abort_multipart_upload(key, upload_id)
+            raise
+        return destination
+    
+    def delete_chunks(self, locators: List[str]):
+        for key in {self.key_for(locator_path(locator)) for locator in locators}:
+            try:
+                self.client.delete_object(key)
+            except S3Error:
+                pass
+    
+    def list_objects(self, recording_id: Optional[str] = None) -> Iterator[StoredObject]:
+        root = f"{self.prefix}/" if self.prefix else ""
+        for key, size, modified in self.client.list_objects(self.object_key(recording_id, "") if recording_id else root):
+            owner, _, name = key[len(root):].partition("/")
+            if name and "/" not in name:
+                yield StoredObject(owner, name, self.locator(key), size, modified)
+    
+    def sync(self, recording_id: str):
+        pass
+    
+    def _source_ranges(self, locators: List[str]) -> List[Tuple[str, int, int]]:
+        ranges = []
+        for file_range in map(resolve_locator, locators):
+            if file_range.length:
+                ranges.append((self.key_for(file_range.path), file_range.offset, file_range.offset + file_range.length - 1))
+        return ranges
@@ -0,0 +1,135 @@
+import fcntl
+import hashlib
+import os
+import struct
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict
+from app.storage.interface import ChunkTooLargeError, SavedChunk
+from app.storage.local import SEGMENT_INDEX_SUFFIX, LocalChunkStorage, format_range_locator
+
+SEGMENT_FILE = "segments.dat"
+INDEX_RECORD = struct.Struct("<IQQ32s")
+FSYNC_MODES = ("always", "batch", "never")
+
+
+@dataclass
+class SegmentEntry:
+    chunk_index: int
+    offset: int
+    length: int
+    checksum: str
+
+
+def read_index(index_path: str) -> Dict[int, SegmentEntry]:
+    entries = {}
+    try:
+        with open(index_path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return entries
+    usable = len(data) - len(data) % INDEX_RECORD.size
+    for chunk_index, offset, length, digest in INDEX_RECORD.iter_unpack(data[:usable]):
+        entries[chunk_index] = SegmentEntry(chunk_index, offset, length, digest.hex())
+    return entries
+
+
+def recover_tail(fd: int, index_fd: int) -> int:
+    index_size = os.fstat(index_fd).st_size
+    usable = index_size - index_size % INDEX_RECORD.size
+    if usable != index_size:
+        os.ftruncate(index_fd, usable)
+    end = 0
+    if usable:
+        _, offset, length, _ = INDEX_RECORD.unpack(os.pread(index_fd, INDEX_RECORD.size, usable - INDEX_RECORD.size))
+        end = offset + length
+    size = os.fstat(fd).st_size
+    if size > end:
+        os.ftruncate(fd, end)
+        return end
+    return size
+
+
+def _write_all(fd: int, data: bytes):
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+class SegmentChunkStorage(LocalChunkStorage):
+    def __init__(self, root: str, fsync_mode: str = "batch", fsync_batch_size: int = 16):
+        if fsync_mode not in FSYNC_MODES:
+            raise ValueError(f"Unknown fsync mode: {fsync_mode}")
+        super().__init__(root)
+        self.fsync_mode = fsync_mode
+        self.fsync_batch_size = fsync_batch_size
+        self._unsynced: Dict[str, int] = {}
+        self._lock = threading.Lock()
+    
+    def segment_path(self, recording_id: str) -> Path:
+        return self.recording_dir(recording_id) / SEGMENT_FILE
+    
+    def index_path(self, recording_id: str) -> Path:
+        return self.segment_path(recording_id).with_suffix(SEGMENT_INDEX_SUFFIX)
+    
+    def read_index(self, recording_id: str) -> Dict[int, SegmentEntry]:
+        return read_index(str(self.index_path(recording_id)))
+    
+    def write_chunk(self, recording_id: str, chunk_index: int, source: BinaryIO, max_size: int, block_size: int) -> SavedChunk:
+        self.recording_dir(recording_id).mkdir(parents=True, exist_ok=True)
+        segment_path = self.segment_path(recording_id)
+        digest = hashlib.sha256()
+        size = 0
+        
+        fd = os.open(segment_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        index_fd = os.open(self.index_path(recording_id), os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            offset = recover_tail(fd, index_fd)
+            try:
+                while True:
+                    block = source.read(block_size)
+                    if not block:
+                        break
+                    size += len(block)
+                    if size > max_size:
+                        raise ChunkTooLargeError(f"Chunk exceeds maximum size of {max_size} bytes")
+                    digest.update(block)
+                    _write_all(fd, block)
+            except BaseException:
+                os.ftruncate(fd, offset)
+                raise
+            
+            _write_all(index_fd, INDEX_RECORD.pack(chunk_index, offset, size, digest.digest()))
+            if self._should_fsync(recording_id):
+                os.fsync(fd)
+                os.fsync(index_fd)
+        finally:
+            os.close(index_fd)
+            os.close(fd)
+        
+        return SavedChunk(path=format_range_locator(str(segment_path), offset, size), size_bytes=size, checksum=digest.hexdigest())
+    
+    def sync(self, recording_id: str):
+        with self._lock:
+            pending = self._unsynced.pop(recording_id, 0)
+        if not pending:
+            return
+        for path in (self.segment_path(recording_id), self.index_path(recording_id)):
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+    
+    def _should_fsync(self, recording_id: str) -> bool:
+        if self.fsync_mode != "batch":
+            return self.fsync_mode == "always"
+        with self._lock:
+            pending = self._unsynced.get(recording_id, 0) + 1
+            if pending < self.fsync_batch_size:
+                self._unsynced[recording_id] = pending
+                return False
+            self._unsynced.pop(recording_id, None)
+            return True
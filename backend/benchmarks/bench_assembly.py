@@ -0,0 +1,69 @@
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from app.services.audio_service import AudioService
+from app.storage.factory import create_chunk_storage
+
+
+def legacy_assemble(chunk_paths, final_path):
+    with open(final_path, "wb") as outfile:
+        for chunk_path in chunk_paths:
+            with open(chunk_path, "rb") as infile:
+                shutil.copyfileobj(infile, outfile)
+
+
+def drain(reader, block_size=64 * 1024):
+    total = 0
+    while True:
+        block = reader.read(block_size)
+        if not block:
+            return total
+        total += len(block)
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {elapsed:8.3f}s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare chunk assembly strategies")
+    parser.add_argument("--size-mb", type=int, default=300)
+    parser.add_argument("--chunk-kb", type=int, default=512)
+    parser.add_argument("--storage", default=None)
+    parser.add_argument("--backends", nargs="+", default=["directory", "segment"], choices=["directory", "segment"])
+    args = parser.parse_args()
+    
+    storage = args.storage or tempfile.mkdtemp(prefix="bench_assembly_")
+    chunk_size = args.chunk_kb * 1024
+    chunk_count = args.size_mb * 1024 * 1024 // chunk_size
+    block = os.urandom(chunk_size)
+    print(f"{chunk_count} chunks x {args.chunk_kb} KiB = {args.size_mb} MiB in {storage}")
+    
+    try:
+        for backend in args.backends:
+            root = str(Path(storage) / backend)
+            audio_service = AudioService(storage_path=root, storage=create_chunk_storage(root, backend))
+            chunk_paths = []
+            timed(f"save chunks ({backend})", lambda: chunk_paths.extend(
+                audio_service.save_chunk("bench", index, block) for index in range(chunk_count)
+            ))
+            if backend == "directory":
+                legacy_path = Path(root) / "bench" / "legacy_full_audio.webm"
+                timed("copyfileobj assembly (legacy)", lambda: legacy_assemble(chunk_paths, legacy_path))
+            timed(f"kernel copy assembly ({backend})", lambda: audio_service.assemble_chunks("bench", chunk_paths))
+            with audio_service.open_chunks(chunk_paths) as reader:
+                timed(f"virtual reader stream ({backend})", lambda: drain(reader))
+    finally:
+        if not args.storage:
+            shutil.rmtree(storage, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+BENCHMARK_ENV_DEFAULTS = {
+    "GOOGLE_CLIENT_ID": "benchmark",
+    "GOOGLE_CLIENT_SECRET": "benchmark",
+    "LLM_API_KEY": "benchmark",
+    "JWT_SECRET": "benchmark",
+    "ADMISSION_ENABLED": "false",
+}
+
+
+def configure_environment(workdir: str, **overrides: str):
+    for name, value in BENCHMARK_ENV_DEFAULTS.items():
+        os.environ.setdefault(name, value)
+    os.environ["MYSQL_URL"] = f"sqlite:///{os.path.join(workdir, 'benchmark.db')}"
+    os.environ["AUDIO_STORAGE_PATH"] = os.path.join(workdir, "audio")
+    os.environ["DB_ASYNC"] = "false"
+    os.environ.update(overrides)
+
+
+def percentile(sorted_samples: List[float], fraction: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(benchmark: str, parameters: dict, results: dict, output: Optional[str]):
+    document = {
+        "benchmark": benchmark,
+        "revision": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": parameters,
+        "results": results,
+    }
+    payload = json.dumps(document, indent=2)
+    if output:
+        with open(output, "w") as f:
+            f.write(payload + "\n")
+    else:
+        sys.stdout.write(payload + "\n")
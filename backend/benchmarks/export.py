@@ -0,0 +1,94 @@
+import argparse
+import shutil
+import tempfile
+import time
+import tracemalloc
+from typing import Callable
+import httpx
+from benchmarks.common import configure_environment, write_results
+from benchmarks.load_test import ServerThread
+from benchmarks.micro import seed_recordings
+
+
+def page_through_list(client: httpx.Client, page_size: int) -> int:
+    rows = 0
+    params = {"limit": page_size, "fields": "transcription_text,notes"}
+    while True:
+        response = client.get("/recordings", params=params)
+        response.raise_for_status()
+        rows += len(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return rows
+        params["cursor"] = cursor
+
+
+def stream_export(client: httpx.Client, encoding: str) -> int:
+    rows = 0
+    with client.stream("GET", "/recordings/export", headers={"Accept-Encoding": encoding}) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if line:
+                rows += 1
+    return rows
+
+
+def measure(run: Callable[[], int]) -> dict:
+    start = time.perf_counter()
+    rows = run()
+    seconds = time.perf_counter() - start
+    
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "rows": rows,
+        "seconds": round(seconds, 3),
+        "rows_per_second": round(rows / seconds, 1),
+        "peak_traced_mb": round(peak / (1024 * 1024), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the NDJSON export with paging through GET /recordings")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--text-bytes", type=int, default=1024)
+    parser.add_argument("--page-size", type=int, default=200)
+    parser.add_argument("--workdir", default=None)
+    parser.add_argument("--output", default=None, help="JSON results path (stdout when omitted)")
+    args = parser.parse_args()
+    
+    workdir = args.workdir or tempfile.mkdtemp(prefix="export_bench_")
+    configure_environment(workdir)
+    
+    from app.core.security import create_access_token
+    from app.main import app
+    from app.models import get_session_factory
+    from app.models.schema import upgrade_database
+    
+    upgrade_database()
+    user_id = seed_recordings(get_session_factory(), args.rows, args.text_bytes)
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': user_id})}"}
+    
+    server = ServerThread(app).start()
+    try:
+        with httpx.Client(base_url=server.base_url, headers=headers, timeout=600.0) as client:
+            results = {
+                "list_pages": measure(lambda: page_through_list(client, args.page_size)),
+                "export_ndjson": measure(lambda: stream_export(client, "identity")),
+                "export_ndjson_gzip": measure(lambda: stream_export(client, "gzip")),
+            }
+    finally:
+        server.stop()
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+    
+    parameters = {name: value for name, value in vars(args).items() if name not in ("output", "workdir")}
+    write_results("export", parameters, results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import socket
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List
+import httpx
+from benchmarks.common import configure_environment, summarize, write_results
+
+
+class FakeLLMProvider:
+    name = "fake"
+    version = "1"
+    
+    def __init__(self, latency: float, jitter: float):
+        self.latency = latency
+        self.jitter = jitter
+    
+    async def transcribe_audio(self, audio_path: str) -> str:
+        await self._wait()
+        return f"transcript of {os.path.basename(audio_path)}"
+    
+    async def transcribe_stream(self, stream, filename: str) -> str:
+        size = 0
+        while True:
+            block = stream.read(1024 * 1024)
+            if not block:
+                break
+            size += len(block)
+        await self._wait()
+        return f"transcript of {filename} ({size} bytes)"
+    
+    async def _wait(self):
+        await asyncio.sleep(max(0.0, random.gauss(self.latency, self.jitter)))
+
+
+class ServerThread:
+    def __init__(self, app):
+        import uvicorn
+        
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind(("127.0.0.1", 0))
+        self.server = uvicorn.Server(uvicorn.Config(app, log_level="warning", lifespan="on"))
+        self.thread = threading.Thread(target=self.server.run, kwargs={"sockets": [self.socket]}, daemon=True)
+    
+    @property
+    def base_url(self) -> str:
+        host, port = self.socket.getsockname()
+        return f"http://{host}:{port}"
+    
+    def start(self):
+        self.thread.start()
+        while not self.server.started:
+            if not self.thread.is_alive():
+                raise RuntimeError("Server failed to start")
+            time.sleep(0.01)
+        return self
+    
+    def stop(self):
+        self.server.should_exit = True
+        self.thread.join()
+
+
+class Recorder:
+    def __init__(self, client: httpx.AsyncClient, token: str):
+        self.client = client
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors = Counter()
+    
+    async def request(self, label: str, method: str, url: str, **kwargs) -> httpx.Response:
+        start = time.perf_counter()
+        response = await self.client.request(method, url, headers=self.headers, **kwargs)
+        self.latencies[label].append(time.perf_counter() - start)
+        if response.status_code >= 400:
+            self.errors[f"{label} {response.status_code}"] += 1
+        return response
+
+
+async def run_user(recorder: Recorder, args) -> int:
+    completed = 0
+    for _ in range(args.recordings):
+        response = await recorder.request("POST /recordings", "POST", "/recordings", params={"incremental": str(args.incremental).lower()})
+        if response.status_code != 200:
+            continue
+        recording_id = response.json()["id"]
+        
+        for index in range(args.chunks):
+            await recorder.request(
+                "POST /recordings/{id}/chunks", "POST", f"/recordings/{recording_id}/chunks",
+                data={"chunk_index": str(index)},
+                files={"audio_chunk": ("chunk.webm", os.urandom(args.chunk_kb * 1024), "audio/webm")}
+            )
+        await recorder.request("PATCH /recordings/{id}/pause", "PATCH", f"/recordings/{recording_id}/pause")
+        
+        response = await recorder.request("POST /recordings/{id}/finish", "POST", f"/recordings/{recording_id}/finish")
+        if response.status_code == 202 and args.wait_for_transcription:
+            job_id = response.json()["job_id"]
+            status = "queued"
+            while status in ("queued", "running"):
+                response = await recorder.request(
+                    "GET /recordings/{id}/jobs/{job_id}", "GET", f"/recordings/{recording_id}/jobs/{job_id}",
+                    params={"wait": 30}
+                )
+                status = response.json()["status"] if response.status_code == 200 else "error"
+        
+        response = await recorder.request("GET /recordings", "GET", "/recordings")
+        if response.status_code == 200:
+            completed += 1
+    return completed
+
+
+def create_tokens(count: int) -> List[str]:
+    from app.core.security import create_access_token
+    from app.models import SessionLocal
+    from app.repositories.user_repository import MySQLUserRepository
+    
+    db = SessionLocal()
+    try:
+        users = MySQLUserRepository(db)
+        return [
+            create_access_token({"sub": users.create_user(f"load-{i}", f"load-{i}@example.com", f"Load User {i}", None).id})
+            for i in range(count)
+        ]
+    finally:
+        db.close()
+
+
+async def run_load(base_url: str, tokens: List[str], args) -> dict:
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+    async with httpx.AsyncClient(base_url=base_url, timeout=120.0, limits=limits) as client:
+        recorders = [Recorder(client, token) for token in tokens]
+        start = time.perf_counter()
+        completed = await asyncio.gather(*(run_user(recorder, args) for recorder in recorders))
+        duration = time.perf_counter() - start
+    
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors = Counter()
+    for recorder in recorders:
+        for label, samples in recorder.latencies.items():
+            latencies[label].extend(samples)
+        errors.update(recorder.errors)
+    requests = sum(len(samples) for samples in latencies.values())
+    
+    return {
+        "duration_seconds": round(duration, 3),
+        "requests": requests,
+        "requests_per_second": round(requests / duration, 2),
+        "flows_completed": sum(completed),
+        "flows_per_second": round(sum(completed) / duration, 2),
+        "errors": dict(errors),
+        "endpoints": {label: summarize(samples) for label, samples in sorted(latencies.items())},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate concurrent recorders against the API")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--recordings", type=int, default=3, help="recordings per user")
+    parser.add_argument("--chunks", type=int, default=10, help="chunks per recording")
+    parser.add_argument("--chunk-kb", type=int, default=64)
+    parser.add_argument("--provider-latency-ms", type=float, default=50.0)
+    parser.add_argument("--provider-jitter-ms", type=float, default=10.0)
+    parser.add_argument("--storage-backend", choices=["directory", "segment"], default="segment")
+    parser.add_argument("--incremental", action="store_true")
+    parser.add_argument("--no-wait-for-transcription", dest="wait_for_transcription", action="store_false")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workdir", default=None)
+    parser.add_argument("--output", default=None, help="JSON results path (stdout when omitted)")
+    args = parser.parse_args()
+    
+    random.seed(args.seed)
+    workdir = args.workdir or tempfile.mkdtemp(prefix="load_test_")
+    configure_environment(workdir, AUDIO_STORAGE_BACKEND=args.storage_backend)
+    
+    from app.main import app
+    from app.models.schema import upgrade_database
+    from app.services.chunk_transcriber import get_chunk_transcriber
+    from app.services.transcription_queue import get_transcription_queue
+    
+    upgrade_database()
+    provider = FakeLLMProvider(args.provider_latency_ms / 1000, args.provider_jitter_ms / 1000)
+    get_transcription_queue().provider_factory = lambda: provider
+    get_chunk_transcriber().provider_factory = lambda: provider
+    
+    server = ServerThread(app).start()
+    try:
+        results = asyncio.run(run_load(server.base_url, create_tokens(args.users), args))
+    finally:
+        server.stop()
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+    
+    parameters = {name: value for name, value in vars(args).items() if name not in ("output", "workdir")}
+    write_results("load_test", parameters, results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, List
+from benchmarks.common import configure_environment, summarize, write_results
+
+
+def repeat(func: Callable, repeats: int) -> List[float]:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def bench_chunk_storage(root: str, backend: str, chunk_count: int, chunk_size: int) -> dict:
+    from app.services.audio_service import AudioService
+    from app.storage.factory import create_chunk_storage
+    
+    storage_path = os.path.join(root, backend)
+    audio_service = AudioService(storage_path=storage_path, storage=create_chunk_storage(storage_path, backend))
+    block = os.urandom(chunk_size)
+    total_mb = chunk_count * chunk_size / (1024 * 1024)
+    
+    chunk_paths = []
+    save_samples = []
+    for index in range(chunk_count):
+        start = time.perf_counter()
+        chunk_paths.append(audio_service.save_chunk("bench", index, block))
+        save_samples.append(time.perf_counter() - start)
+    save_seconds = sum(save_samples)
+    
+    start = time.perf_counter()
+    audio_service.assemble_chunks("bench", chunk_paths)
+    assemble_seconds = time.perf_counter() - start
+    
+    return {
+        "save_chunk": {
+            **summarize(save_samples),
+            "chunks_per_second": round(chunk_count / save_seconds, 2),
+            "mb_per_second": round(total_mb / save_seconds, 2),
+        },
+        "assemble_chunks": {
+            "seconds": round(assemble_seconds, 4),
+            "mb_per_second": round(total_mb / assemble_seconds, 2),
+        },
+    }
+
+
+def seed_recordings(session_factory, rows: int, text_bytes: int, batch_size: int = 5000) -> str:
+    from app.models.recording import Recording, RecordingStatus
+    from app.repositories.user_repository import MySQLUserRepository
+    
+    db = session_factory()
+    try:
+        user_id = MySQLUserRepository(db).create_user("bench", "bench@example.com", "Bench User", None).id
+        text = ("lorem ipsum dolor sit amet " * (text_bytes // 27 + 1))[:text_bytes]
+        started = datetime(2024, 1, 1)
+        for offset in range(0, rows, batch_size):
+            db.execute(Recording.__table__.insert(), [
+                {
+                    "id": str(uuid.uuid4()),
+                    "user_id": user_id,
+                    "status": RecordingStatus.ended,
+                    "transcription_text": text,
+                    "notes": text[:text_bytes // 4],
+                    "created_at": started + timedelta(seconds=i),
+                    "updated_at": started + timedelta(seconds=i),
+                }
+                for i in range(offset, min(offset + batch_size, rows))
+            ])
+            db.commit()
+        return user_id
+    finally:
+        db.close()
+
+
+def bench_list_recordings(rows: int, text_bytes: int, page_size: int, repeats: int) -> dict:
+    from app.models import SessionLocal
+    from app.models.recording import Recording
+    from app.repositories.pagination import PAGE_ORDER
+    from app.repositories.recording_repository import MySQLRecordingRepository
+    
+    user_id = seed_recordings(SessionLocal, rows, text_bytes)
+    db = SessionLocal()
+    try:
+        middle = db.query(Recording.created_at, Recording.id).filter(Recording.user_id == user_id).order_by(*PAGE_ORDER).offset(rows // 2).first()
+    finally:
+        db.close()
+    
+    def run(query):
+        def call():
+            session = SessionLocal()
+            try:
+                query(MySQLRecordingRepository(session))
+            finally:
+                session.close()
+        return summarize(repeat(call, repeats))
+    
+    return {
+        "rows": rows,
+        "list_recordings_full": run(lambda repo: repo.list_recordings(user_id)),
+        "list_recordings_first_page": run(lambda repo: repo.list_recordings_page(user_id, page_size)),
+        "list_recordings_middle_page": run(lambda repo: repo.list_recordings_page(user_id, page_size, cursor=tuple(middle))),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for chunk storage and recording listing")
+    parser.add_argument("--chunks", type=int, default=500)
+    parser.add_argument("--chunk-kb", type=int, default=256)
+    parser.add_argument("--backends", nargs="+", default=["directory", "segment"], choices=["directory", "segment"])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--text-bytes", type=int, default=1024)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--workdir", default=None)
+    parser.add_argument("--output", default=None, help="JSON results path (stdout when omitted)")
+    args = parser.parse_args()
+    
+    workdir = args.workdir or tempfile.mkdtemp(prefix="micro_bench_")
+    configure_environment(workdir)
+    
+    from app.models.schema import upgrade_database
+    upgrade_database()
+    
+    try:
+        results = {
+            "chunk_storage": {
+                backend: bench_chunk_storage(os.path.join(workdir, "audio"), backend, args.chunks, args.chunk_kb * 1024)
+                for backend in args.backends
+            },
+            "list_recordings": bench_list_recordings(args.rows, args.text_bytes, args.page_size, args.repeats),
+        }
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+    
+    parameters = {name: value for name, value in vars(args).items() if name not in ("output", "workdir")}
+    write_results("micro", parameters, results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from benchmarks.common import configure_environment, summarize, write_results
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_cold_start() -> dict:
+    start = time.perf_counter()
+    from app.main import app
+    import_seconds = time.perf_counter() - start
+    
+    from fastapi.testclient import TestClient
+    from app.core.startup import startup_timer
+    
+    with TestClient(app) as client:
+        start = time.perf_counter()
+        client.get("/health").raise_for_status()
+        first_request_seconds = time.perf_counter() - start
+        report = startup_timer.report()
+    return {
+        "import_seconds": import_seconds,
+        "lifespan_seconds": report["lifespan_seconds"],
+        "first_request_seconds": first_request_seconds,
+    }
+
+
+def run_cold_start(workdir: str) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.startup_budget", "--child", "--workdir", workdir],
+        cwd=BACKEND_DIR, env=os.environ.copy(), capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold-start import and first-request latency against the startup budget")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--import-budget", type=float, default=None, help="seconds (STARTUP_IMPORT_BUDGET_SECONDS when omitted)")
+    parser.add_argument("--first-request-budget", type=float, default=None, help="seconds (STARTUP_FIRST_REQUEST_BUDGET_SECONDS when omitted)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--workdir", default=None)
+    parser.add_argument("--output", default=None, help="JSON results path (stdout when omitted)")
+    args = parser.parse_args()
+    
+    if args.child:
+        print(json.dumps(measure_cold_start()))
+        return
+    
+    workdir = args.workdir or tempfile.mkdtemp(prefix="startup_budget_")
+    configure_environment(workdir)
+    
+    from app.core.config import settings
+    from app.models.schema import upgrade_database
+    
+    import_budget = args.import_budget if args.import_budget is not None else settings.STARTUP_IMPORT_BUDGET_SECONDS
+    first_request_budget = args.first_request_budget if args.first_request_budget is not None else settings.STARTUP_FIRST_REQUEST_BUDGET_SECONDS
+    
+    try:
+        upgrade_database()
+        runs = [run_cold_start(workdir) for _ in range(args.repeats)]
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+    
+    results = {
+        phase: summarize([run[phase] for run in runs])
+        for phase in ("import_seconds", "lifespan_seconds", "first_request_seconds")
+    }
+    results["budget"] = {
+        "import_seconds": import_budget,
+        "first_request_seconds": first_request_budget,
+    }
+    results["within_budget"] = (
+        results["import_seconds"]["p50_ms"] <= import_budget * 1000
+        and results["first_request_seconds"]["p50_ms"] <= first_request_budget * 1000
+    )
+    
+    parameters = {name: value for name, value in vars(args).items() if name not in ("output", "workdir", "child")}
+    write_results("startup_budget", parameters, results, args.output)
+    if not results["within_budget"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
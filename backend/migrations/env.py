@@ -0,0 +1,45 @@
+from logging.config import fileConfig
+from alembic import context
+from app.models import Base, get_engine
+from app.models import rate_limit, recording, transcription_cache, transcription_job, user
+from app.models.schema import adopt_baseline, object_filter
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get("configure_logging", True):
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline():
+    context.configure(
+        url=get_engine().url.render_as_string(hide_password=False),
+        target_metadata=target_metadata,
+        include_object=object_filter(get_engine().dialect.name),
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"}
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations(connection):
+    context.configure(connection=connection, target_metadata=target_metadata, include_object=object_filter(connection.dialect.name))
+    with context.begin_transaction():
+        adopt_baseline(context.get_context(), context.script)
+        context.run_migrations()
+
+
+def run_migrations_online():
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        run_migrations(connection)
+        return
+    with get_engine().connect() as connection:
+        run_migrations(connection)
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,59 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "users",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("google_id", sa.String(255), nullable=False),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("display_name", sa.String(255), nullable=False),
+        sa.Column("avatar_url", sa.String(512)),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_users_google_id", "users", ["google_id"], unique=True)
+    
+    op.create_table(
+        "recordings",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("user_id", sa.String(36), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("status", sa.Enum("active", "paused", "ended", name="recordingstatus"), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("audio_file_path", sa.String(512)),
+        sa.Column("transcription_text", sa.Text),
+        sa.Column("llm_provider", sa.String(50)),
+        sa.Column("notes", sa.Text),
+    )
+    op.create_index("ix_recordings_user_id", "recordings", ["user_id"])
+    
+    op.create_table(
+        "recording_chunks",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("recording_id", sa.String(36), sa.ForeignKey("recordings.id"), nullable=False),
+        sa.Column("chunk_index", sa.Integer, nullable=False),
+        sa.Column("audio_blob_path", sa.String(512), nullable=False),
+        sa.Column("duration_seconds", sa.Float),
+        sa.Column("uploaded_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_recording_chunks_recording_id", "recording_chunks", ["recording_id"])
+
+
+def downgrade():
+    op.drop_table("recording_chunks")
+    op.drop_table("recordings")
+    op.drop_table("users")
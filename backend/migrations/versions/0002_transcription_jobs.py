@@ -0,0 +1,37 @@
+"""transcription jobs
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "transcription_jobs",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("recording_id", sa.String(36), sa.ForeignKey("recordings.id"), nullable=False),
+        sa.Column("status", sa.Enum("queued", "running", "done", "failed", name="transcriptionjobstatus"), nullable=False),
+        sa.Column("audio_path", sa.String(512), nullable=False),
+        sa.Column("attempts", sa.Integer, nullable=False),
+        sa.Column("max_attempts", sa.Integer, nullable=False),
+        sa.Column("error", sa.Text),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("started_at", sa.DateTime(timezone=True)),
+        sa.Column("finished_at", sa.DateTime(timezone=True)),
+    )
+    op.create_index("ix_transcription_jobs_recording_id", "transcription_jobs", ["recording_id"])
+    op.create_index("ix_transcription_jobs_status", "transcription_jobs", ["status"])
+
+
+def downgrade():
+    op.drop_table("transcription_jobs")
@@ -0,0 +1,32 @@
+"""incremental chunk transcription
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("recordings") as batch:
+        batch.add_column(sa.Column("incremental_transcription", sa.Boolean, server_default=sa.false(), nullable=False))
+    
+    with op.batch_alter_table("recording_chunks") as batch:
+        batch.add_column(sa.Column("transcription_status", sa.Enum("pending", "done", "failed", name="chunktranscriptionstatus")))
+        batch.add_column(sa.Column("transcription_text", sa.Text))
+
+
+def downgrade():
+    with op.batch_alter_table("recording_chunks") as batch:
+        batch.drop_column("transcription_text")
+        batch.drop_column("transcription_status")
+    
+    with op.batch_alter_table("recordings") as batch:
+        batch.drop_column("incremental_transcription")
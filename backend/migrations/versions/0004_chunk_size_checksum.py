@@ -0,0 +1,26 @@
+"""chunk size and checksum
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("recording_chunks") as batch:
+        batch.add_column(sa.Column("size_bytes", sa.Integer))
+        batch.add_column(sa.Column("checksum", sa.String(64)))
+
+
+def downgrade():
+    with op.batch_alter_table("recording_chunks") as batch:
+        batch.drop_column("checksum")
+        batch.drop_column("size_bytes")
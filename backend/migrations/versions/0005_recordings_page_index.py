@@ -0,0 +1,22 @@
+"""recordings keyset pagination index
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_recordings_user_created_id", "recordings", ["user_id", "created_at", "id"])
+
+
+def downgrade():
+    op.drop_index("ix_recordings_user_created_id", "recordings")
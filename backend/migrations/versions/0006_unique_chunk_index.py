@@ -0,0 +1,49 @@
+"""unique chunk index per recording
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+chunks = sa.table(
+    "recording_chunks",
+    sa.column("id"),
+    sa.column("recording_id"),
+    sa.column("chunk_index"),
+    sa.column("uploaded_at")
+)
+
+
+def upgrade():
+    connection = op.get_bind()
+    duplicated = (
+        sa.select(chunks.c.recording_id, chunks.c.chunk_index)
+        .group_by(chunks.c.recording_id, chunks.c.chunk_index)
+        .having(sa.func.count() > 1)
+    )
+    stale = []
+    for recording_id, chunk_index in connection.execute(duplicated).all():
+        ids = connection.scalars(
+            sa.select(chunks.c.id)
+            .where(chunks.c.recording_id == recording_id, chunks.c.chunk_index == chunk_index)
+            .order_by(chunks.c.uploaded_at.desc(), chunks.c.id.desc())
+        ).all()
+        stale.extend(ids[1:])
+    for offset in range(0, len(stale), 500):
+        connection.execute(chunks.delete().where(chunks.c.id.in_(stale[offset:offset + 500])))
+    
+    with op.batch_alter_table("recording_chunks") as batch:
+        batch.create_unique_constraint("uq_recording_chunks_recording_index", ["recording_id", "chunk_index"])
+
+
+def downgrade():
+    with op.batch_alter_table("recording_chunks") as batch:
+        batch.drop_constraint("uq_recording_chunks_recording_index", type_="unique")
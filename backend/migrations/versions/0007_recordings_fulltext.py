@@ -0,0 +1,24 @@
+"""recordings full-text index
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_context().dialect.name == "mysql":
+        op.create_index("ft_recordings_text", "recordings", ["transcription_text", "notes"], mysql_prefix="FULLTEXT")
+
+
+def downgrade():
+    if op.get_context().dialect.name == "mysql":
+        op.drop_index("ft_recordings_text", "recordings")
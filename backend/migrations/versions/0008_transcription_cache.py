@@ -0,0 +1,33 @@
+"""transcription cache
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "transcription_cache",
+        sa.Column("cache_key", sa.String(191), primary_key=True),
+        sa.Column("content_hash", sa.String(64), nullable=False),
+        sa.Column("provider", sa.String(50), nullable=False),
+        sa.Column("provider_version", sa.String(50), nullable=False),
+        sa.Column("transcription", sa.Text, nullable=False),
+        sa.Column("size_bytes", sa.Integer, nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("last_accessed_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_transcription_cache_last_accessed_at", "transcription_cache", ["last_accessed_at"])
+
+
+def downgrade():
+    op.drop_table("transcription_cache")
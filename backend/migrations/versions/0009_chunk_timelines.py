@@ -0,0 +1,42 @@
+"""chunk timelines and recording totals
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("recordings") as batch:
+        batch.add_column(sa.Column("duration_seconds", sa.Float))
+        batch.add_column(sa.Column("size_bytes", sa.BigInteger))
+        batch.add_column(sa.Column("timecode_gaps", sa.Integer, server_default="0", nullable=False))
+        batch.add_column(sa.Column("timecode_overlaps", sa.Integer, server_default="0", nullable=False))
+        batch.add_column(sa.Column("chunks_missing_timecodes", sa.Integer, server_default="0", nullable=False))
+    
+    with op.batch_alter_table("recording_chunks") as batch:
+        batch.add_column(sa.Column("start_timecode_ms", sa.BigInteger))
+        batch.add_column(sa.Column("end_timecode_ms", sa.BigInteger))
+        batch.add_column(sa.Column("timecode_gap_ms", sa.BigInteger))
+
+
+def downgrade():
+    with op.batch_alter_table("recording_chunks") as batch:
+        batch.drop_column("timecode_gap_ms")
+        batch.drop_column("end_timecode_ms")
+        batch.drop_column("start_timecode_ms")
+    
+    with op.batch_alter_table("recordings") as batch:
+        batch.drop_column("chunks_missing_timecodes")
+        batch.drop_column("timecode_overlaps")
+        batch.drop_column("timecode_gaps")
+        batch.drop_column("size_bytes")
+        batch.drop_column("duration_seconds")
@@ -0,0 +1,24 @@
+"""per-user recordings list version
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("users") as batch:
+        batch.add_column(sa.Column("recordings_version", sa.Integer, server_default="0", nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table("users") as batch:
+        batch.drop_column("recordings_version")
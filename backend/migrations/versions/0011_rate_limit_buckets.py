@@ -0,0 +1,27 @@
+"""shared rate limit token buckets
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "rate_limit_buckets",
+        sa.Column("bucket_key", sa.String(191), primary_key=True),
+        sa.Column("tokens", sa.Double, nullable=False),
+        sa.Column("updated_ms", sa.BigInteger, nullable=False),
+    )
+
+
+def downgrade():
+    op.drop_table("rate_limit_buckets")
@@ -0,0 +1,24 @@
+"""per-recording version counter
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("recordings") as batch:
+        batch.add_column(sa.Column("version", sa.Integer, server_default="0", nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table("recordings") as batch:
+        batch.drop_column("version")
@@ -0,0 +1,67 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.api import recordings
+from app.core.security import get_current_user_id
+from app.models import Base, get_db
+from app.repositories.recording_repository import MySQLRecordingRepository
+from app.repositories.user_repository import MySQLUserRepository
+from app.services.audio_service import AudioService
+
+
+@pytest.fixture
+def session_factory(tmp_path_factory):
+    engine = create_engine(
+        f"sqlite:///{tmp_path_factory.mktemp('db') / 'test.db'}",
+        connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def user_id(session_factory):
+    db = session_factory()
+    user = MySQLUserRepository(db).create_user(
+        google_id="123456",
+        email="[email protected]",
+        display_name="Test User",
+        avatar_url=None
+    )
+    db.close()
+    return user.id
+
+
+@pytest.fixture
+def client(session_factory, user_id):
+    app = FastAPI()
+    app.include_router(recordings.router)
+    
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+    
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user_id] = lambda: user_id
+    return TestClient(app)
+
+
+@pytest.fixture
+def audio_service(tmp_path):
+    return AudioService(storage_path=str(tmp_path))
+
+
+@pytest.fixture
+def recording_id(session_factory, user_id, audio_service):
+    db = session_factory()
+    repo = MySQLRecordingRepository(db)
+    recording_id = repo.create_recording(user_id).id
+    for index, data in enumerate([b"hello ", b"world"]):
+        repo.add_chunk(recording_id, audio_service.save_chunk(recording_id, index, data), index, None)
+    db.close()
+    return recording_id
@@ -0,0 +1,147 @@
+import re
+import threading
+import time
+import uuid
+import xml.etree.ElementTree as ET
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+from urllib.parse import parse_qs, unquote, urlsplit
+
+
+class FakeS3Server:
+    def __init__(self, min_part_size: int = 5 * 1024 * 1024):
+        self.min_part_size = min_part_size
+        self.objects: Dict[str, bytes] = {}
+        self.modified: Dict[str, float] = {}
+        self.page_size = 1000
+        self.uploads: Dict[str, Dict[int, bytes]] = {}
+        self.operations = Counter()
+        self.connections = 0
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def endpoint_url(self) -> str:
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with server.lock:
+                    server.connections += 1
+
+            def do_GET(self):
+                key, query = self._target()
+                if not key and query.get("list-type") == "2":
+                    return self._list(query)
+                data = server.objects.get(key)
+                if data is None:
+                    return self._reply(404, b"<Error><Code>NoSuchKey</Code></Error>")
+                match = re.match(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+                if not match:
+                    return self._reply(200, data, "GetObject")
+                start, end = int(match[1]), int(match[2])
+                if start >= len(data):
+                    return self._reply(416, b"<Error><Code>InvalidRange</Code></Error>")
+                self._reply(206, data[start:end + 1], "GetObjectRange")
+
+            def do_PUT(self):
+                key, query = self._target()
+                body = self._body()
+                if "uploadId" not in query:
+                    server.objects[key] = body
+                    server.modified[key] = time.time()
+                    return self._reply(200, b"", "PutObject")
+                parts = server.uploads[query["uploadId"]]
+                copy_source = self.headers.get("x-amz-copy-source")
+                if copy_source:
+                    source = server.objects[unquote(copy_source).split("/", 1)[1]]
+                    start, end = map(int, re.match(r"bytes=(\d+)-(\d+)", self.headers["x-amz-copy-source-range"]).groups())
+                    parts[int(query["partNumber"])] = source[start:end + 1]
+                    etag = f'"{uuid.uuid4().hex}"'
+                    return self._reply(200, f"<CopyPartResult><ETag>{etag}</ETag></CopyPartResult>".encode(), "UploadPartCopy")
+                parts[int(query["partNumber"])] = body
+                self._reply(200, b"", "UploadPart", {"ETag": f'"{uuid.uuid4().hex}"'})
+
+            def do_POST(self):
+                key, query = self._target()
+                body = self._body()
+                if "uploads" in query:
+                    upload_id = uuid.uuid4().hex
+                    server.uploads[upload_id] = {}
+                    payload = f"<InitiateMultipartUploadResult><UploadId>{upload_id}</UploadId></InitiateMultipartUploadResult>"
+                    return self._reply(200, payload.encode(), "CreateMultipartUpload")
+                parts = server.uploads.pop(query["uploadId"])
+                numbers = [int(part.findtext("PartNumber")) for part in ET.fromstring(body).iter("Part")]
+                if any(len(parts[number]) < server.min_part_size for number in numbers[:-1]):
+                    return self._reply(400, b"<Error><Code>EntityTooSmall</Code></Error>")
+                server.objects[key] = b"".join(parts[number] for number in numbers)
+                server.modified[key] = time.time()
+                self._reply(200, b"<CompleteMultipartUploadResult></CompleteMultipartUploadResult>", "CompleteMultipartUpload")
+
+            def do_DELETE(self):
+                key, query = self._target()
+                if "uploadId" in query:
+                    server.uploads.pop(query["uploadId"], None)
+                    return self._reply(204, b"", "AbortMultipartUpload")
+                server.objects.pop(key, None)
+                server.modified.pop(key, None)
+                self._reply(204, b"", "DeleteObject")
+
+            def _list(self, query):
+                max_keys = int(query.get("max-keys", server.page_size))
+                keys = sorted(key for key in server.objects if key.startswith(query.get("prefix", "")))
+                keys = [key for key in keys if key > query.get("continuation-token", "")]
+                page, truncated = keys[:max_keys], len(keys) > max_keys
+                contents = "".join(
+                    f"<Contents><Key>{key}</Key><Size>{len(server.objects[key])}</Size>"
+                    f"<LastModified>{datetime.fromtimestamp(server.modified[key], timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]}Z</LastModified></Contents>"
+                    for key in page
+                )
+                token = f"<NextContinuationToken>{page[-1]}</NextContinuationToken>" if truncated else ""
+                payload = f"<ListBucketResult><IsTruncated>{str(truncated).lower()}</IsTruncated>{token}{contents}</ListBucketResult>"
+                self._reply(200, payload.encode(), "ListObjectsV2")
+
+            def _target(self):
+                url = urlsplit(self.path)
+                key = unquote(url.path).split("/", 2)[2]
+                query = {name: values[0] for name, values in parse_qs(url.query, keep_blank_values=True).items()}
+                return key, query
+
+            def _body(self) -> bytes:
+                return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+            def _reply(self, status: int, payload: bytes, operation: str = None, headers: Dict[str, str] = None):
+                if not self.headers.get("Authorization", "").startswith("AWS4-HMAC-SHA256 Credential="):
+                    status, payload, operation = 403, b"<Error><Code>AccessDenied</Code></Error>", None
+                if operation:
+                    with server.lock:
+                        server.operations[operation] += 1
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
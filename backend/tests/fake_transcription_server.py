@@ -0,0 +1,79 @@
+import json
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Deque, Dict, Optional, Tuple
+
+
+class FakeTranscriptionServer:
+    def __init__(self):
+        self.responses: Deque[Tuple[int, Dict[str, str], dict]] = deque()
+        self.requests = 0
+        self.connections = 0
+        self.last_body = b""
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}/v1"
+
+    def enqueue(self, status: int, headers: Optional[Dict[str, str]] = None, body: Optional[dict] = None):
+        self.responses.append((status, headers or {}, body or {}))
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _next_response(self) -> Tuple[int, Dict[str, str], dict]:
+        with self.lock:
+            self.requests += 1
+            if self.responses:
+                return self.responses.popleft()
+            return 200, {}, {"transcription": f"transcript {self.requests}"}
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with server.lock:
+                    server.connections += 1
+
+            def do_POST(self):
+                if self.headers.get("Transfer-Encoding") == "chunked":
+                    server.last_body = self._read_chunked()
+                else:
+                    server.last_body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                status, headers, body = server._next_response()
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _read_chunked(self) -> bytes:
+                body = b""
+                while True:
+                    size = int(self.rfile.readline().split(b";")[0], 16)
+                    body += self.rfile.read(size)
+                    self.rfile.readline()
+                    if size == 0:
+                        return body
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,166 @@
+import asyncio
+import math
+import pytest
+from app.admission.controller import CHUNK_UPLOADS, FINISH, AdmissionController, AdmissionRejected, get_admission_controller
+from app.admission.database import DatabaseRateLimitBackend
+from app.admission.interface import TokenBucket
+from app.admission.memory import InMemoryRateLimitBackend
+from app.core.config import settings
+
+
+class Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_controller(clock, buckets=None, concurrency=None, **kwargs):
+    buckets = buckets if buckets is not None else {CHUNK_UPLOADS: TokenBucket(3, 1.0), FINISH: TokenBucket(1, 0.5)}
+    return AdmissionController(InMemoryRateLimitBackend(clock), buckets, concurrency or {}, retry_after=2.0, **kwargs)
+
+
+@pytest.fixture
+def recording_id(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "AUDIO_STORAGE_PATH", str(tmp_path))
+    return client.post("/recordings").json()["id"]
+
+
+def upload(client, recording_id, index):
+    return client.post(
+        f"/recordings/{recording_id}/chunks",
+        data={"chunk_index": str(index)},
+        files={"audio_chunk": ("chunk.webm", b"audio", "audio/webm")}
+    )
+
+
+def test_memory_bucket_refills_over_time():
+    clock = Clock()
+    backend = InMemoryRateLimitBackend(clock)
+    bucket = TokenBucket(2, 0.5)
+    
+    waits = [asyncio.run(backend.acquire("user", bucket)) for _ in range(3)]
+    clock.now += 1
+    early = asyncio.run(backend.acquire("user", bucket))
+    clock.now += 1
+    late = asyncio.run(backend.acquire("user", bucket))
+    
+    assert waits == [0.0, 0.0, 2.0]
+    assert early == 1.0
+    assert late == 0.0
+    assert asyncio.run(backend.acquire("other", bucket, cost=5)) == math.inf
+    assert asyncio.run(backend.acquire("other", bucket, cost=2)) == 0.0
+
+
+def test_memory_backend_prunes_full_buckets():
+    clock = Clock()
+    backend = InMemoryRateLimitBackend(clock, max_keys=2)
+    bucket = TokenBucket(1, 1.0)
+    for key in ("a", "b"):
+        asyncio.run(backend.acquire(key, bucket))
+    clock.now += 5
+    asyncio.run(backend.acquire("c", bucket))
+    
+    assert list(backend._buckets) == ["c"]
+
+
+def test_database_backend_shares_buckets_between_instances(session_factory):
+    clock = Clock()
+    first = DatabaseRateLimitBackend(session_factory, clock)
+    second = DatabaseRateLimitBackend(session_factory, clock)
+    bucket = TokenBucket(3, 2.0)
+    
+    admitted = [asyncio.run(backend.acquire("user", bucket)) for backend in (first, second, first)]
+    refused = asyncio.run(second.acquire("user", bucket))
+    clock.now += 0.25
+    still_refused = asyncio.run(first.acquire("user", bucket))
+    clock.now += 0.25
+    refilled = asyncio.run(second.acquire("user", bucket))
+    
+    assert admitted == [0.0, 0.0, 0.0]
+    assert refused == pytest.approx(0.5)
+    assert still_refused == pytest.approx(0.25)
+    assert refilled == 0.0
+    assert asyncio.run(first.acquire("user", bucket)) == pytest.approx(0.5)
+    assert asyncio.run(first.acquire("other", bucket, cost=4)) == math.inf
+
+
+def test_controller_limits_concurrency_and_releases_on_rejection():
+    controller = make_controller(Clock(), concurrency={FINISH: 1})
+    
+    asyncio.run(controller.enter(FINISH, "user"))
+    with pytest.raises(AdmissionRejected) as busy:
+        asyncio.run(controller.enter(FINISH, "other"))
+    controller.release(FINISH)
+    with pytest.raises(AdmissionRejected) as limited:
+        asyncio.run(controller.enter(FINISH, "user"))
+    
+    assert (busy.value.reason, busy.value.retry_after) == ("concurrency", 2.0)
+    assert (limited.value.reason, limited.value.retry_after) == ("rate_limit", 2.0)
+    assert controller.in_flight[FINISH] == 0
+
+
+def test_chunk_upload_burst_is_rejected_with_retry_after(client, recording_id):
+    clock = Clock()
+    controller = make_controller(clock)
+    client.app.dependency_overrides[get_admission_controller] = lambda: controller
+    
+    statuses = [upload(client, recording_id, index).status_code for index in range(3)]
+    rejected = upload(client, recording_id, 3)
+    clock.now += 1
+    
+    assert statuses == [200, 200, 200]
+    assert rejected.status_code == 429
+    assert rejected.headers["Retry-After"] == "1"
+    assert rejected.json()["detail"] == "Rate limit exceeded"
+    assert upload(client, recording_id, 3).status_code == 200
+    assert controller.in_flight[CHUNK_UPLOADS] == 0
+
+
+def test_batch_upload_is_charged_per_chunk(client, recording_id):
+    controller = make_controller(Clock())
+    client.app.dependency_overrides[get_admission_controller] = lambda: controller
+    
+    def batch(indexes):
+        files = [("audio_chunks", (f"chunk_{i}.webm", b"audio")) for i in indexes]
+        return client.post(f"/recordings/{recording_id}/chunks/batch", data={"chunk_indices": indexes}, files=files)
+    
+    assert batch([0, 1]).status_code == 200
+    rejected = batch([2, 3])
+    
+    assert rejected.status_code == 429
+    assert rejected.headers["Retry-After"] == "1"
+    assert client.get(f"/recordings/{recording_id}/chunks").json()["received_count"] == 2
+
+
+def test_batch_larger_than_burst_is_rejected(client, recording_id):
+    controller = make_controller(Clock())
+    client.app.dependency_overrides[get_admission_controller] = lambda: controller
+    files = [("audio_chunks", (f"chunk_{i}.webm", b"audio")) for i in range(4)]
+    
+    response = client.post(f"/recordings/{recording_id}/chunks/batch", data={"chunk_indices": list(range(4))}, files=files)
+    
+    assert response.status_code == 413
+    assert "Retry-After" not in response.headers
+    assert client.get(f"/recordings/{recording_id}/chunks").json()["received_count"] == 0
+    assert controller.in_flight[CHUNK_UPLOADS] == 0
+
+
+def test_finish_rejects_concurrent_requests(client, recording_id):
+    controller = make_controller(Clock(), concurrency={FINISH: 1})
+    controller.in_flight[FINISH] = 1
+    client.app.dependency_overrides[get_admission_controller] = lambda: controller
+    
+    response = client.post(f"/recordings/{recording_id}/finish")
+    
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "2"
+    assert response.json()["detail"] == "Too many concurrent requests"
+
+
+def test_disabled_controller_admits_everything(client, recording_id):
+    controller = make_controller(Clock(), buckets={CHUNK_UPLOADS: TokenBucket(1, 0.0)}, concurrency={CHUNK_UPLOADS: 1}, enabled=False)
+    client.app.dependency_overrides[get_admission_controller] = lambda: controller
+    
+    assert [upload(client, recording_id, index).status_code for index in range(3)] == [200, 200, 200]
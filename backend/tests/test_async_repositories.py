@@ -0,0 +1,103 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from app.models import Base, to_async_url
+from app.models.recording import RecordingStatus
+from app.repositories.async_user_repository import AsyncMySQLUserRepository
+from app.repositories.async_recording_repository import AsyncMySQLRecordingRepository
+from app.repositories.chunk_upsert import ChunkUpload
+
+
+@pytest_asyncio.fixture
+async def db_session():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    SessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+    async with SessionLocal() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def user(db_session):
+    repo = AsyncMySQLUserRepository(db_session)
+    return await repo.create_user(
+        google_id="123456",
+        email="[email protected]",
+        display_name="Test User",
+        avatar_url=None
+    )
+
+
+def test_to_async_url_swaps_driver():
+    assert to_async_url("mysql+pymysql://user:pw@db:3306/app") == "mysql+aiomysql://user:pw@db:3306/app"
+    assert to_async_url("sqlite:///:memory:") == "sqlite+aiosqlite:///:memory:"
+
+
+@pytest.mark.asyncio
+async def test_get_user_by_google_id(db_session, user):
+    repo = AsyncMySQLUserRepository(db_session)
+    
+    found_user = await repo.get_user_by_google_id("123456")
+    
+    assert found_user is not None
+    assert found_user.id == user.id
+
+
+@pytest.mark.asyncio
+async def test_create_and_list_recordings(db_session, user):
+    repo = AsyncMySQLRecordingRepository(db_session)
+    recording = await repo.create_recording(user.id)
+    
+    recordings = await repo.list_recordings(user.id)
+    
+    assert [r.id for r in recordings] == [recording.id]
+    assert recording.status == RecordingStatus.active
+
+
+@pytest.mark.asyncio
+async def test_add_chunks_and_mark_recording_ended(db_session, user):
+    repo = AsyncMySQLRecordingRepository(db_session)
+    recording = await repo.create_recording(user.id)
+    await repo.add_chunk(recording.id, "/chunks/chunk_0001.webm", 1, None)
+    await repo.add_chunk(recording.id, "/chunks/chunk_0000.webm", 0, None)
+    
+    updated = await repo.mark_ended(recording.id, "/path/to/audio.webm", "Test transcription")
+    chunks = await repo.list_chunks(recording.id)
+    
+    assert [c.chunk_index for c in chunks] == [0, 1]
+    assert updated.status == RecordingStatus.ended
+    assert updated.transcription_text == "Test transcription"
+
+
+@pytest.mark.asyncio
+async def test_list_chunk_checksums_in_index_order(db_session, user):
+    repo = AsyncMySQLRecordingRepository(db_session)
+    recording = await repo.create_recording(user.id)
+    await repo.add_chunk(recording.id, "/chunks/chunk_0002.webm", 2, None, size_bytes=5, checksum="c2")
+    await repo.add_chunk(recording.id, "/chunks/chunk_0000.webm", 0, None, size_bytes=3, checksum="c0")
+    
+    checksums = await repo.list_chunk_checksums(recording.id)
+    
+    assert checksums == [(0, "c0", 3), (2, "c2", 5)]
+
+
+@pytest.mark.asyncio
+async def test_list_version_tracks_list_fields_and_recording_version_tracks_writes(db_session, user):
+    repo = AsyncMySQLRecordingRepository(db_session)
+    assert await repo.get_list_version(user.id) == 0
+    
+    recording = await repo.create_recording(user.id)
+    await repo.update_notes(recording.id, "notes")
+    validator = await repo.get_recording_validator(recording.id)
+    
+    assert await repo.get_list_version(user.id) == 2
+    assert validator.user_id == user.id
+    assert validator.version == 1
+    
+    await repo.add_chunks(recording.id, [ChunkUpload(index=0, path="/chunks/chunk_0000.webm", size_bytes=5)])
+    assert await repo.get_list_version(user.id) == 2
+    assert (await repo.get_recording_validator(recording.id)).version == 2
+    assert await repo.get_recording_validator("missing") is None
@@ -0,0 +1,59 @@
+import hashlib
+from io import BytesIO
+import pytest
+from app.services.audio_service import AudioService, ChunkTooLargeError
+from app.storage.directory import DirectoryChunkStorage
+
+
+@pytest.fixture
+def audio_service(tmp_path):
+    return AudioService(storage_path=str(tmp_path), storage=DirectoryChunkStorage(str(tmp_path)))
+
+
+def test_save_chunk_stream_writes_file_and_checksum(audio_service, tmp_path):
+    data = b"webm" * 5000
+    
+    saved = audio_service.save_chunk_stream("rec-1", 3, BytesIO(data), block_size=1024)
+    
+    assert saved.path == str(tmp_path / "rec-1" / "chunk_0003.webm")
+    assert saved.size_bytes == len(data)
+    assert saved.checksum == hashlib.sha256(data).hexdigest()
+    assert (tmp_path / "rec-1" / "chunk_0003.webm").read_bytes() == data
+
+
+def test_save_chunk_stream_rejects_oversized_chunk_without_leaving_files(audio_service, tmp_path):
+    with pytest.raises(ChunkTooLargeError):
+        audio_service.save_chunk_stream("rec-1", 0, BytesIO(b"x" * 4096), max_size=1000, block_size=512)
+    
+    assert list((tmp_path / "rec-1").iterdir()) == []
+
+
+def test_failed_upload_keeps_previous_chunk_intact(audio_service, tmp_path):
+    audio_service.save_chunk("rec-1", 0, b"original")
+    
+    with pytest.raises(ChunkTooLargeError):
+        audio_service.save_chunk_stream("rec-1", 0, BytesIO(b"y" * 100), max_size=10)
+    
+    assert (tmp_path / "rec-1" / "chunk_0000.webm").read_bytes() == b"original"
+    assert [p.name for p in (tmp_path / "rec-1").iterdir()] == ["chunk_0000.webm"]
+
+
+def test_concatenated_reader_reads_across_chunk_boundaries(audio_service):
+    paths = [audio_service.save_chunk("rec-1", index, data) for index, data in enumerate([b"abc", b"", b"defg", b"h"])]
+    
+    with audio_service.open_chunks(paths) as reader:
+        assert reader.length == 8
+        assert reader.read(2) == b"ab"
+        assert reader.read(3) == b"cde"
+        assert reader.read() == b"fgh"
+        reader.seek(-3, 2)
+        assert reader.read() == b"fgh"
+
+
+def test_assemble_chunks_concatenates_in_order(audio_service):
+    paths = [audio_service.save_chunk("rec-1", index, bytes([index]) * 70000) for index in range(3)]
+    
+    full_audio_path = audio_service.assemble_chunks("rec-1", paths)
+    
+    with open(full_audio_path, "rb") as f:
+        assert f.read() == b"\x00" * 70000 + b"\x01" * 70000 + b"\x02" * 70000
@@ -0,0 +1,65 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+from benchmarks.common import percentile, summarize
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def run_benchmark(module, tmp_path, *args):
+    output = tmp_path / f"{module}.json"
+    subprocess.run(
+        [sys.executable, "-m", f"benchmarks.{module}", "--workdir", str(tmp_path), "--output", str(output), *args],
+        cwd=BACKEND_DIR, check=True, timeout=120
+    )
+    return json.loads(output.read_text())
+
+
+def test_percentile_uses_nearest_rank():
+    samples = [float(value) for value in range(1, 101)]
+    
+    assert percentile(samples, 0.50) == 50.0
+    assert percentile(samples, 0.99) == 99.0
+    assert summarize([0.001, 0.003])["p95_ms"] == 3.0
+
+
+def test_load_test_reports_every_endpoint(tmp_path):
+    document = run_benchmark("load_test", tmp_path, "--users", "2", "--recordings", "1", "--chunks", "2", "--provider-latency-ms", "1")
+    
+    results = document["results"]
+    assert results["flows_completed"] == 2
+    assert results["errors"] == {}
+    assert set(results["endpoints"]) == {
+        "POST /recordings",
+        "POST /recordings/{id}/chunks",
+        "PATCH /recordings/{id}/pause",
+        "POST /recordings/{id}/finish",
+        "GET /recordings/{id}/jobs/{job_id}",
+        "GET /recordings",
+    }
+    assert results["endpoints"]["POST /recordings/{id}/chunks"]["count"] == 4
+
+
+def test_micro_benchmarks_write_json(tmp_path):
+    document = run_benchmark("micro", tmp_path, "--chunks", "4", "--chunk-kb", "4", "--rows", "120", "--repeats", "1")
+    
+    assert set(document["results"]["chunk_storage"]) == {"directory", "segment"}
+    assert document["results"]["list_recordings"]["list_recordings_full"]["count"] == 1
+
+
+def test_startup_budget_reports_each_phase(tmp_path):
+    document = run_benchmark("startup_budget", tmp_path, "--repeats", "1", "--import-budget", "60", "--first-request-budget", "60")
+    
+    results = document["results"]
+    assert results["within_budget"] is True
+    assert results["import_seconds"]["count"] == 1
+    assert results["first_request_seconds"]["count"] == 1
+
+
+def test_export_benchmark_compares_list_and_ndjson(tmp_path):
+    document = run_benchmark("export", tmp_path, "--rows", "300", "--text-bytes", "64", "--page-size", "50")
+    
+    results = document["results"]
+    assert set(results) == {"list_pages", "export_ndjson", "export_ndjson_gzip"}
+    assert all(result["rows"] == 300 for result in results.values())
@@ -0,0 +1,107 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.models import Base
+from app.models.recording import ChunkTranscriptionStatus
+from app.repositories.user_repository import MySQLUserRepository
+from app.repositories.recording_repository import MySQLRecordingRepository
+from app.services.audio_service import AudioService
+from app.services.chunk_transcriber import ChunkTranscriber, stitch_partials
+from app.services.transcription_cache import TranscriptionCache
+
+
+class FakeChunkProvider:
+    def __init__(self, failing_indices=()):
+        self.failing_indices = set(failing_indices)
+        self.calls = []
+    
+    def transcribe_audio(self, audio_path: str) -> str:
+        raise AssertionError("full transcription should not be used")
+    
+    def transcribe_stream(self, stream, filename: str) -> str:
+        chunk_index = int(stream.read())
+        self.calls.append(chunk_index)
+        if chunk_index in self.failing_indices:
+            raise RuntimeError("provider unavailable")
+        return f"part {chunk_index}"
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'chunks.db'}",
+        connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def audio_service(tmp_path):
+    return AudioService(storage_path=str(tmp_path))
+
+
+@pytest.fixture
+def recording_repo(session_factory):
+    db = session_factory()
+    yield MySQLRecordingRepository(db)
+    db.close()
+
+
+@pytest.fixture
+def recording_id(recording_repo, audio_service):
+    user = MySQLUserRepository(recording_repo.db).create_user(
+        google_id="123456",
+        email="[email protected]",
+        display_name="Test User",
+        avatar_url=None
+    )
+    recording = recording_repo.create_recording(user.id, incremental_transcription=True)
+    for index in (2, 0, 1):
+        path = audio_service.save_chunk(recording.id, index, str(index).encode())
+        recording_repo.add_chunk(recording.id, path, index, None, transcribe=True, checksum=f"hash-{index}")
+    return recording.id
+
+
+def test_stitch_partials_orders_by_chunk_index(recording_repo, recording_id):
+    for chunk in recording_repo.list_chunks(recording_id):
+        recording_repo.save_chunk_transcription(chunk.id, f" part {chunk.chunk_index} ")
+    
+    assert stitch_partials(recording_repo.list_chunks(recording_id)) == "part 0 part 1 part 2"
+
+
+@pytest.mark.asyncio
+async def test_complete_only_transcribes_pending_chunks(session_factory, audio_service, recording_repo, recording_id):
+    first = recording_repo.list_chunks(recording_id)[0]
+    recording_repo.save_chunk_transcription(first.id, "already done")
+    provider = FakeChunkProvider()
+    transcriber = ChunkTranscriber(
+        session_factory=session_factory,
+        audio_service_factory=lambda: audio_service,
+        cache=TranscriptionCache(session_factory=session_factory)
+    )
+    
+    transcription = await transcriber.complete(recording_id, provider)
+    
+    assert sorted(provider.calls) == [1, 2]
+    assert transcription == "already done part 1 part 2"
+
+
+@pytest.mark.asyncio
+async def test_complete_raises_and_keeps_successful_partials(session_factory, audio_service, recording_repo, recording_id):
+    provider = FakeChunkProvider(failing_indices=[1])
+    transcriber = ChunkTranscriber(
+        session_factory=session_factory,
+        audio_service_factory=lambda: audio_service,
+        cache=TranscriptionCache(session_factory=session_factory)
+    )
+    
+    with pytest.raises(RuntimeError):
+        await transcriber.complete(recording_id, provider)
+    
+    statuses = {c.chunk_index: c.transcription_status for c in recording_repo.list_chunks(recording_id)}
+    assert statuses == {
+        0: ChunkTranscriptionStatus.done,
+        1: ChunkTranscriptionStatus.failed,
+        2: ChunkTranscriptionStatus.done
+    }
@@ -0,0 +1,89 @@
+from contextlib import contextmanager
+from sqlalchemy import event
+from app.core.config import settings
+from app.repositories.recording_repository import MySQLRecordingRepository
+from tests.test_recordings_api import create_ended_recordings
+
+
+@contextmanager
+def capture_statements(session_factory):
+    engine = session_factory.kw["bind"]
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def test_get_recording_returns_304_with_one_query_and_no_text_columns(client, session_factory, user_id):
+    recording_id = create_ended_recordings(session_factory, user_id, 1)[0]
+    first = client.get(f"/recordings/{recording_id}")
+    etag = first.headers["ETag"]
+    
+    with capture_statements(session_factory) as statements:
+        cached = client.get(f"/recordings/{recording_id}", headers={"If-None-Match": etag})
+    
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+    assert len(statements) == 1
+    assert "transcription_text" not in statements[0] and "notes" not in statements[0]
+
+
+def test_get_recording_etag_changes_after_update(client, session_factory, user_id):
+    recording_id = create_ended_recordings(session_factory, user_id, 1)[0]
+    etag = client.get(f"/recordings/{recording_id}").headers["ETag"]
+    
+    db = session_factory()
+    MySQLRecordingRepository(db).update_notes(recording_id, "edited")
+    db.close()
+    
+    with capture_statements(session_factory) as statements:
+        fresh = client.get(f"/recordings/{recording_id}", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.json()["notes"] == "edited"
+    assert fresh.headers["ETag"] != etag
+    assert len(statements) == 2
+
+
+def test_list_version_covers_new_and_changed_recordings(client, session_factory, user_id):
+    create_ended_recordings(session_factory, user_id, 2)
+    etag = client.get("/recordings").headers["ETag"]
+    
+    with capture_statements(session_factory) as statements:
+        cached = client.get("/recordings", headers={"If-None-Match": f'W/"other", {etag}'})
+    assert cached.status_code == 304
+    assert len(statements) == 1
+    assert "recordings" not in statements[0].split("FROM", 1)[1]
+    
+    assert client.get("/recordings", params={"limit": 1}, headers={"If-None-Match": etag}).status_code == 200
+    
+    client.post("/recordings")
+    assert client.get("/recordings", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_chunk_upload_invalidates_only_that_recording(client, session_factory, user_id, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "AUDIO_STORAGE_PATH", str(tmp_path))
+    recording_id, other_id = client.post("/recordings").json()["id"], client.post("/recordings").json()["id"]
+    etag = client.get(f"/recordings/{recording_id}").headers["ETag"]
+    other_etag = client.get(f"/recordings/{other_id}").headers["ETag"]
+    list_etag = client.get("/recordings").headers["ETag"]
+    
+    for index in range(2):
+        client.post(f"/recordings/{recording_id}/chunks", data={"chunk_index": index}, files={"audio_chunk": ("chunk.webm", b"audio")})
+        fresh = client.get(f"/recordings/{recording_id}", headers={"If-None-Match": etag})
+        assert fresh.status_code == 200
+        etag = fresh.headers["ETag"]
+    
+    assert client.get(f"/recordings/{other_id}", headers={"If-None-Match": other_etag}).status_code == 304
+    assert client.get("/recordings", headers={"If-None-Match": list_etag}).status_code == 304
+    
+    db = session_factory()
+    MySQLRecordingRepository(db).mark_paused(recording_id)
+    db.close()
+    assert client.get("/recordings", headers={"If-None-Match": list_etag}).status_code == 200
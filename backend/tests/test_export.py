@@ -0,0 +1,67 @@
+import gzip
+import json
+import pytest
+from app.repositories.dependencies import get_export_session_factory
+from app.services.export import accepts_gzip, export_ndjson
+from tests.test_recordings_api import create_ended_recordings
+
+
+@pytest.fixture
+def export_client(client, session_factory):
+    client.app.dependency_overrides[get_export_session_factory] = lambda: session_factory
+    return client
+
+
+def test_export_streams_every_recording_as_ndjson(export_client, session_factory, user_id):
+    ids = create_ended_recordings(session_factory, user_id, 3)
+    
+    response = export_client.get("/recordings/export", headers={"Accept-Encoding": "identity"})
+    
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "content-encoding" not in response.headers
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(record["id"] for record in records) == sorted(ids)
+    assert records[0]["status"] == "ended"
+    assert records[0]["transcription_text"].startswith("transcript")
+    assert records[0]["notes"].startswith("notes")
+
+
+def test_export_resumes_from_cursor(export_client, session_factory, user_id):
+    create_ended_recordings(session_factory, user_id, 5)
+    full = export_client.get("/recordings/export", headers={"Accept-Encoding": "identity"}).text.splitlines()
+    
+    resumed = export_client.get(
+        "/recordings/export",
+        params={"cursor": json.loads(full[1])["cursor"]},
+        headers={"Accept-Encoding": "identity"}
+    ).text.splitlines()
+    
+    assert resumed == full[2:]
+    assert export_client.get("/recordings/export", params={"cursor": "bogus"}).status_code == 400
+
+
+def test_export_gzip_when_accepted(export_client, session_factory, user_id):
+    create_ended_recordings(session_factory, user_id, 2)
+    
+    response = export_client.get("/recordings/export", headers={"Accept-Encoding": "gzip"})
+    
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.text.splitlines()) == 2
+
+
+def test_export_yields_bounded_blocks(session_factory, user_id):
+    create_ended_recordings(session_factory, user_id, 20)
+    
+    blocks = list(export_ndjson(session_factory, user_id, batch_size=4, buffer_size=1024))
+    compressed = b"".join(export_ndjson(session_factory, user_id, compress=True, batch_size=4, buffer_size=1024))
+    
+    assert len(blocks) > 1
+    assert all(len(block) < 2048 for block in blocks)
+    assert gzip.decompress(compressed) == b"".join(blocks)
+
+
+def test_accepts_gzip_honours_q_values():
+    assert accepts_gzip("gzip, deflate, br")
+    assert accepts_gzip("deflate;q=1, gzip;q=0.5")
+    assert not accepts_gzip("gzip;q=0")
+    assert not accepts_gzip(None)
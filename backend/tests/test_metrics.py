@@ -0,0 +1,69 @@
+import asyncio
+import time
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from app.core.metrics import EventLoopLagMonitor, MetricsMiddleware, instrument_engine, statement_operation
+
+
+def sample(name, labels=None):
+    return REGISTRY.get_sample_value(name, labels or {}) or 0
+
+
+def test_request_latency_is_labelled_by_route_template():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str):
+        return {"id": item_id}
+    
+    labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+    unmatched = {"method": "GET", "route": "unmatched", "status": "404"}
+    before = sample("http_request_duration_seconds_count", labels), sample("http_request_duration_seconds_count", unmatched)
+    
+    client = TestClient(app)
+    client.get("/items/a")
+    client.get("/items/b")
+    client.get("/missing/c")
+    
+    assert sample("http_request_duration_seconds_count", labels) - before[0] == 2
+    assert sample("http_request_duration_seconds_count", unmatched) - before[1] == 1
+
+
+def test_statement_operation_is_bounded():
+    assert statement_operation("  select 1") == "SELECT"
+    assert statement_operation("INSERT INTO recordings VALUES (1)") == "INSERT"
+    assert statement_operation("PRAGMA foreign_keys=ON") == "OTHER"
+
+
+def test_engine_events_time_queries_and_pool_checkouts():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    before = sample("db_query_duration_seconds_count", {"operation": "SELECT"}), sample("db_pool_checkout_wait_seconds_count")
+    
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        conn.execute(text("SELECT 2"))
+    engine.dispose()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 3"))
+    
+    assert sample("db_query_duration_seconds_count", {"operation": "SELECT"}) - before[0] == 3
+    assert sample("db_pool_checkout_wait_seconds_count") - before[1] == 2
+
+
+@pytest.mark.asyncio
+async def test_event_loop_lag_monitor_observes_blocked_loop():
+    before = sample("event_loop_lag_seconds_sum")
+    monitor = EventLoopLagMonitor(interval=0.01)
+    monitor.start()
+    
+    await asyncio.sleep(0)
+    time.sleep(0.1)
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+    
+    assert sample("event_loop_lag_seconds_sum") - before >= 0.05
@@ -0,0 +1,156 @@
+import asyncio
+import io
+import random
+import time
+import pytest
+from app.llm.registry import NoProviderAvailableError, ProviderRouter, provider_used
+from app.models.recording import Recording, RecordingStatus
+from app.services.audio_stream import ConcatenatedAudioReader, FileRange
+from tests.test_transcription_queue import create_job, make_queue, wait_for_terminal_status
+
+
+class LatencyProvider:
+    version = "1"
+    
+    def __init__(self, name: str, latency=0.0, jitter=0.0, failure_rate=0.0, seed=0):
+        self.name = name
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+        self.calls = 0
+        self.cancelled = 0
+    
+    async def transcribe_stream(self, stream, filename: str) -> str:
+        self.calls += 1
+        data = stream.read()
+        try:
+            await asyncio.sleep(max(0.0, self.random.gauss(self.latency, self.jitter)))
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.random.random() < self.failure_rate:
+            raise RuntimeError(f"{self.name} unavailable")
+        return f"{self.name}: {data.decode()}"
+
+
+def make_router(*providers, **kwargs):
+    options = dict(hedging=True, hedge_default_delay=0.0, hedge_min_delay=0.0, min_samples=5, max_error_rate=0.5, stats_window=50)
+    options.update(kwargs)
+    router = ProviderRouter(**options)
+    for provider in providers:
+        max_bytes = getattr(provider, "max_bytes", None)
+        router.register(provider.name, lambda provider=provider: provider, max_bytes)
+    return router
+
+
+def reader(tmp_path, data: bytes = b"hello world") -> ConcatenatedAudioReader:
+    path = tmp_path / "audio.webm"
+    path.write_bytes(data)
+    return ConcatenatedAudioReader([FileRange.whole_file(str(path))])
+
+
+async def warm_up(router, tmp_path, calls: int):
+    for _ in range(calls):
+        await router.session().transcribe_stream(reader(tmp_path), "warmup.webm")
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_next_provider_on_failure(tmp_path):
+    primary = LatencyProvider("primary", failure_rate=1.0)
+    backup = LatencyProvider("backup")
+    router = make_router(primary, backup)
+    session = router.session()
+    
+    assert await session.transcribe_stream(reader(tmp_path), "audio.webm") == "backup: hello world"
+    assert (primary.calls, backup.calls) == (1, 1)
+    assert provider_used(session) == "backup"
+    assert router.entries[0].stats.error_rate == 1.0
+
+
+@pytest.mark.asyncio
+async def test_raises_last_error_when_every_provider_fails(tmp_path):
+    router = make_router(LatencyProvider("a", failure_rate=1.0), LatencyProvider("b", failure_rate=1.0))
+    with pytest.raises(RuntimeError, match="b unavailable"):
+        await router.session().transcribe_stream(reader(tmp_path), "audio.webm")
+
+
+@pytest.mark.asyncio
+async def test_hedges_slow_primary_after_p95_deadline(tmp_path):
+    primary = LatencyProvider("primary", latency=0.02, jitter=0.002, seed=1)
+    backup = LatencyProvider("backup", latency=0.02, seed=2)
+    router = make_router(primary, backup, hedge_min_delay=0.1)
+    await warm_up(router, tmp_path, 20)
+    assert backup.calls == 0
+    
+    primary.latency, primary.jitter = 2.0, 0.0
+    session = router.session()
+    start = time.perf_counter()
+    result = await session.transcribe_stream(reader(tmp_path), "audio.webm")
+    
+    assert result == "backup: hello world"
+    assert time.perf_counter() - start < 0.5
+    assert primary.cancelled == 1
+    assert dict(session.used) == {"backup": 1}
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_without_reopenable_stream(tmp_path):
+    primary = LatencyProvider("primary", latency=0.05)
+    backup = LatencyProvider("backup")
+    router = make_router(primary, backup, hedge_default_delay=0.01)
+    
+    assert await router.session().transcribe_stream(io.BytesIO(b"hello world"), "audio.webm") == "primary: hello world"
+    assert backup.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_routes_by_length_and_observed_latency(tmp_path):
+    small_only = LatencyProvider("small", latency=0.001)
+    small_only.max_bytes = 5
+    slow = LatencyProvider("slow", latency=0.03)
+    fast = LatencyProvider("fast", latency=0.001)
+    router = make_router(small_only, slow, fast, hedging=False)
+    
+    assert [entry.name for entry in router.rank(100)] == ["slow", "fast"]
+    assert [entry.name for entry in router.rank(3)] == ["small", "slow", "fast"]
+    
+    for entry in router.entries:
+        for _ in range(5):
+            await router._call(entry, io.BytesIO(b"abc"), "probe.webm", 3)
+    assert [entry.name for entry in router.rank(100)] == ["fast", "slow"]
+    
+    with pytest.raises(NoProviderAvailableError):
+        await make_router(small_only).transcribe_stream(io.BytesIO(b"too long"), "audio.webm")
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_provider_is_demoted(tmp_path):
+    flaky = LatencyProvider("flaky", failure_rate=0.8, seed=3)
+    steady = LatencyProvider("steady", latency=0.01)
+    router = make_router(flaky, steady, hedging=False)
+    await warm_up(router, tmp_path, 10)
+    
+    assert not router.is_healthy(router.entries[0])
+    assert router.rank(11)[0].name == "steady"
+
+
+@pytest.mark.asyncio
+async def test_queue_records_provider_used_on_recording(session_factory, audio_service, recording_id):
+    router = make_router(LatencyProvider("primary", failure_rate=1.0), LatencyProvider("backup"))
+    queue = make_queue(session_factory, audio_service, None, retry_delay=0.01)
+    queue.provider_factory = router.session
+    job_id = create_job(session_factory, recording_id)
+    await queue.start()
+    try:
+        queue.enqueue(job_id)
+        await wait_for_terminal_status(session_factory, job_id)
+    finally:
+        await queue.stop()
+    
+    db = session_factory()
+    recording = db.get(Recording, recording_id)
+    assert recording.status == RecordingStatus.ended
+    assert recording.transcription_text == "backup: hello world"
+    assert recording.llm_provider == "backup"
+    db.close()
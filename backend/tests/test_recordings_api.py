@@ -0,0 +1,113 @@
+import threading
+from app.core.config import settings
+from app.repositories.recording_repository import MySQLRecordingRepository
+from app.search.index import set_search_index
+from app.repositories.transcription_job_repository import MySQLTranscriptionJobRepository
+from app.search.inverted_index import InMemorySearchIndex
+from app.services.transcription_queue import get_transcription_queue
+
+
+def create_ended_recordings(session_factory, user_id, count):
+    db = session_factory()
+    repo = MySQLRecordingRepository(db)
+    ids = []
+    for index in range(count):
+        recording = repo.create_recording(user_id)
+        repo.mark_ended(recording.id, "/path/to/audio.webm", f"transcript {index} " + "y" * 300)
+        repo.update_notes(recording.id, f"notes {index}")
+        ids.append(recording.id)
+    db.close()
+    return ids
+
+
+def test_list_recordings_paginates_with_cursor_header(client, session_factory, user_id):
+    create_ended_recordings(session_factory, user_id, 5)
+    
+    first = client.get("/recordings", params={"limit": 2})
+    second = client.get("/recordings", params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]})
+    third = client.get("/recordings", params={"limit": 2, "cursor": second.headers["X-Next-Cursor"]})
+    
+    ids = [r["id"] for page in (first, second, third) for r in page.json()]
+    assert len(ids) == len(set(ids)) == 5
+    assert "X-Next-Cursor" not in third.headers
+
+
+def test_list_recordings_returns_summary_unless_fields_requested(client, session_factory, user_id):
+    create_ended_recordings(session_factory, user_id, 1)
+    
+    summary = client.get("/recordings").json()[0]
+    full = client.get("/recordings", params={"fields": "transcription_text,notes"}).json()[0]
+    
+    assert summary["transcription_text"] is None
+    assert summary["notes"] is None
+    assert len(summary["transcript_preview"]) == 200
+    assert full["transcription_text"].startswith("transcript 0")
+    assert full["notes"] == "notes 0"
+
+
+def test_list_recordings_rejects_unknown_fields_and_bad_cursor(client):
+    assert client.get("/recordings", params={"fields": "audio_file_path"}).status_code == 400
+    assert client.get("/recordings", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+def test_batch_upload_stores_chunks_once_when_resent(client, session_factory, user_id, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "AUDIO_STORAGE_PATH", str(tmp_path))
+    recording_id = client.post("/recordings").json()["id"]
+    files = [("audio_chunks", (f"chunk_{i}.webm", f"audio {i}".encode())) for i in range(3)]
+    
+    first = client.post(f"/recordings/{recording_id}/chunks/batch", data={"chunk_indices": [0, 1, 2]}, files=files)
+    resent = client.post(f"/recordings/{recording_id}/chunks", data={"chunk_index": 1}, files={"audio_chunk": ("chunk_1.webm", b"audio 1")})
+    
+    db = session_factory()
+    chunks = MySQLRecordingRepository(db).list_chunks(recording_id)
+    db.close()
+    assert first.status_code == 200
+    assert resent.json()["checksum"] == first.json()["chunks"][1]["checksum"]
+    assert [c.chunk_index for c in chunks] == [0, 1, 2]
+
+
+def test_search_returns_highlighted_pages(client, session_factory, user_id):
+    index = InMemorySearchIndex()
+    set_search_index(index)
+    try:
+        create_ended_recordings(session_factory, user_id, 3)
+        
+        first = client.get("/recordings/search", params={"q": "transcript", "limit": 2}).json()
+        second = client.get("/recordings/search", params={"q": "transcript", "limit": 2, "offset": first["next_offset"]}).json()
+    finally:
+        set_search_index(None)
+    
+    assert len(first["results"]) == 2
+    assert len(second["results"]) == 1
+    assert second["next_offset"] is None
+    assert "<mark>transcript</mark>" in first["results"][0]["snippet"]
+
+
+class RecordingQueue:
+    def __init__(self):
+        self.job_ids = []
+    
+    def enqueue(self, job_id: str):
+        self.job_ids.append(job_id)
+
+
+def test_job_long_poll_returns_once_the_job_finishes(client, session_factory, user_id):
+    queue = RecordingQueue()
+    client.app.dependency_overrides[get_transcription_queue] = lambda: queue
+    recording_id = client.post("/recordings").json()["id"]
+    job_id = client.post(f"/recordings/{recording_id}/finish").json()["job_id"]
+    
+    def finish_job():
+        db = session_factory()
+        MySQLRecordingRepository(db).mark_ended(recording_id, "/path/to/audio.webm", "all done")
+        MySQLTranscriptionJobRepository(db).mark_done(job_id)
+        db.close()
+    
+    timer = threading.Timer(0.2, finish_job)
+    timer.start()
+    response = client.get(f"/recordings/{recording_id}/jobs/{job_id}", params={"wait": 10})
+    timer.join()
+    
+    assert queue.job_ids == [job_id]
+    assert response.json()["status"] == "done"
+    assert response.json()["transcription"] == "all done"
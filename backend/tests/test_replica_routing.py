@@ -0,0 +1,123 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.api import recordings
+from app.core.security import get_current_user_id
+from app.models import Base, engine_options, get_db, get_replica_db
+from app.repositories import routing
+from app.repositories.routing import ReadYourWritesTracker
+from app.repositories.user_repository import MySQLUserRepository
+
+
+def memory_session_factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+def override(session_factory):
+    def get_session():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+    return get_session
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(routing, "_tracker", ReadYourWritesTracker(window=5.0, clock=clock))
+    return clock
+
+
+@pytest.fixture
+def databases():
+    primary, replica = memory_session_factory(), memory_session_factory()
+    for session_factory in (primary, replica):
+        db = session_factory()
+        user = MySQLUserRepository(db).create_user("123456", "[email protected]", "Test User", None)
+        user.id = "user-1"
+        db.commit()
+        db.close()
+    return primary, replica
+
+
+@pytest.fixture
+def client(databases):
+    primary, replica = databases
+    app = FastAPI()
+    app.include_router(recordings.router)
+    app.dependency_overrides[get_db] = override(primary)
+    app.dependency_overrides[get_replica_db] = override(replica)
+    app.dependency_overrides[get_current_user_id] = lambda: "user-1"
+    return TestClient(app)
+
+
+def test_tracker_pins_user_to_primary_for_window():
+    clock = FakeClock()
+    tracker = ReadYourWritesTracker(window=5.0, clock=clock)
+    
+    tracker.record_write("a")
+    clock.now += 4.9
+    assert tracker.pinned_to_primary("a")
+    assert not tracker.pinned_to_primary("b")
+    clock.now += 0.2
+    assert not tracker.pinned_to_primary("a")
+
+
+def test_reads_go_to_replica_except_right_after_own_write(client, clock):
+    recording_id = client.post("/recordings").json()["id"]
+    
+    assert [r["id"] for r in client.get("/recordings").json()] == [recording_id]
+    assert client.get(f"/recordings/{recording_id}").status_code == 200
+    
+    clock.now += 6.0
+    assert client.get("/recordings").json() == []
+    assert client.get(f"/recordings/{recording_id}").status_code == 404
+
+
+def test_last_write_header_pins_reads_on_other_processes(client, clock, monkeypatch):
+    created = client.post("/recordings")
+    recording_id = created.json()["id"]
+    last_write = created.headers["X-Last-Write"]
+    monkeypatch.setattr(routing, "_tracker", ReadYourWritesTracker(window=5.0, clock=clock))
+    
+    assert client.get(f"/recordings/{recording_id}").status_code == 404
+    assert client.get(f"/recordings/{recording_id}", headers={"X-Last-Write": last_write}).status_code == 200
+    assert client.get(f"/recordings/{recording_id}", headers={"X-Last-Write": "garbage"}).status_code == 404
+    clock.now += 6.0
+    assert client.get(f"/recordings/{recording_id}", headers={"X-Last-Write": last_write}).status_code == 404
+
+
+def test_mutating_requests_read_and_write_primary(client, databases, clock):
+    primary, replica = databases
+    recording_id = client.post("/recordings").json()["id"]
+    clock.now += 6.0
+    
+    assert client.patch(f"/recordings/{recording_id}/notes", json={"notes": "hello"}).status_code == 200
+    assert client.get(f"/recordings/{recording_id}").json()["notes"] == "hello"
+    
+    db = replica()
+    assert db.execute(text("SELECT COUNT(*) FROM recordings")).scalar() == 0
+    db.close()
+
+
+def test_pool_sizing_only_applies_to_pooled_backends():
+    mysql = engine_options("mysql+pymysql://user:pass@db/app")
+    sqlite = engine_options("sqlite+aiosqlite:///app.db")
+    
+    assert {"pool_size", "max_overflow", "pool_timeout", "pool_recycle", "pool_pre_ping"} <= set(mysql)
+    assert "pool_size" not in sqlite
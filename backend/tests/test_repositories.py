@@ -1,11 +1,13 @@
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import sessionmaker
 from app.models import Base
 from app.models.user import User
-from app.models.recording import Recording, RecordingStatus
+from app.models.recording import ChunkTranscriptionStatus, Recording, RecordingStatus
 from app.repositories.user_repository import MySQLUserRepository
 from app.repositories.recording_repository import MySQLRecordingRepository
+from app.repositories.chunk_upsert import ChunkUpload, build_chunk_upsert
 
 
 @pytest.fixture
@@ -84,3 +86,80 @@ def test_mark_recording_ended(db_session):
     assert updated.status == RecordingStatus.ended
     assert updated.audio_file_path == "/path/to/audio.webm"
     assert updated.transcription_text == "Test transcription"
+
+
+def test_list_recordings_page_walks_keyset_without_loading_text(db_session):
+    user_repo = MySQLUserRepository(db_session)
+    user = user_repo.create_user(
+        google_id="123456",
+        email="[email protected]",
+        display_name="Test User",
+        avatar_url=None
+    )
+    recording_repo = MySQLRecordingRepository(db_session)
+    created = [recording_repo.create_recording(user.id) for _ in range(5)]
+    for recording in created:
+        recording_repo.mark_ended(recording.id, "/path/to/audio.webm", "x" * 500)
+    expected = [r.id for r in sorted(created, key=lambda r: (r.created_at, r.id), reverse=True)]
+    user_id = user.id
+    db_session.expunge_all()
+    
+    first_page = recording_repo.list_recordings_page(user_id, 3)
+    last = first_page[-1]
+    second_page = recording_repo.list_recordings_page(user_id, 3, cursor=(last.created_at, last.id))
+    
+    assert [r.id for r in first_page + second_page] == expected
+    assert "transcription_text" not in first_page[0].__dict__
+    assert first_page[0].transcript_preview == "x" * 200
+
+
+def test_add_chunks_is_idempotent_per_chunk_index(db_session):
+    user_repo = MySQLUserRepository(db_session)
+    user = user_repo.create_user(
+        google_id="123456",
+        email="[email protected]",
+        display_name="Test User",
+        avatar_url=None
+    )
+    recording_repo = MySQLRecordingRepository(db_session)
+    recording = recording_repo.create_recording(user.id)
+    
+    recording_repo.add_chunks(recording.id, [
+        ChunkUpload(index=0, path="/chunks/chunk_0000.webm", checksum="a"),
+        ChunkUpload(index=1, path="/chunks/chunk_0001.webm", checksum="b")
+    ])
+    resent = recording_repo.add_chunk(recording.id, "/chunks/chunk_0001.webm", 1, None, checksum="c")
+    
+    chunks = recording_repo.list_chunks(recording.id)
+    assert [(c.chunk_index, c.checksum) for c in chunks] == [(0, "a"), (1, "c")]
+    assert resent.checksum == "c"
+
+
+def test_resent_chunk_keeps_transcription_unless_checksum_changes(db_session):
+    user = MySQLUserRepository(db_session).create_user("123456", "[email protected]", "Test User", None)
+    recording_repo = MySQLRecordingRepository(db_session)
+    recording = recording_repo.create_recording(user.id)
+    chunks = recording_repo.add_chunks(recording.id, [
+        ChunkUpload(index=0, path="/chunks/chunk_0000.webm", checksum="a"),
+        ChunkUpload(index=1, path="/chunks/chunk_0001.webm", checksum="b")
+    ], transcribe=True)
+    for chunk in chunks:
+        recording_repo.save_chunk_transcription(chunk.id, f"part {chunk.chunk_index}")
+    
+    resent = recording_repo.add_chunks(recording.id, [
+        ChunkUpload(index=0, path="/chunks/chunk_0000.webm", checksum="a"),
+        ChunkUpload(index=1, path="/chunks/chunk_0001.webm", checksum="changed")
+    ], transcribe=True)
+    
+    assert [(c.transcription_status, c.transcription_text) for c in resent] == [
+        (ChunkTranscriptionStatus.done, "part 0"),
+        (ChunkTranscriptionStatus.pending, None)
+    ]
+
+
+def test_mysql_upsert_compares_checksum_before_overwriting_it():
+    statement = build_chunk_upsert("mysql", "rec-1", [ChunkUpload(index=0, path="/chunks/chunk_0000.webm", checksum="a")], True)
+    sql = str(statement.compile(dialect=mysql.dialect()))
+    updates = sql.split("ON DUPLICATE KEY UPDATE")[1]
+    
+    assert updates.index(" transcription_text =") < updates.index(" checksum = VALUES(checksum)")
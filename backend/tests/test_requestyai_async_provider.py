@@ -0,0 +1,189 @@
+import asyncio
+import io
+import threading
+import httpx
+import pytest
+import pytest_asyncio
+from prometheus_client import REGISTRY
+from app.llm.requestyai_async_provider import AsyncRequestYaiProvider
+from app.llm import resilience
+from app.llm.resilience import CircuitBreaker, CircuitOpenError
+from app.services.audio_service import AudioService
+from tests.fake_transcription_server import FakeTranscriptionServer
+
+
+@pytest.fixture
+def server():
+    fake = FakeTranscriptionServer().start()
+    yield fake
+    fake.stop()
+
+
+@pytest.fixture
+def audio_path(tmp_path):
+    path = tmp_path / "full_audio.webm"
+    path.write_bytes(b"\x1a\x45\xdf\xa3" + b"\x00" * 1024)
+    return str(path)
+
+
+@pytest_asyncio.fixture
+async def client():
+    async with httpx.AsyncClient(timeout=5.0) as async_client:
+        yield async_client
+
+
+def make_provider(server, client, **kwargs):
+    kwargs.setdefault("circuit_breaker", CircuitBreaker(failure_threshold=5, reset_timeout=30))
+    return AsyncRequestYaiProvider(
+        api_key="test-key",
+        base_url=server.base_url,
+        client=client,
+        semaphore=asyncio.Semaphore(4),
+        backoff_base=0.001,
+        **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_reuses_pooled_connection(server, client, audio_path):
+    provider = make_provider(server, client)
+    
+    for _ in range(5):
+        await provider.transcribe_audio(audio_path)
+    
+    assert server.requests == 5
+    assert server.connections == 1
+
+
+@pytest.mark.asyncio
+async def test_retries_server_errors_and_honors_retry_after(server, client, audio_path):
+    server.enqueue(503)
+    server.enqueue(429, headers={"Retry-After": "0"})
+    provider = make_provider(server, client)
+    
+    transcription = await provider.transcribe_audio(audio_path)
+    
+    assert transcription == "transcript 3"
+    assert server.requests == 3
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries(server, client, audio_path):
+    for _ in range(3):
+        server.enqueue(500)
+    provider = make_provider(server, client, max_retries=2)
+    
+    with pytest.raises(httpx.HTTPStatusError):
+        await provider.transcribe_audio(audio_path)
+    assert server.requests == 3
+
+
+@pytest.mark.asyncio
+async def test_does_not_retry_client_errors(server, client, audio_path):
+    server.enqueue(400)
+    provider = make_provider(server, client)
+    
+    with pytest.raises(httpx.HTTPStatusError):
+        await provider.transcribe_audio(audio_path)
+    assert server.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_repeated_failures(server, client, audio_path):
+    for _ in range(2):
+        server.enqueue(503)
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    provider = make_provider(server, client, circuit_breaker=breaker, max_retries=5)
+    
+    with pytest.raises(CircuitOpenError):
+        await provider.transcribe_audio(audio_path)
+    assert server.requests == 2
+    assert breaker.state == "open"
+
+
+def test_half_open_circuit_admits_a_single_trial_call(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    now[0] += 30
+    
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError, match="trial"):
+        breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    
+    now[0] += 30
+    breaker.before_call()
+    breaker.record_success()
+    breaker.before_call()
+    breaker.before_call()
+    assert breaker.state == "closed"
+    
+    breaker.record_failure()
+    now[0] += 30
+    breaker.before_call()
+    now[0] += 30
+    breaker.before_call()
+
+
+@pytest.mark.asyncio
+async def test_streams_concatenated_chunks_and_rewinds_on_retry(server, client, tmp_path):
+    audio_service = AudioService(storage_path=str(tmp_path))
+    paths = [audio_service.save_chunk("rec-1", index, data) for index, data in enumerate([b"first-", b"second"])]
+    server.enqueue(503)
+    provider = make_provider(server, client)
+    
+    with audio_service.open_chunks(paths) as reader:
+        await provider.transcribe_stream(reader, "full_audio.webm")
+    
+    assert server.requests == 2
+    assert b"first-second" in server.last_body
+
+
+class UnsizedReader(io.RawIOBase):
+    def __init__(self, data: bytes):
+        self.data = io.BytesIO(data)
+        self.read_threads = set()
+    
+    def readable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self.data.tell()
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_END:
+            raise ValueError("unsized")
+        return self.data.seek(offset, whence)
+    
+    def readinto(self, buffer) -> int:
+        self.read_threads.add(threading.get_ident())
+        return self.data.readinto(buffer)
+
+
+@pytest.mark.asyncio
+async def test_reads_unsized_stream_off_the_event_loop(server, client):
+    reader = UnsizedReader(b"remote-audio")
+    provider = make_provider(server, client)
+    
+    await provider.transcribe_stream(reader, "full_audio.webm")
+    
+    assert b"remote-audio" in server.last_body
+    assert reader.read_threads and threading.get_ident() not in reader.read_threads
+
+
+@pytest.mark.asyncio
+async def test_records_latency_status_and_retry_metrics(server, client, audio_path):
+    def sample(name, **labels):
+        return REGISTRY.get_sample_value(name, {"provider": "requestyai", **labels}) or 0
+    
+    before = (sample("llm_responses_total", status="503"), sample("llm_retries_total"), sample("llm_request_duration_seconds_count"))
+    server.enqueue(503)
+    provider = make_provider(server, client)
+    
+    await provider.transcribe_audio(audio_path)
+    
+    after = (sample("llm_responses_total", status="503"), sample("llm_retries_total"), sample("llm_request_duration_seconds_count"))
+    assert [b - a for a, b in zip(before, after)] == [1, 1, 2]
@@ -0,0 +1,93 @@
+import hashlib
+import pytest
+from app.core.config import settings
+from app.repositories.chunk_ranges import index_ranges, missing_ranges
+from app.services.transcription_queue import get_transcription_queue
+
+
+class RecordingQueue:
+    def __init__(self):
+        self.job_ids = []
+    
+    def enqueue(self, job_id: str):
+        self.job_ids.append(job_id)
+
+
+@pytest.fixture
+def queue(client):
+    queue = RecordingQueue()
+    client.app.dependency_overrides[get_transcription_queue] = lambda: queue
+    return queue
+
+
+@pytest.fixture
+def recording_id(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "AUDIO_STORAGE_PATH", str(tmp_path))
+    return client.post("/recordings").json()["id"]
+
+
+def upload(client, recording_id, indexes):
+    files = [("audio_chunks", (f"chunk_{i}.webm", f"audio {i}".encode())) for i in indexes]
+    response = client.post(f"/recordings/{recording_id}/chunks/batch", data={"chunk_indices": indexes}, files=files)
+    assert response.status_code == 200
+
+
+def test_index_ranges_compact_received_chunks():
+    received = index_ranges([0, 1, 2, 5, 7, 8])
+    
+    assert received == [(0, 2), (5, 5), (7, 8)]
+    assert missing_ranges(received) == [(3, 4), (6, 6)]
+    assert missing_ranges(received, expected_count=11) == [(3, 4), (6, 6), (9, 10)]
+    assert missing_ranges(received, expected_count=4) == [(3, 3)]
+    assert missing_ranges([], expected_count=2) == [(0, 1)]
+    assert missing_ranges(index_ranges([-1, 0, 1])) == []
+
+
+def test_chunk_status_lists_received_ranges_with_checksums(client, recording_id):
+    upload(client, recording_id, [0, 1, 4])
+    
+    response = client.get(f"/recordings/{recording_id}/chunks", params={"expected_chunks": 6})
+    
+    body = response.json()
+    assert response.status_code == 200
+    assert body["received"] == [
+        {"start": 0, "end": 1, "checksums": [hashlib.sha256(f"audio {i}".encode()).hexdigest() for i in (0, 1)]},
+        {"start": 4, "end": 4, "checksums": [hashlib.sha256(b"audio 4").hexdigest()]},
+    ]
+    assert body["missing"] == [{"start": 2, "end": 3}, {"start": 5, "end": 5}]
+    assert (body["received_count"], body["received_bytes"], body["next_chunk_index"]) == (3, 21, 5)
+
+
+def test_finish_refuses_recordings_with_missing_chunks(client, queue, recording_id):
+    upload(client, recording_id, [0, 2])
+    
+    refused = client.post(f"/recordings/{recording_id}/finish")
+    trailing = client.post(f"/recordings/{recording_id}/finish", params={"expected_chunks": 5})
+    upload(client, recording_id, [1])
+    accepted = client.post(f"/recordings/{recording_id}/finish")
+    
+    assert refused.status_code == 409
+    assert refused.json()["detail"]["missing"] == [{"start": 1, "end": 1}]
+    assert trailing.json()["detail"]["missing"] == [{"start": 1, "end": 1}, {"start": 3, "end": 4}]
+    assert accepted.status_code == 202
+    assert accepted.json()["missing"] == []
+    assert queue.job_ids == [accepted.json()["job_id"]]
+
+
+def test_finish_with_gaps_can_be_forced_or_only_warned(client, queue, recording_id, monkeypatch):
+    upload(client, recording_id, [0, 3])
+    
+    forced = client.post(f"/recordings/{recording_id}/finish", params={"allow_missing": True})
+    
+    assert forced.status_code == 202
+    assert forced.json()["missing"] == [{"start": 1, "end": 2}]
+    
+    other_id = client.post("/recordings").json()["id"]
+    upload(client, other_id, [1])
+    monkeypatch.setattr(settings, "FINISH_REJECT_MISSING_CHUNKS", False)
+    
+    warned = client.post(f"/recordings/{other_id}/finish")
+    
+    assert warned.status_code == 202
+    assert warned.json()["missing"] == [{"start": 0, "end": 0}]
+    assert len(queue.job_ids) == 2
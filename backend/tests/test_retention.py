@@ -0,0 +1,190 @@
+import os
+import time
+from datetime import datetime, timedelta
+import httpx
+import pytest
+from sqlalchemy import update
+from app.models.recording import Recording, RecordingChunk, RecordingStatus
+from app.repositories.recording_repository import MySQLRecordingRepository
+from app.repositories.transcription_job_repository import MySQLTranscriptionJobRepository
+from app.services.audio_service import AudioService
+from app.services.retention import RetentionSweeper
+from app.storage.directory import DirectoryChunkStorage
+from app.storage.s3 import S3ChunkStorage, S3Client
+from app.storage.segment import INDEX_RECORD, SegmentChunkStorage
+from tests.fake_s3_server import FakeS3Server
+
+
+def record(session_factory, user_id, storage, chunks, status=RecordingStatus.paused, days_old=0):
+    audio_service = AudioService(storage_path=str(getattr(storage, "root", "")), storage=storage)
+    db = session_factory()
+    try:
+        repo = MySQLRecordingRepository(db)
+        recording = repo.create_recording(user_id)
+        for index, data in enumerate(chunks):
+            repo.add_chunk(recording.id, audio_service.save_chunk(recording.id, index, data), index, None, size_bytes=len(data))
+        stamp = datetime.utcnow() - timedelta(days=days_old)
+        db.execute(update(RecordingChunk).where(RecordingChunk.recording_id == recording.id).values(uploaded_at=stamp))
+        db.execute(update(Recording).where(Recording.id == recording.id).values(status=status, updated_at=stamp))
+        db.commit()
+        return recording.id
+    finally:
+        db.close()
+
+
+def backdate(storage, minutes):
+    stamp = time.time() - minutes * 60
+    for stored in storage.list_objects():
+        os.utime(stored.locator, (stamp, stamp))
+
+
+def chunk_count(session_factory, recording_id):
+    db = session_factory()
+    try:
+        return db.query(RecordingChunk).filter(RecordingChunk.recording_id == recording_id).count()
+    finally:
+        db.close()
+
+
+def make_sweeper(session_factory, storage, **kwargs):
+    options = {"retention_days": {"active": 7, "paused": 7}, "deletes_per_second": 0, "orphan_grace": timedelta(minutes=60)}
+    return RetentionSweeper(session_factory, storage, **{**options, **kwargs})
+
+
+def test_expired_recordings_lose_audio_and_chunk_rows(session_factory, user_id, tmp_path):
+    storage = SegmentChunkStorage(str(tmp_path), fsync_mode="never")
+    abandoned = record(session_factory, user_id, storage, [b"a" * 10, b"b" * 20], RecordingStatus.paused, days_old=10)
+    live = record(session_factory, user_id, storage, [b"c" * 5], RecordingStatus.active, days_old=1)
+    ended = record(session_factory, user_id, storage, [b"d" * 5], RecordingStatus.ended, days_old=100)
+    
+    report = make_sweeper(session_factory, storage).sweep()
+    
+    assert (report.recordings, report.files, report.bytes) == (1, 2, 30 + 2 * INDEX_RECORD.size)
+    assert not (tmp_path / abandoned).exists()
+    assert chunk_count(session_factory, abandoned) == 0
+    assert chunk_count(session_factory, live) == 1
+    assert chunk_count(session_factory, ended) == 1
+    assert {stored.recording_id for stored in storage.list_objects()} == {live, ended}
+    
+    db = session_factory()
+    recording = db.get(Recording, abandoned)
+    assert recording.status == RecordingStatus.paused
+    assert recording.updated_at < datetime.utcnow() - timedelta(days=9)
+    db.close()
+    assert make_sweeper(session_factory, storage).sweep().recordings == 0
+
+
+def test_recent_uploads_and_pending_jobs_keep_recordings_alive(session_factory, user_id, tmp_path):
+    storage = DirectoryChunkStorage(str(tmp_path))
+    finishing = record(session_factory, user_id, storage, [b"a"], RecordingStatus.paused, days_old=10)
+    resumed = record(session_factory, user_id, storage, [b"b"], RecordingStatus.active, days_old=10)
+    db = session_factory()
+    MySQLTranscriptionJobRepository(db).create_job(finishing, storage.full_audio_path(finishing), 3)
+    MySQLRecordingRepository(db).add_chunk(resumed, AudioService(str(tmp_path), storage).save_chunk(resumed, 1, b"c"), 1, None)
+    db.execute(update(Recording).where(Recording.id == resumed).values(updated_at=datetime.utcnow() - timedelta(days=10)))
+    db.commit()
+    db.close()
+    
+    assert make_sweeper(session_factory, storage).sweep().recordings == 0
+    assert chunk_count(session_factory, finishing) == 1
+    assert chunk_count(session_factory, resumed) == 2
+
+
+def test_dry_run_reports_without_deleting(session_factory, user_id, tmp_path):
+    storage = DirectoryChunkStorage(str(tmp_path))
+    abandoned = record(session_factory, user_id, storage, [b"a" * 10, b"b" * 10], RecordingStatus.active, days_old=30)
+    (tmp_path / "deleted-recording").mkdir()
+    (tmp_path / "deleted-recording" / "chunk_0000.webm").write_bytes(b"x" * 7)
+    backdate(storage, 120)
+    
+    report = make_sweeper(session_factory, storage, dry_run=True).sweep()
+    
+    assert (report.recordings, report.files, report.bytes) == (1, 2, 20)
+    assert (report.orphan_files, report.orphan_bytes) == (1, 7)
+    assert len(list(storage.list_objects())) == 3
+    assert chunk_count(session_factory, abandoned) == 2
+
+
+def test_orphaned_files_are_reconciled_after_grace_period(session_factory, user_id, tmp_path):
+    storage = DirectoryChunkStorage(str(tmp_path))
+    kept = record(session_factory, user_id, storage, [b"a" * 4], RecordingStatus.active)
+    (tmp_path / kept / "chunk_0007.webm").write_bytes(b"stray")
+    (tmp_path / kept / "chunk_0008.webm.abc.part").write_bytes(b"partial")
+    (tmp_path / "deleted-recording").mkdir()
+    (tmp_path / "deleted-recording" / "full_audio.webm").write_bytes(b"x" * 9)
+    backdate(storage, 120)
+    (tmp_path / kept / "chunk_0009.webm").write_bytes(b"in flight")
+    
+    report = make_sweeper(session_factory, storage).sweep()
+    
+    assert (report.orphan_files, report.orphan_bytes) == (3, 5 + 7 + 9)
+    assert sorted(stored.name for stored in storage.list_objects()) == ["chunk_0000.webm", "chunk_0009.webm"]
+    assert not (tmp_path / "deleted-recording").exists()
+
+
+def test_deletes_are_rate_limited(session_factory, user_id, tmp_path):
+    storage = DirectoryChunkStorage(str(tmp_path))
+    record(session_factory, user_id, storage, [b"a"] * 6, RecordingStatus.paused, days_old=10)
+    
+    start = time.perf_counter()
+    report = make_sweeper(session_factory, storage, deletes_per_second=20, batch_size=1).sweep()
+    
+    assert report.files == 6
+    assert time.perf_counter() - start >= 5 / 20
+
+
+class FailingDeleteStorage(DirectoryChunkStorage):
+    def __init__(self, root: str):
+        super().__init__(root)
+        self.fail = True
+    
+    def delete_chunks(self, locators):
+        if self.fail:
+            raise OSError("storage unavailable")
+        super().delete_chunks(locators)
+
+
+def test_failed_file_deletes_are_left_to_the_orphan_sweep(session_factory, user_id, tmp_path):
+    storage = FailingDeleteStorage(str(tmp_path))
+    expired = record(session_factory, user_id, storage, [b"a", b"b"], RecordingStatus.paused, days_old=10)
+    
+    report = make_sweeper(session_factory, storage).sweep()
+    
+    assert (report.recordings, report.files) == (1, 0)
+    assert chunk_count(session_factory, expired) == 0
+    assert len(list(storage.list_objects(expired))) == 2
+    
+    storage.fail = False
+    backdate(storage, 120)
+    report = make_sweeper(session_factory, storage).sweep()
+    
+    assert (report.recordings, report.orphan_files) == (0, 2)
+    assert list(storage.list_objects()) == []
+
+
+def test_unknown_status_in_retention_policy_is_rejected(session_factory):
+    with pytest.raises(ValueError):
+        RetentionSweeper(session_factory, retention_days={"archived": 1})
+
+
+def test_s3_orphans_are_listed_across_pages_and_deleted(session_factory, user_id):
+    server = FakeS3Server(min_part_size=8).start()
+    http_client = httpx.Client()
+    try:
+        storage = S3ChunkStorage(S3Client(server.endpoint_url, "audio", "us-east-1", "key", "secret", http_client=http_client))
+        kept = record(session_factory, user_id, storage, [b"a" * 3, b"b" * 3], RecordingStatus.active)
+        for index in range(3):
+            server.objects[f"recordings/gone/chunk_{index:04d}.webm"] = b"z" * 4
+        server.objects["elsewhere/other.webm"] = b"keep"
+        for key in server.objects:
+            server.modified[key] = time.time() - 7200
+        server.page_size = 2
+        
+        report = make_sweeper(session_factory, storage).sweep()
+        
+        assert (report.orphan_files, report.orphan_bytes) == (3, 12)
+        assert sorted(server.objects) == ["elsewhere/other.webm", f"recordings/{kept}/chunk_0000.webm", f"recordings/{kept}/chunk_0001.webm"]
+        assert server.operations["ListObjectsV2"] == 3
+    finally:
+        http_client.close()
+        server.stop()
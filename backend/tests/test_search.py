@@ -0,0 +1,86 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.models import Base
+from app.repositories.user_repository import MySQLUserRepository
+from app.repositories.recording_repository import MySQLRecordingRepository
+from app.search.index import rebuild_search_index, set_search_index
+from app.search.inverted_index import InMemorySearchIndex
+from app.search.text import build_snippet, tokenize
+
+
+@pytest.fixture
+def index():
+    search_index = InMemorySearchIndex()
+    set_search_index(search_index)
+    yield search_index
+    set_search_index(None)
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+def test_tokenize_lowercases_and_drops_stopwords():
+    assert tokenize("The Patient reported chest-pain") == ["patient", "reported", "chest", "pain"]
+
+
+def test_build_snippet_highlights_and_escapes():
+    snippet = build_snippet(["Dose <b>10mg</b> of aspirin daily"], {"aspirin"})
+    
+    assert snippet == "Dose &lt;b&gt;10mg&lt;/b&gt; of <mark>aspirin</mark> daily"
+
+
+def test_bm25_ranks_denser_matches_first_and_scopes_to_user(index):
+    index.index_document("rec-1", "user-1", "aspirin once mentioned among many other unrelated words here", None)
+    index.index_document("rec-2", "user-1", "aspirin aspirin dosage", None)
+    index.index_document("rec-3", "user-2", "aspirin aspirin aspirin", None)
+    
+    hits = index.search("user-1", "aspirin", limit=10, offset=0)
+    
+    assert [hit.recording_id for hit in hits] == ["rec-2", "rec-1"]
+    assert index.search("user-1", "aspirin", limit=1, offset=1)[0].recording_id == "rec-1"
+
+
+def test_index_updates_when_repository_writes_text(index, db_session):
+    user = MySQLUserRepository(db_session).create_user(
+        google_id="123456",
+        email="[email protected]",
+        display_name="Test User",
+        avatar_url=None
+    )
+    repo = MySQLRecordingRepository(db_session)
+    recording = repo.create_recording(user.id)
+    
+    repo.mark_ended(recording.id, "/path/to/audio.webm", "patient reports migraine")
+    repo.update_notes(recording.id, "follow up on insomnia")
+    
+    assert [hit.recording_id for hit in index.search(user.id, "migraine", 10, 0)] == [recording.id]
+    assert [hit.recording_id for hit in index.search(user.id, "insomnia", 10, 0)] == [recording.id]
+    
+    repo.update_notes(recording.id, "resolved")
+    assert index.search(user.id, "insomnia", 10, 0) == []
+    
+    rebuilt = InMemorySearchIndex()
+    rebuild_search_index(rebuilt, session_factory=lambda: db_session)
+    assert len(rebuilt) == 1
+
+
+def test_rolled_back_text_is_not_indexed(index, db_session):
+    user = MySQLUserRepository(db_session).create_user("123456", "[email protected]", "Test User", None)
+    recording = MySQLRecordingRepository(db_session).create_recording(user.id)
+    
+    recording.notes = "draft about vertigo"
+    db_session.flush()
+    db_session.rollback()
+    
+    assert index.search(user.id, "vertigo", 10, 0) == []
+    recording.notes = "confirmed vertigo"
+    db_session.commit()
+    assert [hit.recording_id for hit in index.search(user.id, "vertigo", 10, 0)] == [recording.id]
@@ -0,0 +1,127 @@
+import hashlib
+from io import BytesIO
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.models import Base
+from app.repositories.user_repository import MySQLUserRepository
+from app.repositories.recording_repository import MySQLRecordingRepository
+from app.services.audio_service import AudioService, ChunkTooLargeError
+from app.storage.directory import DirectoryChunkStorage
+from app.storage.local import is_range_locator
+from app.storage.migrate import migrate
+from app.storage.segment import SegmentChunkStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return SegmentChunkStorage(str(tmp_path), fsync_mode="batch", fsync_batch_size=2)
+
+
+@pytest.fixture
+def audio_service(tmp_path, storage):
+    return AudioService(storage_path=str(tmp_path), storage=storage)
+
+
+def test_chunks_are_appended_to_one_segment_with_index(audio_service, storage, tmp_path):
+    chunks = [b"abc", b"defgh", b"ij"]
+    
+    saved = [audio_service.save_chunk_stream("rec-1", index, BytesIO(data)) for index, data in enumerate(chunks)]
+    
+    assert sorted(p.name for p in (tmp_path / "rec-1").iterdir()) == ["segments.dat", "segments.idx"]
+    assert (tmp_path / "rec-1" / "segments.dat").read_bytes() == b"abcdefghij"
+    entries = storage.read_index("rec-1")
+    assert [(e.offset, e.length) for e in entries.values()] == [(0, 3), (3, 5), (8, 2)]
+    assert entries[1].checksum == hashlib.sha256(b"defgh").hexdigest() == saved[1].checksum
+
+
+def test_reader_and_assembly_use_ranges(audio_service):
+    paths = [audio_service.save_chunk("rec-1", index, data) for index, data in enumerate([b"first-", b"", b"second"])]
+    
+    with audio_service.open_chunks(paths[2:]) as reader:
+        assert reader.read() == b"second"
+    
+    full_audio_path = audio_service.assemble_chunks("rec-1", [paths[2], paths[0]])
+    with open(full_audio_path, "rb") as f:
+        assert f.read() == b"secondfirst-"
+
+
+def test_oversized_chunk_is_truncated_from_segment(audio_service, storage, tmp_path):
+    audio_service.save_chunk("rec-1", 0, b"kept")
+    
+    with pytest.raises(ChunkTooLargeError):
+        audio_service.save_chunk_stream("rec-1", 1, BytesIO(b"x" * 100), max_size=10, block_size=8)
+    
+    assert (tmp_path / "rec-1" / "segments.dat").read_bytes() == b"kept"
+    assert list(storage.read_index("rec-1")) == [0]
+
+
+def test_unindexed_tail_and_torn_index_record_are_recovered_on_next_write(audio_service, storage, tmp_path):
+    audio_service.save_chunk("rec-1", 0, b"kept")
+    with open(tmp_path / "rec-1" / "segments.dat", "ab") as segment:
+        segment.write(b"orphaned")
+    with open(tmp_path / "rec-1" / "segments.idx", "ab") as index:
+        index.write(b"torn")
+    
+    path = audio_service.save_chunk("rec-1", 1, b"next")
+    
+    assert (tmp_path / "rec-1" / "segments.dat").read_bytes() == b"keptnext"
+    assert [(e.offset, e.length) for e in storage.read_index("rec-1").values()] == [(0, 4), (4, 4)]
+    with audio_service.open_chunks([path]) as reader:
+        assert reader.read() == b"next"
+
+
+def test_resent_chunk_index_points_at_latest_copy(audio_service, storage):
+    audio_service.save_chunk("rec-1", 0, b"old")
+    path = audio_service.save_chunk("rec-1", 0, b"new!")
+    
+    assert storage.read_index("rec-1")[0].offset == 3
+    with audio_service.open_chunks([path]) as reader:
+        assert reader.read() == b"new!"
+
+
+def test_batched_fsync_is_flushed_on_assembly(audio_service, storage, monkeypatch):
+    synced = []
+    monkeypatch.setattr("app.storage.segment.os.fsync", synced.append)
+    
+    paths = [audio_service.save_chunk("rec-1", index, b"x") for index in range(3)]
+    assert len(synced) == 2
+    
+    audio_service.assemble_chunks("rec-1", paths)
+    assert len(synced) == 4
+
+
+def test_cleanup_removes_segment_and_index(audio_service, tmp_path):
+    paths = [audio_service.save_chunk("rec-1", index, b"data") for index in range(2)]
+    
+    audio_service.cleanup_chunks(paths)
+    
+    assert not (tmp_path / "rec-1").exists()
+
+
+def test_migration_packs_directory_chunks(tmp_path):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    legacy = AudioService(storage_path=str(tmp_path), storage=DirectoryChunkStorage(str(tmp_path)))
+    
+    db = session_factory()
+    user = MySQLUserRepository(db).create_user(google_id="1", email="[email protected]", display_name="User", avatar_url=None)
+    repo = MySQLRecordingRepository(db)
+    recording_id = repo.create_recording(user.id).id
+    for index, data in enumerate([b"hello ", b"world"]):
+        repo.add_chunk(recording_id, legacy.save_chunk(recording_id, index, data), index, None)
+    db.close()
+    
+    assert migrate(session_factory, str(tmp_path), dry_run=True) == 2
+    assert migrate(session_factory, str(tmp_path)) == 2
+    assert migrate(session_factory, str(tmp_path)) == 0
+    
+    db = session_factory()
+    paths = [chunk.audio_blob_path for chunk in MySQLRecordingRepository(db).list_chunks(recording_id)]
+    db.close()
+    assert all(is_range_locator(path) for path in paths)
+    assert sorted(p.name for p in (tmp_path / recording_id).iterdir()) == ["segments.dat", "segments.idx"]
+    with legacy.open_chunks(paths) as reader:
+        assert reader.read() == b"hello world"
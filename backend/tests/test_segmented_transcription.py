@@ -0,0 +1,118 @@
+import asyncio
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.models.recording import RecordingChunk
+from app.models.transcription_cache import TranscriptionCacheEntry
+from app.services.audio_service import AudioService
+from app.services.segmented_transcription import (
+    Segment,
+    SegmentedTranscriber,
+    WEBM_CLUSTER_ID,
+    plan_segments,
+    stitch_segments,
+    webm_header_length,
+)
+from app.services.transcription_cache import TranscriptionCache
+
+HEADER = b"EBMLHEADER"
+
+
+class SegmentProvider:
+    def __init__(self, failures_per_filename=None):
+        self.failures = dict(failures_per_filename or {})
+        self.calls = []
+        self.with_header = {}
+        self.active = 0
+        self.max_active = 0
+    
+    async def transcribe_stream(self, stream, filename: str) -> str:
+        self.calls.append(filename)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if self.failures.get(filename, 0) > 0:
+                self.failures[filename] -= 1
+                raise RuntimeError("provider unavailable")
+            data = stream.read()
+            self.with_header[filename] = data.startswith(HEADER)
+            return " ".join(part.decode() for part in data.split(b"|") if part.startswith(b"w"))
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def cache():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    TranscriptionCacheEntry.__table__.create(engine)
+    return TranscriptionCache(session_factory=sessionmaker(bind=engine))
+
+
+@pytest.fixture
+def chunks(tmp_path):
+    audio_service = AudioService(storage_path=str(tmp_path))
+    saved = []
+    for index in range(6):
+        data = f"|w{index}a|w{index}b|w{index}c|".encode()
+        if index == 0:
+            data = HEADER + WEBM_CLUSTER_ID + data
+        path = audio_service.save_chunk("rec", index, data)
+        saved.append(RecordingChunk(chunk_index=index, audio_blob_path=path, duration_seconds=10.0))
+    return audio_service, saved
+
+
+def test_plan_segments_overlaps_on_chunk_boundaries():
+    assert plan_segments([10.0] * 10, 40.0, 10.0) == [Segment(0, 0, 4), Segment(1, 3, 7), Segment(2, 6, 10)]
+    assert plan_segments([10.0] * 3, 40.0, 10.0) == [Segment(0, 0, 3)]
+    assert plan_segments([50.0, 50.0], 40.0, 100.0) == [Segment(0, 0, 1), Segment(1, 1, 2)]
+
+
+def test_stitch_segments_removes_duplicated_overlap():
+    assert stitch_segments(["one two three four five", "three four five six seven"]) == "one two three four five six seven"
+    assert stitch_segments(["the quick brown fox.", "Quick brown fox jumps over"]) == "the Quick brown fox jumps over"
+    assert stitch_segments(["alpha beta", "gamma delta"]) == "alpha beta gamma delta"
+
+
+def test_webm_header_length_stops_at_first_cluster():
+    assert webm_header_length(HEADER + WEBM_CLUSTER_ID + b"data") == len(HEADER)
+    assert webm_header_length(b"no cluster here") == 0
+
+
+@pytest.mark.asyncio
+async def test_segments_are_transcribed_concurrently_and_stitched(cache, chunks):
+    audio_service, saved = chunks
+    provider = SegmentProvider()
+    transcriber = SegmentedTranscriber(cache, segment_seconds=30.0, overlap_seconds=10.0, concurrency=2, retry_delay=0)
+    
+    text = await transcriber.transcribe(provider, audio_service, saved)
+    
+    assert sorted(provider.calls) == ["segment_0000.webm", "segment_0001.webm", "segment_0002.webm"]
+    assert all(provider.with_header.values())
+    assert provider.max_active == 2
+    assert text.split() == [f"w{index}{part}" for index in range(6) for part in "abc"]
+
+
+@pytest.mark.asyncio
+async def test_failed_segment_is_retried_alone(cache, chunks):
+    audio_service, saved = chunks
+    provider = SegmentProvider({"segment_0001.webm": 1})
+    transcriber = SegmentedTranscriber(cache, segment_seconds=30.0, overlap_seconds=10.0, retry_delay=0)
+    
+    await transcriber.transcribe(provider, audio_service, saved)
+    
+    assert provider.calls.count("segment_0000.webm") == 1
+    assert provider.calls.count("segment_0001.webm") == 2
+    assert provider.calls.count("segment_0002.webm") == 1
+
+
+@pytest.mark.asyncio
+async def test_short_recording_is_sent_whole(cache, chunks):
+    audio_service, saved = chunks
+    provider = SegmentProvider()
+    
+    text = await SegmentedTranscriber(cache, segment_seconds=600.0).transcribe(provider, audio_service, saved)
+    
+    assert provider.calls == ["full_audio.webm"]
+    assert text.split() == [f"w{index}{part}" for index in range(6) for part in "abc"]
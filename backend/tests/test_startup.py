@@ -0,0 +1,83 @@
+import logging
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect, text
+from app.core.startup import StartupTimer
+from app.models import Base
+from app.models.schema import alembic_config, object_filter, upgrade_database
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def test_importing_app_needs_no_settings_or_database():
+    script = (
+        "import app.main\n"
+        "from app.core.config import get_settings\n"
+        "from app import models\n"
+        "assert get_settings.cache_info().currsize == 0\n"
+        "assert models._engines == {}\n"
+    )
+    env = {"PATH": os.environ.get("PATH", "")}
+    subprocess.run([sys.executable, "-c", script], cwd=BACKEND_DIR, env=env, check=True, timeout=60)
+
+
+def test_migrations_match_models(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'schema.db'}")
+    with engine.begin() as connection:
+        upgrade_database(connection=connection)
+    
+    with engine.connect() as connection:
+        context = MigrationContext.configure(connection, opts={"include_object": object_filter(connection.dialect.name)})
+        diff = compare_metadata(context, Base.metadata)
+        tables = set(inspect(connection).get_table_names())
+    
+    assert diff == []
+    assert {"users", "recordings", "recording_chunks", "transcription_jobs", "transcription_cache"} <= tables
+
+
+
+def test_unversioned_baseline_database_is_stamped_and_upgraded(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'baseline.db'}")
+    with engine.begin() as connection:
+        upgrade_database("0001", connection=connection)
+        connection.execute(text("DROP TABLE alembic_version"))
+        connection.execute(text("INSERT INTO users (id, google_id, email, display_name) VALUES ('u', 'g', 'e', 'n')"))
+        connection.execute(text("INSERT INTO recordings (id, user_id, status) VALUES ('r', 'u', 'paused')"))
+        connection.execute(text(
+            "INSERT INTO recording_chunks (id, recording_id, chunk_index, audio_blob_path, uploaded_at) VALUES "
+            "('c0', 'r', 0, 'a', '2024-01-01 00:00:00'), ('c0-resent', 'r', 0, 'a', '2024-01-01 00:00:05'), "
+            "('c1', 'r', 1, 'b', '2024-01-01 00:00:01')"
+        ))
+    
+    with engine.begin() as connection:
+        upgrade_database(connection=connection)
+    
+    with engine.connect() as connection:
+        revision = MigrationContext.configure(connection).get_current_revision()
+        tables = set(inspect(connection).get_table_names())
+        recording = connection.execute(text("SELECT incremental_transcription FROM recordings")).one()
+        chunks = connection.execute(text("SELECT id, transcription_status FROM recording_chunks ORDER BY chunk_index")).all()
+    assert revision == ScriptDirectory.from_config(alembic_config()).get_current_head()
+    assert {"transcription_jobs", "transcription_cache", "rate_limit_buckets"} <= tables
+    assert recording.incremental_transcription == 0
+    assert [tuple(chunk) for chunk in chunks] == [("c0-resent", None), ("c1", None)]
+
+def test_startup_timer_warns_when_over_budget(caplog):
+    timer = StartupTimer()
+    timer.import_seconds = 100.0
+    
+    with caplog.at_level(logging.WARNING, logger="app.core.startup"):
+        timer.mark_ready(time.perf_counter())
+        timer.mark_first_request(time.perf_counter())
+    
+    report = timer.report()
+    assert report["within_budget"] is False
+    assert report["first_request_seconds"] < report["first_request_budget_seconds"]
+    assert "Startup import took" in caplog.text
+    assert "first request" not in caplog.text
@@ -0,0 +1,161 @@
+from contextlib import asynccontextmanager
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from starlette.websockets import WebSocketDisconnect
+from app.admission.controller import CHUNK_UPLOADS, AdmissionController, get_admission_controller
+from app.admission.memory import InMemoryRateLimitBackend
+from app.api import streaming
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.models import Base
+from app.repositories.dependencies import AwaitableRepository, get_recording_repository_opener
+from app.repositories.recording_repository import MySQLRecordingRepository
+from app.repositories.user_repository import MySQLUserRepository
+from app.services.chunk_transcriber import ChunkTranscriber, get_chunk_transcriber
+from app.services.transcription_cache import TranscriptionCache
+
+
+class FakeStreamProvider:
+    def transcribe_stream(self, stream, filename: str) -> str:
+        return f"heard {stream.read().decode()}"
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'streaming.db'}",
+        connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def users(session_factory):
+    db = session_factory()
+    repo = MySQLUserRepository(db)
+    ids = [repo.create_user(f"google-{i}", f"user{i}@example.com", f"User {i}", None).id for i in range(2)]
+    db.close()
+    return ids
+
+
+def create_recording(session_factory, user_id, incremental=False):
+    db = session_factory()
+    recording_id = MySQLRecordingRepository(db).create_recording(user_id, incremental_transcription=incremental).id
+    db.close()
+    return recording_id
+
+
+@pytest.fixture
+def client(session_factory, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "AUDIO_STORAGE_PATH", str(tmp_path))
+    
+    @asynccontextmanager
+    async def open_repository():
+        db = session_factory()
+        try:
+            yield AwaitableRepository(MySQLRecordingRepository(db))
+        finally:
+            db.close()
+    
+    transcriber = ChunkTranscriber(
+        session_factory=session_factory,
+        provider_factory=FakeStreamProvider,
+        cache=TranscriptionCache(session_factory=session_factory)
+    )
+    app = FastAPI()
+    app.include_router(streaming.router)
+    app.dependency_overrides[get_recording_repository_opener] = lambda: open_repository
+    app.dependency_overrides[get_chunk_transcriber] = lambda: transcriber
+    return TestClient(app)
+
+
+def stream_url(recording_id, user_id):
+    return f"/recordings/{recording_id}/stream?token={create_access_token({'sub': user_id})}"
+
+
+def test_rejects_bad_token_and_foreign_recording(client, session_factory, users):
+    recording_id = create_recording(session_factory, users[0])
+    
+    with pytest.raises(WebSocketDisconnect) as bad_token:
+        with client.websocket_connect(f"/recordings/{recording_id}/stream?token=nope"):
+            pass
+    with pytest.raises(WebSocketDisconnect) as foreign:
+        with client.websocket_connect(stream_url(recording_id, users[1])):
+            pass
+    
+    assert bad_token.value.code == 1008
+    assert foreign.value.code == 1008
+
+
+def test_frames_are_acknowledged_and_stored(client, session_factory, users):
+    recording_id = create_recording(session_factory, users[0])
+    
+    with client.websocket_connect(stream_url(recording_id, users[0])) as ws:
+        ready = ws.receive_json()
+        acks = []
+        for frame in (b"one", b"two", b"three"):
+            ws.send_bytes(frame)
+            acks.append(ws.receive_json())
+        ws.send_text('{"type": "pause"}')
+        paused = ws.receive_json()
+    
+    with client.websocket_connect(stream_url(recording_id, users[0])) as ws:
+        resumed = ws.receive_json()
+    
+    db = session_factory()
+    repo = MySQLRecordingRepository(db)
+    chunks = repo.list_chunks(recording_id)
+    status = repo.get_recording(recording_id).status.value
+    db.close()
+    assert ready["type"] == "ready" and ready["next_chunk_index"] == 0
+    assert [(ack["type"], ack["chunk_index"]) for ack in acks] == [("ack", 0), ("ack", 1), ("ack", 2)]
+    assert acks[-1]["bytes_received"] == 11
+    assert [chunk.size_bytes for chunk in chunks] == [3, 3, 5]
+    assert paused["status"] == status == "paused"
+    assert resumed["next_chunk_index"] == 3
+
+
+def test_partial_transcripts_are_pushed_for_incremental_recordings(client, session_factory, users):
+    recording_id = create_recording(session_factory, users[0], incremental=True)
+    
+    with client.websocket_connect(stream_url(recording_id, users[0])) as ws:
+        ws.receive_json()
+        ws.send_bytes(b"hello")
+        ws.send_bytes(b"world")
+        messages = [ws.receive_json() for _ in range(4)]
+    
+    partials = sorted((m for m in messages if m["type"] == "partial"), key=lambda m: len(m["transcript"]))
+    assert [m["type"] for m in messages].count("ack") == 2
+    assert sorted(m["text"] for m in partials) == ["heard hello", "heard world"]
+    assert partials[-1]["transcript"] == "heard hello heard world"
+
+
+def test_storage_failure_reports_error_and_keeps_stream_open(client, session_factory, users, monkeypatch):
+    recording_id = create_recording(session_factory, users[0])
+    controller = AdmissionController(InMemoryRateLimitBackend(), {}, {CHUNK_UPLOADS: 1}, enabled=True)
+    client.app.dependency_overrides[get_admission_controller] = lambda: controller
+    add_chunks = MySQLRecordingRepository.add_chunks
+    failures = [OperationalError("INSERT", {}, Exception("database is locked"))]
+    
+    def flaky_add_chunks(self, *args, **kwargs):
+        if failures:
+            raise failures.pop()
+        return add_chunks(self, *args, **kwargs)
+    
+    monkeypatch.setattr(MySQLRecordingRepository, "add_chunks", flaky_add_chunks)
+    
+    with client.websocket_connect(stream_url(recording_id, users[0])) as ws:
+        ws.receive_json()
+        ws.send_bytes(b"lost")
+        error = ws.receive_json()
+        ws.send_bytes(b"again")
+        ack = ws.receive_json()
+    
+    assert error == {"type": "error", "chunk_index": 0, "detail": "Failed to store audio chunk"}
+    assert (ack["type"], ack["chunk_index"], ack["size_bytes"]) == ("ack", 0, 5)
+    assert controller.in_flight[CHUNK_UPLOADS] == 0
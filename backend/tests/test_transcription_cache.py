@@ -0,0 +1,118 @@
+import asyncio
+import io
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import update
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.models import Base
+from app.models.transcription_cache import TranscriptionCacheEntry
+from app.repositories.transcription_cache_repository import MySQLTranscriptionCacheRepository
+from app.services.transcription_cache import TranscriptionCache
+
+
+class ProviderV1:
+    name = "fake"
+    version = "v1"
+
+
+class ProviderV2:
+    name = "fake"
+    version = "v2"
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+def test_cache_counts_memory_and_persistent_hits(session_factory):
+    cache = TranscriptionCache(session_factory=session_factory, memory_entries=10, max_bytes=10000, enabled=True)
+    asyncio.run(cache.put(ProviderV1(), "abc", "hello"))
+    restarted = TranscriptionCache(session_factory=session_factory, memory_entries=10, max_bytes=10000, enabled=True)
+    
+    assert asyncio.run(cache.get(ProviderV1(), "abc")) == "hello"
+    assert asyncio.run(restarted.get(ProviderV1(), "abc")) == "hello"
+    assert asyncio.run(restarted.get(ProviderV1(), "abc")) == "hello"
+    assert asyncio.run(restarted.get(ProviderV2(), "abc")) is None
+    assert cache.stats()["memory_hits"] == 1
+    assert restarted.stats() == {"memory_hits": 1, "persistent_hits": 1, "misses": 1, "memory_entries": 1}
+
+
+def test_memory_tier_is_lru_bounded(session_factory):
+    cache = TranscriptionCache(session_factory=session_factory, memory_entries=2, max_bytes=10000, enabled=True)
+    for content_hash in ("a", "b", "c"):
+        asyncio.run(cache.put(ProviderV1(), content_hash, content_hash.upper()))
+    
+    assert cache.stats()["memory_entries"] == 2
+    assert asyncio.run(cache.get(ProviderV1(), "a")) == "A"
+    assert cache.stats()["persistent_hits"] == 1
+
+
+def test_persistent_tier_evicts_least_recently_used_by_size(session_factory):
+    cache = TranscriptionCache(session_factory=session_factory, memory_entries=0, max_bytes=25, enabled=True)
+    asyncio.run(cache.put(ProviderV1(), "old", "x" * 10))
+    asyncio.run(cache.put(ProviderV1(), "new", "y" * 10))
+    asyncio.run(cache.put(ProviderV1(), "newest", "z" * 10))
+    
+    db = session_factory()
+    repo = MySQLTranscriptionCacheRepository(db)
+    assert repo.total_size() == 20
+    assert repo.get_entry(cache.make_key(ProviderV1(), "old")) is None
+    db.close()
+
+
+def test_replacing_an_entry_counts_only_the_size_difference(session_factory):
+    cache = TranscriptionCache(session_factory=session_factory, memory_entries=0, max_bytes=100, enabled=True)
+    asyncio.run(cache.put(ProviderV1(), "a", "x" * 10))
+    asyncio.run(cache.put(ProviderV1(), "a", "y" * 15))
+    asyncio.run(cache.put(ProviderV1(), "a", "z" * 12))
+    
+    assert cache._size == 12
+    assert asyncio.run(cache.get(ProviderV1(), "a")) == "z" * 12
+
+
+def test_access_times_are_written_in_batches(session_factory):
+    cache = TranscriptionCache(session_factory=session_factory, memory_entries=0, max_bytes=10000, enabled=True, touch_interval=3600)
+    asyncio.run(cache.put(ProviderV1(), "abc", "hello"))
+    key = cache.make_key(ProviderV1(), "abc")
+    stale = datetime.utcnow() - timedelta(days=1)
+    db = session_factory()
+    db.execute(update(TranscriptionCacheEntry).values(last_accessed_at=stale))
+    db.commit()
+    
+    asyncio.run(cache.get(ProviderV1(), "abc"))
+    before_flush = db.get(TranscriptionCacheEntry, key).last_accessed_at
+    cache.touch_interval = 0
+    asyncio.run(cache.get(ProviderV1(), "missing"))
+    db.expire_all()
+    after_flush = db.get(TranscriptionCacheEntry, key).last_accessed_at
+    db.close()
+    
+    assert before_flush == stale
+    assert after_flush > stale
+
+
+def test_transcribe_calls_provider_once_per_content(session_factory):
+    calls = []
+    
+    class Provider(ProviderV1):
+        def transcribe_stream(self, stream, filename):
+            calls.append(filename)
+            return stream.read().decode()
+    
+    cache = TranscriptionCache(session_factory=session_factory, memory_entries=10, max_bytes=10000, enabled=True)
+    first = asyncio.run(cache.transcribe(Provider(), io.BytesIO(b"hello"), "a.webm"))
+    second = asyncio.run(cache.transcribe(Provider(), io.BytesIO(b"hello"), "b.webm"))
+    known = asyncio.run(cache.transcribe(Provider(), io.BytesIO(b"other"), "c.webm", content_hash="precomputed"))
+    
+    assert (first, second, known) == ("hello", "hello", "other")
+    assert calls == ["a.webm", "c.webm"]
+    assert asyncio.run(cache.get(ProviderV1(), "precomputed")) == "other"
@@ -0,0 +1,212 @@
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import update
+from app.models.recording import RecordingStatus
+from app.models.transcription_job import TranscriptionJob, TranscriptionJobStatus
+from app.repositories.recording_repository import MySQLRecordingRepository
+from app.repositories.transcription_job_repository import MySQLTranscriptionJobRepository
+from app.services.transcription_cache import TranscriptionCache
+from app.services.transcription_queue import TranscriptionQueue
+
+
+class FakeProvider:
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.calls = 0
+    
+    def transcribe_stream(self, stream, filename: str) -> str:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError("provider unavailable")
+        return f"transcript of {stream.read().decode()}"
+
+
+def make_queue(session_factory, audio_service, provider, **kwargs):
+    return TranscriptionQueue(
+        session_factory=session_factory,
+        provider_factory=lambda: provider,
+        audio_service_factory=lambda: audio_service,
+        cache=TranscriptionCache(session_factory=session_factory),
+        **kwargs
+    )
+
+
+def create_job(session_factory, recording_id, max_attempts=3):
+    db = session_factory()
+    job = MySQLTranscriptionJobRepository(db).create_job(recording_id, "/path/to/full_audio.webm", max_attempts)
+    db.close()
+    return job.id
+
+
+async def wait_for_terminal_status(session_factory, job_id):
+    for _ in range(200):
+        db = session_factory()
+        job = MySQLTranscriptionJobRepository(db).get_job(job_id)
+        db.close()
+        if job.status in (TranscriptionJobStatus.done, TranscriptionJobStatus.failed):
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+def test_claim_job_only_succeeds_once(session_factory, recording_id):
+    job_id = create_job(session_factory, recording_id)
+    db = session_factory()
+    repo = MySQLTranscriptionJobRepository(db)
+    
+    claimed = repo.claim_job(job_id)
+    
+    assert claimed.status == TranscriptionJobStatus.running
+    assert claimed.attempts == 1
+    assert repo.claim_job(job_id) is None
+
+
+
+def test_only_jobs_with_expired_leases_are_requeued(session_factory, recording_id):
+    stale, live = create_job(session_factory, recording_id), create_job(session_factory, recording_id)
+    db = session_factory()
+    repo = MySQLTranscriptionJobRepository(db)
+    repo.claim_job(stale)
+    repo.claim_job(live)
+    db.execute(update(TranscriptionJob).where(TranscriptionJob.id.in_([stale, live])).values(updated_at=datetime.utcnow() - timedelta(minutes=30)))
+    db.commit()
+    
+    assert repo.heartbeat(live)
+    assert repo.requeue_stale_jobs(timedelta(minutes=15)) == [stale]
+    assert repo.get_job(stale).status == TranscriptionJobStatus.queued
+    assert repo.get_job(live).status == TranscriptionJobStatus.running
+    db.close()
+
+
+@pytest.mark.asyncio
+async def test_job_for_deleted_recording_fails(session_factory, audio_service):
+    provider = FakeProvider()
+    queue = make_queue(session_factory, audio_service, provider)
+    await queue.start()
+    
+    job_id = create_job(session_factory, "deleted-recording")
+    queue.enqueue(job_id)
+    job = await wait_for_terminal_status(session_factory, job_id)
+    await queue.stop()
+    
+    assert job.status == TranscriptionJobStatus.failed
+    assert job.error == "Recording not found"
+    assert provider.calls == 0
+
+@pytest.mark.asyncio
+async def test_queue_completes_job_and_ends_recording(session_factory, audio_service, recording_id, tmp_path):
+    provider = FakeProvider()
+    queue = make_queue(session_factory, audio_service, provider, concurrency=2)
+    await queue.start()
+    
+    job_id = create_job(session_factory, recording_id)
+    queue.enqueue(job_id)
+    job = await wait_for_terminal_status(session_factory, job_id)
+    for _ in range(200):
+        if [p.name for p in (tmp_path / recording_id).iterdir()] == ["full_audio.webm"]:
+            break
+        await asyncio.sleep(0.01)
+    await queue.stop()
+    
+    db = session_factory()
+    recording = MySQLRecordingRepository(db).get_recording(recording_id)
+    assert job.status == TranscriptionJobStatus.done
+    assert recording.status == RecordingStatus.ended
+    assert recording.transcription_text == "transcript of hello world"
+    with open(recording.audio_file_path, "rb") as f:
+        assert f.read() == b"hello world"
+    assert [p.name for p in (tmp_path / recording_id).iterdir()] == ["full_audio.webm"]
+
+
+@pytest.mark.asyncio
+async def test_queue_retries_then_fails(session_factory, audio_service, recording_id):
+    provider = FakeProvider(failures=5)
+    queue = make_queue(session_factory, audio_service, provider, retry_delay=0)
+    await queue.start()
+    
+    job_id = create_job(session_factory, recording_id, max_attempts=2)
+    queue.enqueue(job_id)
+    job = await wait_for_terminal_status(session_factory, job_id)
+    await queue.stop()
+    
+    assert job.status == TranscriptionJobStatus.failed
+    assert job.attempts == 2
+    assert job.error == "provider unavailable"
+    assert provider.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_queue_retries_and_fails_jobs_when_assembly_fails(session_factory, audio_service, recording_id, monkeypatch):
+    def broken_assembly(recording_id, chunk_paths):
+        raise OSError("disk full")
+    
+    monkeypatch.setattr(audio_service, "assemble_chunks", broken_assembly)
+    queue = make_queue(session_factory, audio_service, FakeProvider(), retry_delay=0)
+    await queue.start()
+    
+    job_id = create_job(session_factory, recording_id, max_attempts=2)
+    queue.enqueue(job_id)
+    job = await wait_for_terminal_status(session_factory, job_id)
+    await queue.stop()
+    
+    assert job.status == TranscriptionJobStatus.failed
+    assert job.attempts == 2
+    assert job.error == "disk full"
+
+
+@pytest.mark.asyncio
+async def test_queue_periodically_requeues_jobs_with_expired_leases(session_factory, audio_service, recording_id):
+    queue = make_queue(session_factory, audio_service, FakeProvider(), recovery_interval=0.01)
+    await queue.start()
+    
+    job_id = create_job(session_factory, recording_id)
+    db = session_factory()
+    MySQLTranscriptionJobRepository(db).claim_job(job_id)
+    db.execute(update(TranscriptionJob).where(TranscriptionJob.id == job_id).values(updated_at=datetime.utcnow() - timedelta(hours=1)))
+    db.commit()
+    db.close()
+    job = await wait_for_terminal_status(session_factory, job_id)
+    await queue.stop()
+    
+    assert job.status == TranscriptionJobStatus.done
+    assert job.attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_queue_recovers_queued_jobs_on_start(session_factory, audio_service, recording_id):
+    job_id = create_job(session_factory, recording_id)
+    queue = make_queue(session_factory, audio_service, FakeProvider())
+    
+    await queue.start()
+    job = await wait_for_terminal_status(session_factory, job_id)
+    await queue.stop()
+    
+    assert job.status == TranscriptionJobStatus.done
+
+
+@pytest.mark.asyncio
+async def test_queue_reuses_cached_transcription_for_identical_audio(session_factory, audio_service, recording_id):
+    provider = FakeProvider()
+    queue = make_queue(session_factory, audio_service, provider)
+    await queue.start()
+    
+    first_job = create_job(session_factory, recording_id)
+    queue.enqueue(first_job)
+    await wait_for_terminal_status(session_factory, first_job)
+    
+    db = session_factory()
+    repo = MySQLRecordingRepository(db)
+    duplicate = repo.create_recording(repo.get_recording(recording_id).user_id)
+    duplicate_id = duplicate.id
+    repo.add_chunk(duplicate_id, audio_service.save_chunk(duplicate_id, 0, b"hello world"), 0, None)
+    db.close()
+    
+    second_job = create_job(session_factory, duplicate_id)
+    queue.enqueue(second_job)
+    job = await wait_for_terminal_status(session_factory, second_job)
+    await queue.stop()
+    
+    assert job.status == TranscriptionJobStatus.done
+    assert provider.calls == 1
+    assert queue.cache.stats()["memory_hits"] == 1
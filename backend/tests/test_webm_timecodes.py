@@ -0,0 +1,109 @@
+from app.core.config import settings
+from app.models.recording import Recording
+from app.repositories.chunk_upsert import ChunkUpload
+from app.repositories.recording_repository import MySQLRecordingRepository
+from app.services.webm_timecodes import WebMTimecodeParser, parse_timeline
+
+UNKNOWN_SIZE = b"\x01\xff\xff\xff\xff\xff\xff\xff"
+
+
+def vint(value: int) -> bytes:
+    length = 1
+    while value >= (1 << (7 * length)) - 1:
+        length += 1
+    return ((1 << (7 * length)) | value).to_bytes(length, "big")
+
+
+def element(element_id: int, payload: bytes) -> bytes:
+    return element_id.to_bytes((element_id.bit_length() + 7) // 8, "big") + vint(len(payload)) + payload
+
+
+def cluster(timecode: int, offsets) -> bytes:
+    blocks = b"".join(
+        element(0xA3, b"\x81" + offset.to_bytes(2, "big", signed=True) + b"\x80" + b"\xa3\x1f\x43\xb6\x75" * 8)
+        for offset in offsets
+    )
+    return b"\x1f\x43\xb6\x75" + UNKNOWN_SIZE + element(0xE7, timecode.to_bytes(4, "big")) + blocks
+
+
+def first_chunk(*clusters: bytes, timecode_scale: int = 1_000_000) -> bytes:
+    header = element(0x1A45DFA3, element(0x4282, b"webm"))
+    info = element(0x1549A966, element(0x2AD7B1, timecode_scale.to_bytes(4, "big")) + element(0x4489, b"\x00" * 8))
+    return header + b"\x18\x53\x80\x67" + UNKNOWN_SIZE + info + element(0x1654AE6B, b"\x00" * 40) + b"".join(clusters)
+
+
+def frames(start_ms: int, end_ms: int):
+    return range(start_ms, end_ms, 20)
+
+
+def test_parses_cluster_timecodes_from_first_chunk():
+    timeline = parse_timeline(first_chunk(cluster(0, frames(0, 5000)), cluster(5000, frames(0, 5000))))
+    assert (timeline.start_ms, timeline.end_ms, timeline.blocks) == (0, 10000, 500)
+    assert timeline.duration_seconds == 10.0
+
+
+def test_incremental_feed_matches_whole_buffer():
+    data = first_chunk(cluster(0, frames(0, 2000)), cluster(2000, frames(0, 1000)))
+    parser = WebMTimecodeParser()
+    for offset in range(0, len(data), 5):
+        parser.feed(memoryview(data)[offset:offset + 5])
+    assert parser.timeline() == parse_timeline(data)
+
+
+def test_resyncs_on_cluster_when_chunk_starts_mid_element():
+    data = b"\x00\x12tail of previous block" + cluster(10000, frames(0, 3000)) + cluster(13000, frames(0, 40))
+    timeline = parse_timeline(data)
+    assert (timeline.start_ms, timeline.end_ms) == (10000, 13040)
+
+
+def test_applies_timecode_scale():
+    timeline = parse_timeline(first_chunk(cluster(0, frames(0, 1000)), timecode_scale=500_000))
+    assert (timeline.start_ms, timeline.end_ms) == (0, 500)
+
+
+def test_returns_empty_timeline_without_timecodes():
+    timeline = parse_timeline(b"not webm at all" * 100)
+    assert timeline.start_ms is None
+    assert timeline.duration_seconds is None
+
+
+def test_recording_totals_flag_gaps_overlaps_and_missing_timecodes(session_factory, user_id):
+    db = session_factory()
+    repo = MySQLRecordingRepository(db)
+    recording_id = repo.create_recording(user_id).id
+    spans = {0: (0, 10000), 1: (10000, 20000), 3: (30000, 40000), 4: (42000, 50000), 5: (49000, 60000), 6: (None, None)}
+    for index in (5, 0, 3, 1, 4, 6):
+        start, end = spans[index]
+        repo.add_chunks(recording_id, [ChunkUpload(
+            index=index,
+            path=f"/chunk_{index}",
+            duration=(end - start) / 1000 if start is not None else None,
+            size_bytes=1000,
+            start_ms=start,
+            end_ms=end
+        )])
+    
+    gaps = {chunk.chunk_index: chunk.timecode_gap_ms for chunk in repo.list_chunks(recording_id)}
+    recording = db.get(Recording, recording_id)
+    db.refresh(recording)
+    assert gaps == {0: None, 1: 0, 3: None, 4: 2000, 5: -1000, 6: None}
+    assert recording.duration_seconds == 49.0
+    assert recording.size_bytes == 6000
+    assert (recording.timecode_gaps, recording.timecode_overlaps, recording.chunks_missing_timecodes) == (1, 1, 1)
+    db.close()
+
+
+def test_upload_stores_chunk_duration_and_recording_totals(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "AUDIO_STORAGE_PATH", str(tmp_path))
+    recording_id = client.post("/recordings").json()["id"]
+    chunks = [first_chunk(cluster(0, frames(0, 10000))), cluster(10000, frames(0, 10000))]
+    
+    responses = [
+        client.post(f"/recordings/{recording_id}/chunks", data={"chunk_index": index}, files={"audio_chunk": ("chunk.webm", data)})
+        for index, data in enumerate(chunks)
+    ]
+    
+    assert [response.json()["duration_seconds"] for response in responses] == [10.0, 10.0]
+    recording = client.get(f"/recordings/{recording_id}").json()
+    assert recording["duration_seconds"] == 20.0
+    assert recording["size_bytes"] == sum(map(len, chunks))
@@ -72,8 +72,13 @@ const Dashboard = () => {
   };
 
   const handleSelectRecording = async (recording) => {
-    setSelectedRecording(recording);
-    setNotes(recording.notes || '');
+    try {
+      const fullRecording = await recordingService.getRecording(recording.id);
+      setSelectedRecording(fullRecording);
+      setNotes(fullRecording.notes || '');
+    } catch (error) {
+      message.error('Failed to load recording');
+    }
   };
 
   const handleSaveNotes = async () => {
@@ -9,14 +9,27 @@ const api = axios.create({
   },
 });
 
+let lastWrite = null;
+
 api.interceptors.request.use((config) => {
   const token = localStorage.getItem('token');
   if (token) {
     config.headers.Authorization = `Bearer ${token}`;
   }
+  if (lastWrite) {
+    config.headers['X-Last-Write'] = lastWrite;
+  }
   return config;
 });
 
+api.interceptors.response.use((response) => {
+  const written = response.headers['x-last-write'];
+  if (written) {
+    lastWrite = written;
+  }
+  return response;
+});
+
 export const authService = {
   getLoginUrl: () => `${API_URL}/auth/google/login`,
   